@@ -0,0 +1,38 @@
+"""
+Programmatic entry points for CLI operations.
+
+Scripts that drive the engine in a loop can call these instead of
+invoking the CLI once per action: they skip argparse entirely and share
+the CLI's process-wide StateStore, gateway and prompt registry caches.
+"""
+
+from src.cli.main import _get_gateway, _get_initialized_store, _get_prompt_registry
+
+
+def run_turn(
+    db_path: str,
+    campaign_id: str,
+    player_input: str,
+    api_key: str,
+    prompt_versions: dict | None = None,
+    llm_gateway=None,
+) -> dict:
+    """Run one turn against a campaign and return the turn result dict.
+
+    llm_gateway defaults to the cached ClaudeGateway for api_key; pass a
+    MockGateway (or any LLMGateway) to run turns without the API.
+
+    Raises:
+        ValueError: If the campaign does not exist in the database.
+    """
+    from src.core.orchestrator import run_turn as orchestrator_run_turn
+
+    store = _get_initialized_store(str(db_path))
+    if not store.get_campaign(campaign_id):
+        raise ValueError(f"Campaign '{campaign_id}' not found")
+
+    return orchestrator_run_turn(
+        store, campaign_id, player_input, prompt_versions,
+        llm_gateway=llm_gateway or _get_gateway(api_key),
+        prompt_registry=_get_prompt_registry(),
+    )
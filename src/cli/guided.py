@@ -8,6 +8,7 @@ through setup → play without requiring subcommands.
 import argparse
 import sys
 
+from src.cli.prompting import read_line
 from src.config import get_api_key, interactive_login
 from src.db.state_store import StateStore
 from src.setup import ScenarioLoader
@@ -15,14 +16,26 @@ from src.setup import ScenarioLoader
 
 VERSION = "0.1.0"
 
+_BORDER = "─" * 58
+
+# Fully composed at import time; VERSION is a constant.
+_BANNER = "\n".join([
+    "",
+    "┌" + _BORDER + "┐",
+    "│" + f" Freeform RPG Engine v{VERSION} ".center(58) + "│",
+    "│" + " AI-driven narrative with real consequences ".center(58) + "│",
+    "└" + _BORDER + "┘",
+    "",
+]) + "\n"
+
+
+def _write_block(lines: list[str]) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def _print_banner():
-    print()
-    print("┌" + "─" * 58 + "┐")
-    print("│" + f" Freeform RPG Engine v{VERSION} ".center(58) + "│")
-    print("│" + " AI-driven narrative with real consequences ".center(58) + "│")
-    print("└" + "─" * 58 + "┘")
-    print()
+    sys.stdout.write(_BANNER)
 
 
 def _ensure_api_key() -> str | None:
@@ -34,7 +47,7 @@ def _ensure_api_key() -> str | None:
     print("  No API key found.")
     print()
     try:
-        response = input("  Would you like to set one up now? [Y/n] ").strip().lower()
+        response = read_line("  Would you like to set one up now? [Y/n] ").strip().lower()
     except (EOFError, KeyboardInterrupt):
         print()
         return None
@@ -46,31 +59,35 @@ def _ensure_api_key() -> str | None:
     return None
 
 
-def _introduce_character(store: StateStore) -> None:
-    """Show the player character and let the user rename them."""
-    pcs = store.get_entities_by_type("pc")
-    if not pcs:
-        return
+def _introduce_character(store: StateStore, pc: dict | None = None) -> None:
+    """Show the player character and let the user rename them.
+
+    ``pc`` is the entity the scenario loader just created; when omitted
+    the first PC is looked up in the store.
+    """
+    if pc is None:
+        pcs = store.get_entities_by_type("pc")
+        if not pcs:
+            return
+        pc = pcs[0]
 
-    pc = pcs[0]
     attrs = pc.get("attrs", {})
 
-    print("  ── Your Character ──")
-    print()
-    print(f"    Name: {pc['name']}")
+    lines = ["  ── Your Character ──", "", f"    Name: {pc['name']}"]
     if attrs.get("background"):
-        print(f"    Background: {attrs['background']}")
+        lines.append(f"    Background: {attrs['background']}")
     if attrs.get("skills"):
         skills = attrs["skills"]
         if isinstance(skills, list):
             skills = ", ".join(skills)
-        print(f"    Skills: {skills}")
+        lines.append(f"    Skills: {skills}")
     if attrs.get("weakness"):
-        print(f"    Weakness: {attrs['weakness']}")
-    print()
+        lines.append(f"    Weakness: {attrs['weakness']}")
+    lines.append("")
+    _write_block(lines)
 
     try:
-        new_name = input(f"  Enter a name (or press Enter to keep \"{pc['name']}\"): ").strip()
+        new_name = read_line(f"  Enter a name (or press Enter to keep \"{pc['name']}\"): ").strip()
     except (EOFError, KeyboardInterrupt):
         print()
         return
@@ -91,19 +108,19 @@ def _pick_scenario(store: StateStore) -> dict | None:
         print("  Add a .yaml scenario file and try again.")
         return None
 
-    print("  Available scenarios:")
-    print()
+    lines = ["  Available scenarios:", ""]
     for i, s in enumerate(scenarios, 1):
-        print(f"    {i}. {s['name']}")
+        lines.append(f"    {i}. {s['name']}")
         if s.get("description"):
             desc = s["description"]
             if len(desc) > 70:
                 desc = desc[:67] + "..."
-            print(f"       {desc}")
-    print()
+            lines.append(f"       {desc}")
+    lines.append("")
+    _write_block(lines)
 
     try:
-        choice = input("  Pick a scenario [1]: ").strip()
+        choice = read_line("  Pick a scenario [1]: ").strip()
     except (EOFError, KeyboardInterrupt):
         print()
         return None
@@ -129,7 +146,7 @@ def _pick_scenario(store: StateStore) -> dict | None:
     result = loader.load_scenario(scenario["id"])
 
     # Character intro before showing opening text
-    _introduce_character(store)
+    _introduce_character(store, result.get("pc"))
 
     if result.get("opening_text"):
         print(f"  {result['opening_text']}")
@@ -140,18 +157,16 @@ def _pick_scenario(store: StateStore) -> dict | None:
 
 def _select_game(campaigns: list[dict], store: StateStore) -> str | None:
     """Show game selection menu. Returns campaign_id or None."""
-    print("  Saved games:")
-    print()
+    lines = ["  Saved games:", ""]
     for i, c in enumerate(campaigns, 1):
         turn_info = f"turn {c['current_turn']}" if c.get("current_turn") else "new"
-        print(f"    {i}. {c['name']}  ({turn_info})")
-    print()
+        lines.append(f"    {i}. {c['name']}  ({turn_info})")
     new_idx = len(campaigns) + 1
-    print(f"    {new_idx}. Start a new game")
-    print()
+    lines += ["", f"    {new_idx}. Start a new game", ""]
+    _write_block(lines)
 
     try:
-        choice = input("  Choose [1]: ").strip()
+        choice = read_line("  Choose [1]: ").strip()
     except (EOFError, KeyboardInterrupt):
         print()
         return None
@@ -190,9 +205,10 @@ def guided_flow(db_path: str = "game.db"):
         print("  Run 'freeform-rpg login' or set ANTHROPIC_API_KEY.")
         sys.exit(1)
 
+    from src.cli.main import _get_initialized_store
+
     # Step 2: Database (auto-create silently)
-    store = StateStore(db_path)
-    store.ensure_schema()
+    store = _get_initialized_store(db_path)
 
     # Step 3: Campaign selection
     campaigns = store.list_campaigns()
@@ -6,12 +6,14 @@ Walks the user through PDF selection, metadata, pipeline options,
 runs the pipeline with progress display, and offers pack installation.
 """
 
+import importlib.util
 import os
 import sys
 import time
 from pathlib import Path
 
 from src.config import check_auth_or_prompt
+from src.cli.prompting import read_line
 from src.cli.spinner import Spinner
 
 
@@ -19,10 +21,24 @@ from src.cli.spinner import Spinner
 # Helpers
 # ---------------------------------------------------------------------------
 
+_BORDER = "\u2500" * 58
+
+_YES = frozenset({"y", "yes"})
+
+_INGEST_BANNER = "\n".join([
+    "",
+    "\u250c" + _BORDER + "\u2510",
+    "\u2502" + " Content Pack Ingest Pipeline ".center(58) + "\u2502",
+    "\u2502" + " PDF-to-Content-Pack Converter ".center(58) + "\u2502",
+    "\u2514" + _BORDER + "\u2518",
+    "",
+]) + "\n"
+
+
 def _safe_input(prompt: str, default: str = "") -> str | None:
     """Prompt for input, returning None on interrupt."""
     try:
-        value = input(prompt).strip()
+        value = read_line(prompt).strip()
         return value if value else default
     except (EOFError, KeyboardInterrupt):
         print()
@@ -35,43 +51,47 @@ def _abort():
     sys.exit(0)
 
 
+# Single-pass translation tables for deriving pack defaults from a PDF stem
+_STEM_TO_NAME = str.maketrans({"_": " ", "-": " "})
+_STEM_TO_ID = str.maketrans({" ": "_", "-": "_"})
+
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3))
+
+
 def _format_file_size(path: Path) -> str:
     """Human-readable file size."""
     size = path.stat().st_size
-    if size < 1024:
+    # Each unit step is 2**10, so the bit length picks the unit directly
+    unit_idx = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if unit_idx == 0:
         return f"{size} B"
-    elif size < 1024 * 1024:
-        return f"{size / 1024:.1f} KB"
-    elif size < 1024 * 1024 * 1024:
-        return f"{size / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size / (1024 * 1024 * 1024):.1f} GB"
+    unit, divisor = _SIZE_UNITS[unit_idx]
+    return f"{size / divisor:.1f} {unit}"
+
+
+def _write_block(lines: list[str]) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_ingest_banner():
     """Print the ingest pipeline banner."""
-    print()
-    print("\u250c" + "\u2500" * 58 + "\u2510")
-    print("\u2502" + " Content Pack Ingest Pipeline ".center(58) + "\u2502")
-    print("\u2502" + " PDF-to-Content-Pack Converter ".center(58) + "\u2502")
-    print("\u2514" + "\u2500" * 58 + "\u2518")
-    print()
+    sys.stdout.write(_INGEST_BANNER)
 
 
 def _check_dependencies(use_ocr: bool = False):
-    """Check that required ingest dependencies are installed. Exits on failure."""
+    """Check that required ingest dependencies are installed. Exits on failure.
+
+    Uses find_spec so the (heavy) modules are located but not imported
+    until the pipeline actually runs.
+    """
     missing = []
 
-    try:
-        import fitz  # noqa: F401
-    except ImportError:
+    if importlib.util.find_spec("fitz") is None:
         missing.append("pymupdf")
 
-    if use_ocr:
-        try:
-            import pytesseract  # noqa: F401
-        except ImportError:
-            missing.append("pytesseract")
+    if use_ocr and importlib.util.find_spec("pytesseract") is None:
+        missing.append("pytesseract")
 
     if missing:
         names = ", ".join(missing)
@@ -91,7 +111,10 @@ def _confirm(prompt: str, default_yes: bool = True) -> bool | None:
         return None
     if not value:
         return default_yes
-    return value.lower() in ("y", "yes")
+    # Typical lowercase answers match without allocating a lowered copy
+    if value in _YES:
+        return True
+    return value.lower() in _YES
 
 
 # ---------------------------------------------------------------------------
@@ -111,8 +134,9 @@ def _prompt_pdf_path() -> Path | None:
             print("  Please enter a path to a PDF file.")
             continue
 
-        path = Path(value).expanduser().resolve()
-        if not path.exists():
+        # abspath is lexical; resolve() would stat every path component
+        path = Path(os.path.abspath(Path(value).expanduser()))
+        if not path.is_file():
             print(f"  File not found: {path}")
             continue
         if path.suffix.lower() != ".pdf":
@@ -130,9 +154,9 @@ def _prompt_pack_metadata(pdf_path: Path) -> dict | None:
     print("  \u2500\u2500 Pack Metadata \u2500\u2500")
     print()
 
-    stem = pdf_path.stem.replace("_", " ").replace("-", " ")
+    stem = pdf_path.stem.translate(_STEM_TO_NAME)
     # Derive a clean slug for pack ID
-    default_id = pdf_path.stem.lower().replace(" ", "_").replace("-", "_")
+    default_id = pdf_path.stem.lower().translate(_STEM_TO_ID)
 
     pack_id = _safe_input(f"  Pack ID [{default_id}]: ", default_id)
     if pack_id is None:
@@ -147,16 +171,16 @@ def _prompt_pack_metadata(pdf_path: Path) -> dict | None:
     if pack_version is None:
         return None
 
-    print()
-    print("  Pack layer:")
     layers = ["sourcebook", "supplement", "scenario"]
     descriptions = [
         "primary reference",
         "expands a sourcebook",
         "playable content",
     ]
-    for i, (layer, desc) in enumerate(zip(layers, descriptions), 1):
-        print(f"    {i}. {layer} ({desc})")
+    _write_block(["", "  Pack layer:"] + [
+        f"    {i}. {layer} ({desc})"
+        for i, (layer, desc) in enumerate(zip(layers, descriptions), 1)
+    ])
 
     choice = _safe_input("  Choose layer [1]: ", "1")
     if choice is None:
@@ -230,18 +254,20 @@ def _prompt_output_dir(pack_id: str) -> str | None:
 
 def _show_confirmation_summary(config: dict) -> bool | None:
     """Show pre-run summary and ask for confirmation."""
-    print("  \u2500\u2500 Summary \u2500\u2500")
-    print()
-    print(f"    PDF:         {config['pdf_name']}")
-    print(f"    Pack ID:     {config['pack_id']}")
-    print(f"    Pack Name:   {config['pack_name']}")
-    print(f"    Version:     {config['pack_version']}")
-    print(f"    Layer:       {config['pack_layer']}")
-    print(f"    OCR:         {'Yes' if config['use_ocr'] else 'No'}")
-    print(f"    Images:      {'Yes' if config['extract_images'] else 'No'}")
-    print(f"    Systems:     {'No' if config['skip_systems'] else 'Yes'}")
-    print(f"    Output:      {config['output_dir']}")
-    print()
+    _write_block([
+        "  \u2500\u2500 Summary \u2500\u2500",
+        "",
+        f"    PDF:         {config['pdf_name']}",
+        f"    Pack ID:     {config['pack_id']}",
+        f"    Pack Name:   {config['pack_name']}",
+        f"    Version:     {config['pack_version']}",
+        f"    Layer:       {config['pack_layer']}",
+        f"    OCR:         {'Yes' if config['use_ocr'] else 'No'}",
+        f"    Images:      {'Yes' if config['extract_images'] else 'No'}",
+        f"    Systems:     {'No' if config['skip_systems'] else 'Yes'}",
+        f"    Output:      {config['output_dir']}",
+        "",
+    ])
 
     return _confirm("Start pipeline?", default_yes=True)
 
@@ -273,8 +299,16 @@ def _stage_summary_line(name: str, elapsed_ms: float, result) -> str:
     elif name == "segment" and result is not None:
         detail = f" -- {len(result.segments)} segments created"
     elif name == "classify" and result is not None:
-        lore = sum(1 for s in result.segments if s.route and s.route.value == "lore")
-        systems = sum(1 for s in result.segments if s.route and s.route.value == "systems")
+        lore = systems = 0
+        for s in result.segments:
+            route = s.route
+            if route is None:
+                continue
+            value = route.value
+            if value == "lore":
+                lore += 1
+            elif value == "systems":
+                systems += 1
         detail = f" -- {lore} lore, {systems} systems"
     elif name == "enrich":
         if isinstance(result, tuple) and len(result) == 2:
@@ -304,6 +338,13 @@ class InstrumentedPipeline:
         self._total_stages = 7
         if not pipeline.config.skip_systems:
             self._total_stages = 8
+        # Stages always run in STAGE_LABELS order, so each stage's
+        # header and spinner text can be built once up front.
+        self._headers = {
+            name: (f"  Stage {i}/{self._total_stages}: {label}...", f"  {label}")
+            for i, (name, label) in enumerate(STAGE_LABELS.items(), 1)
+            if i <= self._total_stages
+        }
 
     def run(self, resume: bool = True, from_stage: str | None = None) -> dict:
         """Run with instrumented _run_stage."""
@@ -316,11 +357,14 @@ class InstrumentedPipeline:
     def _instrumented_run_stage(self, name, stage_dir, resume, fn, *args, **kwargs):
         """Wrap each stage with spinner and summary."""
         self._stage_index += 1
-        label = STAGE_LABELS.get(name, name.replace("_", " ").title())
-        header = f"  Stage {self._stage_index}/{self._total_stages}: {label}..."
+        headers = self._headers.get(name)
+        if headers is None:
+            label = name.replace("_", " ").title()
+            headers = (f"  Stage {self._stage_index}/{self._total_stages}: {label}...", f"  {label}")
+        header, spinner_text = headers
         print(header)
 
-        spinner = Spinner(f"  {label}")
+        spinner = Spinner(spinner_text)
         start = time.time()
         with spinner:
             # Give the pipeline a progress callback that updates the spinner
@@ -337,10 +381,9 @@ class InstrumentedPipeline:
 
 def _run_pipeline_with_progress(config: dict, api_key: str) -> dict:
     """Create gateways, build pipeline, run with progress display."""
+    from src.cli.main import _get_gateway, _get_prompt_registry
     from src.ingest.pipeline import IngestPipeline
     from src.ingest.models import IngestConfig
-    from src.llm.gateway import ClaudeGateway
-    from src.llm.prompt_registry import PromptRegistry
 
     ingest_config = IngestConfig(
         pdf_path=config["pdf_path"],
@@ -357,10 +400,10 @@ def _run_pipeline_with_progress(config: dict, api_key: str) -> dict:
         work_dir=config["output_dir"],
     )
 
-    sonnet = ClaudeGateway(api_key=api_key)
-    haiku = ClaudeGateway(api_key=api_key, model="claude-3-5-haiku-20241022")
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    registry = PromptRegistry(prompts_dir)
+    # Both gateways share one client (and HTTP connection pool)
+    sonnet = _get_gateway(api_key)
+    haiku = _get_gateway(api_key, "claude-3-5-haiku-20241022")
+    registry = _get_prompt_registry()
 
     pipeline = IngestPipeline(
         config=ingest_config,
@@ -373,29 +416,37 @@ def _run_pipeline_with_progress(config: dict, api_key: str) -> dict:
     return instrumented.run(resume=True)
 
 
+_FINAL_SUMMARY_TMPL = (
+    "  \u2500\u2500 Pipeline Complete \u2500\u2500\n"
+    "\n"
+    "    Pack directory: {pack_dir}\n"
+    "    Validation:     {validation}\n"
+    "{errors}"
+    "{systems_line}"
+    "{total_time_line}"
+    "\n"
+)
+
+
 def _show_final_summary(summary: dict):
     """Show pipeline completion summary."""
-    print("  \u2500\u2500 Pipeline Complete \u2500\u2500")
-    print()
-    print(f"    Pack directory: {summary.get('pack_dir', 'N/A')}")
-
-    valid = summary.get("pack_valid", False)
-    print(f"    Validation:     {'PASSED' if valid else 'FAILED'}")
     errors = summary.get("validation_errors", [])
-    if errors:
-        for err in errors[:5]:
-            print(f"      - {err}")
-
     systems = summary.get("systems_valid")
-    if systems is not None:
-        print(f"    Systems:        {'PASSED' if systems else 'FAILED'}")
-
     timings = summary.get("timings", {})
-    if timings:
-        total_ms = sum(timings.values())
-        print(f"    Total time:     {total_ms / 1000:.1f}s")
 
-    print()
+    sys.stdout.write(_FINAL_SUMMARY_TMPL.format_map({
+        "pack_dir": summary.get("pack_dir", "N/A"),
+        "validation": "PASSED" if summary.get("pack_valid", False) else "FAILED",
+        "errors": "".join(f"      - {err}\n" for err in errors[:5]),
+        "systems_line": (
+            f"    Systems:        {'PASSED' if systems else 'FAILED'}\n"
+            if systems is not None else ""
+        ),
+        "total_time_line": (
+            f"    Total time:     {sum(timings.values()) / 1000:.1f}s\n"
+            if timings else ""
+        ),
+    }))
 
 
 def _offer_install(pack_dir: str, db_path: str):
@@ -410,14 +461,14 @@ def _offer_install(pack_dir: str, db_path: str):
     from src.content.pack_loader import PackLoader
     from src.content.chunker import Chunker
     from src.content.indexer import LoreIndexer
-    from src.content.vector_store import create_vector_store
+    from src.content.vector_store import create_vector_store, vector_store_path
 
     store = StateStore(db_path)
     store.ensure_schema()
 
     loader = PackLoader()
     chunker = Chunker()
-    vector_store = create_vector_store()
+    vector_store = create_vector_store(vector_store_path(db_path))
     indexer = LoreIndexer(store, vector_store)
 
     pack_path = Path(pack_dir)
@@ -1,3 +1,4 @@
+# PYTHON_ARGCOMPLETE_OK
 """
 Freeform RPG Engine CLI.
 
@@ -27,7 +28,9 @@ Ingest Commands:
 """
 
 import argparse
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -35,32 +38,137 @@ from src.config import (
     get_api_key, interactive_login, check_auth_or_prompt,
     clear_api_key, get_config_path
 )
-from src.core.orchestrator import Orchestrator, run_turn
-from src.db.state_store import StateStore
-from src.llm.gateway import MockGateway, ClaudeGateway
-from src.llm.prompt_registry import PromptRegistry
-from src.setup import SetupPipeline, ScenarioLoader, load_template, list_templates
-from src.eval.replay import format_replay_report, rerun_turns
-from src.content.pack_loader import PackLoader
-from src.content.chunker import Chunker
-from src.content.indexer import LoreIndexer
-from src.content.retriever import LoreRetriever
-from src.content.scene_cache import SceneLoreCacheManager
-from src.content.session_manager import SessionManager
-from src.content.vector_store import create_vector_store
-from src.cli.vibe_check import vibe_check_cmd
+
+# Engine, LLM, content, setup and database modules are imported inside the
+# functions that use them, so short commands (init-db, show-event,
+# list-packs, --help) don't pay for jsonschema/anthropic/YAML/sqlite
+# imports. (A module __getattr__ wouldn't help here: it is only consulted
+# for attribute access from outside, not for this module's own globals.)
+
+
+_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_store(db_path: str):
+    """Return the process-wide StateStore for a database path.
+
+    Commands that hand off to each other in one process (the guided flow
+    launching play, for example) share a single store.
+    """
+    from src.db.state_store import StateStore
+
+    return StateStore(db_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_initialized_store(db_path: str):
+    """Return the shared StateStore for a database path, with its schema applied.
+
+    ensure_schema() runs once per path per process rather than once per
+    command that needs the tables.
+    """
+    store = _get_store(db_path)
+    store.ensure_schema()
+    return store
+
+
+@functools.lru_cache(maxsize=8)
+def _get_tracker(store):
+    """Return the process-wide EvaluationTracker for a store.
+
+    Constructing a tracker re-runs its CREATE TABLE IF NOT EXISTS checks,
+    so REPL feedback and eval summaries share one per store.
+    """
+    from src.eval import EvaluationTracker
+
+    return EvaluationTracker(store)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_prompt_registry(prompts_dir: Path = _PROMPTS_DIR):
+    """Return the process-wide PromptRegistry for a prompts directory."""
+    from src.llm.prompt_registry import PromptRegistry
+
+    registry = PromptRegistry(prompts_dir)
+    registry.preload()
+    return registry
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gateway(api_key: str, model: str | None = None):
+    """Return the process-wide ClaudeGateway for an API key and model.
+
+    Gateways for non-default models reuse the default gateway's client,
+    so every model shares one HTTP connection pool.
+    """
+    from src.llm.gateway import ClaudeGateway
+
+    if model is None:
+        return ClaudeGateway(api_key=api_key)
+    return ClaudeGateway(api_key=api_key, model=model, client=_get_gateway(api_key).client)
+
+
+@functools.cache
+def _orjson():
+    """The orjson module if it is installed, else None; imported on first use."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_loads(value):
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _json_dumps_pretty(value) -> str:
+    """Serialize to two-space-indented JSON, leaving non-ASCII text as-is."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(
+            value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _write_json_pretty(value) -> None:
+    """Write value as pretty JSON plus a newline to stdout without an interim str.
+
+    orjson's bytes go straight to the binary buffer; the stdlib fallback
+    streams through json.dump.
+    """
+    orjson = _orjson()
+    if orjson is None:
+        json.dump(value, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    data = orjson.dumps(
+        value,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()  # Keep earlier text output ahead of the raw bytes
+    buffer.write(data)
+    buffer.flush()
 
 
 def _load_json(value):
     if value is None:
         return None
-    return json.loads(value)
+    return _json_loads(value)
 
 
 def init_db(args):
     """Initialize the database schema."""
-    store = StateStore(args.db)
-    store.ensure_schema()
+    _get_initialized_store(args.db)
     print(f"Initialized database at {args.db}")
 
 
@@ -78,8 +186,9 @@ def logout_cmd(args):
 
 def new_game(args):
     """Start a new game with Session Zero setup."""
-    store = StateStore(args.db)
-    store.ensure_schema()
+    from src.setup import SetupPipeline, ScenarioLoader
+
+    store = _get_initialized_store(args.db)
 
     # Try setup pipeline first (for templates), fall back to scenario loader
     if args.scenario:
@@ -132,8 +241,9 @@ def new_game(args):
 
 def run_turn_cmd(args):
     """Execute a single turn."""
-    store = StateStore(args.db)
-    store.ensure_schema()
+    from src.cli import api
+
+    store = _get_initialized_store(args.db)
 
     # Check campaign exists
     campaign = store.get_campaign(args.campaign)
@@ -149,25 +259,29 @@ def run_turn_cmd(args):
         print("  Run 'login' to set one up, or set ANTHROPIC_API_KEY environment variable.")
         sys.exit(1)
 
-    # Setup LLM gateway
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    prompt_registry = PromptRegistry(prompts_dir)
-    gateway = ClaudeGateway(api_key=api_key)
-
     prompt_versions = _load_json(args.prompt_versions)
-    result = run_turn(
-        store, args.campaign, args.input, prompt_versions,
-        llm_gateway=gateway, prompt_registry=prompt_registry
+    result = api.run_turn(
+        args.db, args.campaign, args.input, api_key, prompt_versions
     )
 
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(_json_dumps_pretty(result))
     else:
         print(f"\n{result['final_text']}\n")
         if result.get('clarification_needed'):
             print(f"[Clarification needed: {result.get('clarification_question', '')}]")
 
 
+_ROLL_OUTCOME_LABELS = {
+    "success": "Success",
+    "critical": "Critical!",
+    "mixed": "Mixed",
+    "failure": "Failure",
+}
+
+_DEBUG_TIMING_STAGES = ("interpreter", "planner", "narrator")
+
+
 def _format_clock_deltas(clock_deltas: list) -> str:
     """Format clock deltas as an inline display line.
 
@@ -176,16 +290,11 @@ def _format_clock_deltas(clock_deltas: list) -> str:
     """
     if not clock_deltas:
         return ""
-    consequence_deltas = [d for d in clock_deltas if d.get("consequence", False)]
-    if not consequence_deltas:
-        return ""
-    parts = []
-    for delta in consequence_deltas:
-        name = delta.get("name", delta.get("id", "?"))
-        old = delta["old"]
-        new = delta["new"]
-        parts.append(f"[{name}: {old} \u2192 {new}]")
-    return "  ".join(parts)
+    return "  ".join(
+        f"[{d.get('name', d.get('id', '?'))}: {d['old']} \u2192 {d['new']}]"
+        for d in clock_deltas
+        if d.get("consequence", False)
+    )
 
 
 def _format_rolls(debug_info: dict) -> str:
@@ -197,22 +306,20 @@ def _format_rolls(debug_info: dict) -> str:
     if not rolls:
         return ""
 
-    parts = []
-    for roll in rolls:
-        dice = roll.get("dice", "2d6")
-        total = roll.get("total", "?")
-        outcome = roll.get("outcome", "?")
-        action = roll.get("action", "")
-        label = {"success": "Success", "critical": "Critical!", "mixed": "Mixed", "failure": "Failure"}.get(outcome, outcome)
-        prefix = f"{action.capitalize()} " if action else ""
-        parts.append(f"[{prefix}{dice}: {total} — {label}]")
-    return "  ".join(parts)
+    return "  ".join(_format_roll(roll) for roll in rolls)
+
+
+def _format_roll(roll: dict) -> str:
+    outcome = roll.get("outcome", "?")
+    label = _ROLL_OUTCOME_LABELS.get(outcome, outcome)
+    action = roll.get("action", "")
+    prefix = f"{action.capitalize()} " if action else ""
+    return f"[{prefix}{roll.get('dice', '2d6')}: {roll.get('total', '?')} — {label}]"
 
 
 def _format_debug_panel(debug_info: dict) -> str:
     """Format debug info as a readable panel."""
-    lines = []
-    lines.append("─── debug ───")
+    lines = ["─── debug ───"]
 
     timings = debug_info.get("timings", {})
     total = debug_info.get("total_ms", 0)
@@ -240,33 +347,78 @@ def _format_debug_panel(debug_info: dict) -> str:
         lines.append(f"  resolver: {', '.join(event_types)}")
 
     # Show dice rolls from resolver
-    rolls = resolver.get("rolls", [])
-    for roll in rolls:
-        dice = roll.get("dice", "2d6")
-        raw = roll.get("raw_values", [])
-        total = roll.get("total", "?")
-        outcome = roll.get("outcome", "?")
-        margin = roll.get("margin", 0)
-        action = roll.get("action", "?")
-        lines.append(f"    roll [{action}]: {dice}={raw} total={total} → {outcome} (margin={margin})")
+    lines.extend(
+        f"    roll [{roll.get('action', '?')}]: {roll.get('dice', '2d6')}={roll.get('raw_values', [])}"
+        f" total={roll.get('total', '?')} → {roll.get('outcome', '?')} (margin={roll.get('margin', 0)})"
+        for roll in resolver.get("rolls", [])
+    )
 
     # Timing
-    stage_parts = []
-    for key in ["interpreter_ms", "planner_ms", "narrator_ms"]:
-        if key in timings:
-            label = key.replace("_ms", "")
-            stage_parts.append(f"{label}={timings[key]}ms")
-    lines.append(f"  timing: {', '.join(stage_parts)}  (total {total}ms)")
+    stage_parts = ", ".join(
+        f"{stage}={timings[stage + '_ms']}ms"
+        for stage in _DEBUG_TIMING_STAGES
+        if stage + "_ms" in timings
+    )
+    lines.append(f"  timing: {stage_parts}  (total {total}ms)")
     lines.append("─────────────")
     return "\n".join(lines)
 
 
+def _format_turn_output(result, streamed_text: str, debug_mode: bool) -> str:
+    """Everything the REPL shows after a turn, as one string for a single write.
+
+    streamed_text is the narration already written while it streamed; the
+    final text is only repeated if the stream didn't deliver all of it.
+    """
+    out = []
+    if streamed_text and streamed_text == result.final_text:
+        out.append("\n\n")
+    else:
+        if streamed_text:
+            out.append("\n")  # Narration fell back mid-stream; show the final text in full
+        out.append(f"\n{result.final_text}\n\n")
+
+    # Show location header on scene transition
+    narrator_data = result.debug_info.get("narrator", {})
+    scene_transition = narrator_data.get("scene_transition")
+    if scene_transition:
+        out.append(f"[Location: {scene_transition.get('location_name', 'Unknown')}]\n")
+        loc_desc = scene_transition.get("description", "")
+        if loc_desc:
+            out.append(f"{loc_desc}\n")
+        out.append("\n")
+
+    # Show clock deltas and dice rolls (always visible when they happen)
+    clocks_line = _format_clock_deltas(result.clock_deltas)
+    if clocks_line:
+        out.append(f"  {clocks_line}\n")
+    rolls_line = _format_rolls(result.debug_info)
+    if rolls_line:
+        out.append(f"  {rolls_line}\n")
+
+    # Extra blank line after status indicators
+    if clocks_line or rolls_line:
+        out.append("\n")
+
+    if result.clarification_needed:
+        out.append(f"[{result.clarification_question}]\n")
+
+    if debug_mode and result.debug_info:
+        out.append(f"{_format_debug_panel(result.debug_info)}\n\n")
+
+    return "".join(out)
+
+
 def play_cmd(args):
     """Interactive play mode (REPL)."""
     from src.cli.spinner import Spinner
+    from src.content.retriever import LoreRetriever
+    from src.content.scene_cache import SceneLoreCacheManager
+    from src.content.session_manager import SessionManager
+    from src.content.vector_store import create_vector_store, vector_store_path
+    from src.core.orchestrator import Orchestrator
 
-    store = StateStore(args.db)
-    store.ensure_schema()
+    store = _get_initialized_store(args.db)
 
     # Check campaign exists
     campaign = store.get_campaign(args.campaign)
@@ -292,10 +444,22 @@ def play_cmd(args):
         if active_spinner[0]:
             active_spinner[0].update(stage_name)
 
+    # Narrator prose streamed so far this turn
+    streamed = []
+
+    def on_text(text: str):
+        if not streamed:
+            # First prose of the turn: swap the spinner for the narration
+            if active_spinner[0]:
+                active_spinner[0].stop()
+            sys.stdout.write("\n")
+        streamed.append(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
     # Setup orchestrator with real LLM
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    prompt_registry = PromptRegistry(prompts_dir)
-    gateway = ClaudeGateway(api_key=api_key)
+    prompt_registry = _get_prompt_registry()
+    gateway = _get_gateway(api_key)
 
     # Setup content pack components from campaign record
     lore_retriever = None
@@ -311,7 +475,7 @@ def play_cmd(args):
             pack_ids = [p["id"] for p in packs]
 
     if pack_ids:
-        vector_store = create_vector_store()
+        vector_store = create_vector_store(vector_store_path(args.db))
         lore_retriever = LoreRetriever(store, vector_store, entity_manifest=lore_manifest)
         scene_cache = SceneLoreCacheManager(store)
 
@@ -327,7 +491,8 @@ def play_cmd(args):
         lore_retriever=lore_retriever,
         scene_cache=scene_cache,
         session_manager=session_mgr,
-        pack_ids=pack_ids
+        pack_ids=pack_ids,
+        on_text=on_text
     )
 
     print(f"\n{'='*60}")
@@ -339,30 +504,32 @@ def play_cmd(args):
     print("Type your actions, or 'quit' to exit.")
     print("Commands: /status, /clocks, /scene, /debug, /help\n")
 
+    # Scene, clocks and threads for slash commands, re-read after each turn
+    snapshot = _ReplSnapshot(store)
+
     # Show any opening text from last event
-    events = store.get_events_range(args.campaign, 0, 1)
-    if not events:
+    last_event = store.get_last_event(args.campaign)
+    if not last_event:
         # First time - show scene
-        scene = store.get_scene()
-        if scene:
-            location = store.get_entity(scene.get("location_id"))
+        if snapshot.scene:
+            location = snapshot.location
             if location:
                 print(f"[Location: {location.get('name', 'Unknown')}]")
                 if location.get("attrs", {}).get("description"):
                     print(f"{location['attrs']['description']}\n")
     else:
         # Show last event text
-        last = events[-1]
-        print(f"{last.get('final_text', '')}\n")
+        print(f"{last_event.get('final_text', '')}\n")
 
     # REPL loop
-    turn_count = len(events)
-    last_turn_no = events[-1]["turn_no"] if events else None
+    turn_count = store.count_events(args.campaign) if last_event else 0
+    last_turn_no = last_event["turn_no"] if last_event else None
 
     while True:
         try:
             user_input = input("> ").strip()
         except (EOFError, KeyboardInterrupt):
+            _drain_io()
             if session_mgr and active_session:
                 session_mgr.end_session(active_session["id"])
             print("\nGoodbye!")
@@ -372,6 +539,7 @@ def play_cmd(args):
             continue
 
         if user_input.lower() in ['quit', 'exit', 'q', '/quit']:
+            _drain_io()
             if session_mgr and active_session:
                 session_mgr.end_session(active_session["id"])
             print("Goodbye!")
@@ -385,66 +553,33 @@ def play_cmd(args):
 
         # Handle other commands
         if user_input.startswith('/'):
-            _handle_command(user_input, store, args.campaign, last_turn_no)
+            _handle_command(user_input, snapshot, args.campaign, last_turn_no)
             continue
 
         # Run turn with spinner
         try:
+            streamed.clear()
             spinner = Spinner("Thinking")
             active_spinner[0] = spinner
 
-            with spinner:
-                result = orchestrator.run_turn(args.campaign, user_input)
+            try:
+                with spinner:
+                    result = orchestrator.run_turn(args.campaign, user_input)
+            finally:
+                snapshot.invalidate()
 
             active_spinner[0] = None
             turn_count += 1
             last_turn_no = result.turn_no
-            print(f"\n{result.final_text}\n")
-
-            # Show location header on scene transition
-            narrator_data = result.debug_info.get("narrator", {})
-            scene_transition = narrator_data.get("scene_transition")
-            if scene_transition:
-                loc_name = scene_transition.get("location_name", "Unknown")
-                loc_desc = scene_transition.get("description", "")
-                print(f"[Location: {loc_name}]")
-                if loc_desc:
-                    print(f"{loc_desc}")
-                print()
-
-            # Show clock deltas (always visible when clocks change)
-            clocks_line = _format_clock_deltas(result.clock_deltas)
-            if clocks_line:
-                print(f"  {clocks_line}")
-
-            # Show dice rolls (always visible when they happen)
-            rolls_line = _format_rolls(result.debug_info)
-            if rolls_line:
-                print(f"  {rolls_line}")
-
-            # Extra blank line after status indicators
-            if clocks_line or rolls_line:
-                print()
-
-            if result.clarification_needed:
-                print(f"[{result.clarification_question}]")
-
-            if debug_mode and result.debug_info:
-                print(_format_debug_panel(result.debug_info))
-                print()
+            sys.stdout.write(_format_turn_output(result, "".join(streamed), debug_mode))
+            sys.stdout.flush()
 
         except Exception as e:
             active_spinner[0] = None
             print(f"Error: {e}")
 
 
-def _handle_command(cmd, store, campaign_id, last_turn_no=None):
-    """Handle REPL commands."""
-    parts = cmd.lower().split()
-    base_cmd = parts[0]
-
-    if base_cmd == '/help':
-        print("""
+_REPL_HELP = """
 Commands:
   /status  - Show character status (harm, cred)
   /clocks  - Show all clocks
@@ -460,126 +595,240 @@ Feedback:
   /eval    - Show evaluation summary
 
   /quit    - Exit the game
-""")
-    elif base_cmd == '/status' or base_cmd == '/clocks':
-        clocks = store.get_all_clocks()
-        print("\n=== Clocks ===")
-        for c in clocks:
-            bar = _progress_bar(c['value'], c['max'])
-            print(f"  {c['name']}: {bar} {c['value']}/{c['max']}")
-        print()
-
-    elif base_cmd == '/scene':
-        scene = store.get_scene()
-        if scene:
-            loc = store.get_entity(scene.get('location_id'))
-            print(f"\n=== Scene ===")
-            print(f"Location: {loc.get('name') if loc else 'Unknown'}")
-            print(f"Time: {scene.get('time', {})}")
-            print(f"Present: {', '.join(scene.get('present_entity_ids', []))}")
-            print()
-        else:
-            print("No scene set.")
-
-    elif base_cmd == '/threads':
-        threads = store.get_active_threads()
-        print("\n=== Active Threads ===")
-        for t in threads:
-            print(f"  - {t['title']}")
-            stakes = t.get('stakes', {})
-            if stakes.get('success'):
-                print(f"    Success: {stakes['success']}")
-            if stakes.get('failure'):
-                print(f"    Failure: {stakes['failure']}")
-        print()
-
-    # Feedback commands
-    elif base_cmd == '/good':
-        _log_feedback(store, campaign_id, last_turn_no, "thumbs_up")
-        print("👍 Feedback recorded. Thanks!")
-
-    elif base_cmd == '/bad':
-        _log_feedback(store, campaign_id, last_turn_no, "thumbs_down")
-        print("👎 Feedback recorded. We'll try to improve.")
-
-    elif base_cmd == '/flag':
-        issue = " ".join(parts[1:]) if len(parts) > 1 else input("What's the issue? ")
-        _log_feedback(store, campaign_id, last_turn_no, "flag_issue", issue)
-        print(f"🚩 Issue flagged: {issue}")
-
-    elif base_cmd == '/note':
-        note = " ".join(parts[1:]) if len(parts) > 1 else input("Your note: ")
-        _log_feedback(store, campaign_id, last_turn_no, "comment", note)
-        print(f"📝 Note recorded.")
-
-    elif base_cmd == '/eval':
-        _show_eval_summary(store, campaign_id)
+"""
+_REPL_HELP_OUT = _REPL_HELP + "\n"
+
+
+class _ReplSnapshot:
+    """Game state the REPL's slash commands show, read from the store on first use.
 
+    Repeated /scene, /clocks or /threads between turns reuse the cached
+    rows; play_cmd calls invalidate() once a turn has run, since a turn can
+    change any of them.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._values = {}
+
+    def invalidate(self):
+        self._values.clear()
+
+    def _cached(self, key, fetch):
+        if key not in self._values:
+            self._values[key] = fetch()
+        return self._values[key]
+
+    @property
+    def scene(self):
+        return self._cached("scene", self.store.get_scene)
+
+    @property
+    def location(self):
+        scene = self.scene
+        if not scene:
+            return None
+        return self._cached("location", lambda: self.store.get_entity(scene.get("location_id")))
+
+    @property
+    def clocks(self):
+        return self._cached("clocks", self.store.get_all_clocks)
+
+    @property
+    def threads(self):
+        return self._cached("threads", self.store.get_active_threads)
+
+
+def _cmd_help(snapshot, campaign_id, last_turn_no, args):
+    sys.stdout.write(_REPL_HELP_OUT)
+
+
+def _cmd_clocks(snapshot, campaign_id, last_turn_no, args):
+    out = ["\n=== Clocks ===\n"]
+    for c in snapshot.clocks:
+        bar = _progress_bar(c['value'], c['max'])
+        out.append(f"  {c['name']}: {bar} {c['value']}/{c['max']}\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
+
+
+def _cmd_scene(snapshot, campaign_id, last_turn_no, args):
+    scene = snapshot.scene
+    if scene:
+        loc = snapshot.location
+        sys.stdout.write(
+            "\n=== Scene ===\n"
+            f"Location: {loc.get('name') if loc else 'Unknown'}\n"
+            f"Time: {scene.get('time', {})}\n"
+            f"Present: {', '.join(scene.get('present_entity_ids', []))}\n"
+            "\n"
+        )
     else:
+        print("No scene set.")
+
+
+def _cmd_threads(snapshot, campaign_id, last_turn_no, args):
+    out = ["\n=== Active Threads ===\n"]
+    for t in snapshot.threads:
+        out.append(f"  - {t['title']}\n")
+        stakes = t.get('stakes', {})
+        if stakes.get('success'):
+            out.append(f"    Success: {stakes['success']}\n")
+        if stakes.get('failure'):
+            out.append(f"    Failure: {stakes['failure']}\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
+
+
+def _cmd_good(snapshot, campaign_id, last_turn_no, args):
+    _log_feedback(snapshot.store, campaign_id, last_turn_no, "thumbs_up")
+    print("👍 Feedback recorded. Thanks!")
+
+
+def _cmd_bad(snapshot, campaign_id, last_turn_no, args):
+    _log_feedback(snapshot.store, campaign_id, last_turn_no, "thumbs_down")
+    print("👎 Feedback recorded. We'll try to improve.")
+
+
+def _cmd_flag(snapshot, campaign_id, last_turn_no, args):
+    issue = " ".join(args) if args else input("What's the issue? ")
+    _log_feedback(snapshot.store, campaign_id, last_turn_no, "flag_issue", issue)
+    print(f"🚩 Issue flagged: {issue}")
+
+
+def _cmd_note(snapshot, campaign_id, last_turn_no, args):
+    note = " ".join(args) if args else input("Your note: ")
+    _log_feedback(snapshot.store, campaign_id, last_turn_no, "comment", note)
+    print(f"📝 Note recorded.")
+
+
+def _cmd_eval(snapshot, campaign_id, last_turn_no, args):
+    _show_eval_summary(snapshot.store, campaign_id)
+
+
+# REPL slash commands; each handler takes (snapshot, campaign_id, last_turn_no, args)
+_REPL_CMDS = {
+    "/help": _cmd_help,
+    "/status": _cmd_clocks,
+    "/clocks": _cmd_clocks,
+    "/scene": _cmd_scene,
+    "/threads": _cmd_threads,
+    "/good": _cmd_good,
+    "/bad": _cmd_bad,
+    "/flag": _cmd_flag,
+    "/note": _cmd_note,
+    "/eval": _cmd_eval,
+}
+
+
+def _handle_command(cmd, snapshot, campaign_id, last_turn_no=None):
+    """Handle REPL commands."""
+    base_cmd, *args = cmd.split()
+    # Commands are almost always typed in lowercase; only fold case on a miss
+    handler = _REPL_CMDS.get(base_cmd) or _REPL_CMDS.get(base_cmd.lower())
+    if handler is None:
         print(f"Unknown command: {cmd}")
         print("Type /help for available commands.")
+        return
+    handler(snapshot, campaign_id, last_turn_no, args)
+
+
+_io_pool = None
+
+
+def _submit_io(fn, *args):
+    """Run a REPL side effect on a background thread so the prompt returns at once.
+
+    A single worker keeps writes in submission order; call _drain_io()
+    before reading anything those writes touch, and before exiting.
+    """
+    global _io_pool
+    if _io_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="repl-io")
+    future = _io_pool.submit(fn, *args)
+    future.add_done_callback(_report_io_error)
+    return future
+
+
+def _report_io_error(future):
+    error = future.exception()
+    if error is not None:
+        print(f"\nError: {error}")
+
+
+def _drain_io():
+    """Wait for queued background writes to finish."""
+    global _io_pool
+    if _io_pool is not None:
+        _io_pool.shutdown(wait=True)
+        _io_pool = None
 
 
 def _log_feedback(store, campaign_id, turn_no, feedback_type, value=None):
-    """Log player feedback."""
-    from src.eval import EvaluationTracker, PlayerFeedback, FeedbackType
+    """Log player feedback (the write itself runs in the background)."""
+    from src.eval import PlayerFeedback, FeedbackType
 
     if turn_no is None:
         print("No turn to give feedback on yet.")
         return
 
-    tracker = EvaluationTracker(store)
+    tracker = _get_tracker(store)
     ft = FeedbackType(feedback_type)
     feedback = PlayerFeedback(turn_no=turn_no, feedback_type=ft, value=value)
-    tracker.log_feedback(campaign_id, feedback)
+    _submit_io(tracker.log_feedback, campaign_id, feedback)
 
 
 def _show_eval_summary(store, campaign_id):
     """Show evaluation summary."""
-    from src.eval import EvaluationTracker
-
-    tracker = EvaluationTracker(store)
-
-    print("\n=== Evaluation Summary ===")
+    _drain_io()
+    tracker = _get_tracker(store)
+    metrics, feedback, problems = tracker.get_report(campaign_id)
+    out = ["\n=== Evaluation Summary ==="]
 
     # Metrics summary
-    metrics = tracker.get_metrics_summary(campaign_id)
     if metrics["turns"] > 0:
-        print(f"\nTurns played: {metrics['turns']}")
+        out.append(f"\nTurns played: {metrics['turns']}")
         summary = metrics.get("summary", {})
-        print(f"Avg latency: {summary.get('avg_latency_ms', 0):.0f}ms")
-        print(f"Clarification rate: {summary.get('clarification_rate', 0):.0%}")
-        print(f"Avg narrative length: {summary.get('avg_narrative_length', 0):.0f} chars")
+        out.append(f"Avg latency: {summary.get('avg_latency_ms', 0):.0f}ms")
+        out.append(f"Clarification rate: {summary.get('clarification_rate', 0):.0%}")
+        out.append(f"Avg narrative length: {summary.get('avg_narrative_length', 0):.0f} chars")
 
     # Feedback summary
-    feedback = tracker.get_feedback_summary(campaign_id)
     if feedback["total"] > 0:
-        print(f"\nFeedback received: {feedback['total']}")
+        out.append(f"\nFeedback received: {feedback['total']}")
         sentiment = feedback.get("sentiment", {})
         if sentiment.get("ratio") is not None:
-            print(f"Sentiment: {sentiment['positive']}👍 / {sentiment['negative']}👎 ({sentiment['ratio']:.0%} positive)")
+            out.append(f"Sentiment: {sentiment['positive']}👍 / {sentiment['negative']}👎 ({sentiment['ratio']:.0%} positive)")
 
     # Problem turns
-    problems = tracker.get_problematic_turns(campaign_id)
     if problems:
-        print(f"\nProblem turns: {len(problems)}")
+        out.append(f"\nProblem turns: {len(problems)}")
         for p in problems[:3]:  # Show first 3
-            print(f"  Turn {p['turn_no']}: {', '.join(p['issues'])}")
+            out.append(f"  Turn {p['turn_no']}: {', '.join(p['issues'])}")
+
+    out.append("\n")
+    sys.stdout.write("\n".join(out))
 
-    print()
 
+@functools.lru_cache(maxsize=8)
+def _progress_bars(width):
+    """Every possible bar of the given width, indexed by filled cells."""
+    return tuple("[" + "█" * i + "░" * (width - i) + "]" for i in range(width + 1))
 
+
+@functools.lru_cache(maxsize=512)
 def _progress_bar(value, max_val, width=20):
     """Create a simple progress bar."""
     if max_val <= 0:
         return "[" + "?" * width + "]"
     filled = int((value / max_val) * width)
-    return "[" + "█" * filled + "░" * (width - filled) + "]"
+    return _progress_bars(width)[min(max(filled, 0), width)]
 
 
 def show_event_cmd(args):
     """Show a stored event."""
-    store = StateStore(args.db)
+    store = _get_store(args.db)
     event = store.get_event(args.campaign, args.turn)
     if not event:
         print("Event not found")
@@ -590,43 +839,63 @@ def show_event_cmd(args):
             print("Field not found")
             return
         value = event[args.field]
-        if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
+        if isinstance(value, (dict, list)):
+            _write_json_pretty(value)
+            return
+        if isinstance(value, str) and value.startswith(('{', '[')):
             try:
-                value = json.loads(value)
-                print(json.dumps(value, indent=2, ensure_ascii=False))
-                return
-            except:
+                value = _json_loads(value)
+            except ValueError:
                 pass
+            else:
+                _write_json_pretty(value)
+                return
         print(value)
         return
 
-    print(json.dumps(event, indent=2, ensure_ascii=False))
+    _write_json_pretty(event)
 
 
 def replay_cmd(args):
     """Replay turns for A/B testing."""
-    store = StateStore(args.db)
-    report = rerun_turns(
-        store,
-        args.campaign,
-        args.start_turn,
-        args.end_turn,
-        _load_json(args.prompt_overrides),
+    from src.eval.replay import (
+        format_replay_entry, format_replay_report, rerun_turns, stream_turns,
+        summarize_replay_result,
     )
-    print(format_replay_report(report))
+    from src.db.state_store import StateStore
 
+    # Replay only reads the campaign; a read-only store never takes the write
+    # lock, so it can run alongside a live play session.
+    store = StateStore(args.db, readonly=True)
+    overrides = _load_json(args.prompt_overrides)
 
-def eval_cmd(args):
-    """Show evaluation report for campaign."""
-    from src.eval import EvaluationTracker
-    import json
+    if not args.stream:
+        report = rerun_turns(
+            store, args.campaign, args.start_turn, args.end_turn, overrides
+        )
+        print(format_replay_report(report))
+        return
 
-    store = StateStore(args.db)
-    tracker = EvaluationTracker(store)
+    replayed = 0
+    try:
+        for result in stream_turns(
+            store, args.campaign, args.start_turn, args.end_turn, overrides
+        ):
+            replayed += 1
+            print(format_replay_entry(summarize_replay_result(result)), flush=True)
+    except KeyboardInterrupt:
+        print("\nReplay interrupted.")
+    if replayed:
+        print(f"Turns replayed: {replayed}")
+    else:
+        print(f"No events found for turns {args.start_turn}-{args.end_turn}")
 
-    metrics = tracker.get_metrics_summary(args.campaign)
-    feedback = tracker.get_feedback_summary(args.campaign)
-    problems = tracker.get_problematic_turns(args.campaign)
+
+def eval_cmd(args):
+    """Show evaluation report for campaign."""
+    store = _get_store(args.db)
+    tracker = _get_tracker(store)
+    metrics, feedback, problems = tracker.get_report(args.campaign)
 
     report = {
         "campaign_id": args.campaign,
@@ -636,54 +905,57 @@ def eval_cmd(args):
     }
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        print(_json_dumps_pretty(report))
     else:
-        print("\n" + "=" * 60)
-        print(f"Evaluation Report: {args.campaign}")
-        print("=" * 60)
+        out = ["\n" + "=" * 60]
+        out.append(f"Evaluation Report: {args.campaign}")
+        out.append("=" * 60)
 
         if metrics["turns"] > 0:
-            print(f"\n📊 Metrics ({metrics['turns']} turns):")
+            out.append(f"\n📊 Metrics ({metrics['turns']} turns):")
             summary = metrics.get("summary", {})
-            print(f"  Avg latency: {summary.get('avg_latency_ms', 0):.0f}ms")
-            print(f"  Clarification rate: {summary.get('clarification_rate', 0):.0%}")
-            print(f"  Avg narrative length: {summary.get('avg_narrative_length', 0):.0f} chars")
+            out.append(f"  Avg latency: {summary.get('avg_latency_ms', 0):.0f}ms")
+            out.append(f"  Clarification rate: {summary.get('clarification_rate', 0):.0%}")
+            out.append(f"  Avg narrative length: {summary.get('avg_narrative_length', 0):.0f} chars")
 
             rolls = summary.get("roll_distribution", {})
             if rolls:
-                print(f"  Roll outcomes: {rolls}")
+                out.append(f"  Roll outcomes: {rolls}")
         else:
-            print("\n📊 No metrics recorded yet.")
+            out.append("\n📊 No metrics recorded yet.")
 
         if feedback["total"] > 0:
-            print(f"\n💬 Feedback ({feedback['total']} items):")
+            out.append(f"\n💬 Feedback ({feedback['total']} items):")
             sentiment = feedback.get("sentiment", {})
             if sentiment.get("ratio") is not None:
-                print(f"  👍 {sentiment['positive']} / 👎 {sentiment['negative']} ({sentiment['ratio']:.0%} positive)")
+                out.append(f"  👍 {sentiment['positive']} / 👎 {sentiment['negative']} ({sentiment['ratio']:.0%} positive)")
 
             by_type = feedback.get("by_type", {})
             if by_type.get("flag_issue"):
-                print(f"  🚩 Flagged issues: {len(by_type['flag_issue'])}")
+                out.append(f"  🚩 Flagged issues: {len(by_type['flag_issue'])}")
             if by_type.get("comment"):
-                print(f"  📝 Comments: {len(by_type['comment'])}")
+                out.append(f"  📝 Comments: {len(by_type['comment'])}")
         else:
-            print("\n💬 No feedback recorded yet.")
+            out.append("\n💬 No feedback recorded yet.")
 
         if problems:
-            print(f"\n⚠️  Problem turns ({len(problems)}):")
+            out.append(f"\n⚠️  Problem turns ({len(problems)}):")
             for p in problems[:5]:
-                print(f"  Turn {p['turn_no']}: {', '.join(p['issues'])}")
+                out.append(f"  Turn {p['turn_no']}: {', '.join(p['issues'])}")
             if len(problems) > 5:
-                print(f"  ... and {len(problems) - 5} more")
+                out.append(f"  ... and {len(problems) - 5} more")
         else:
-            print("\n✅ No problem turns detected.")
+            out.append("\n✅ No problem turns detected.")
 
-        print()
+        out.append("\n")
+        sys.stdout.write("\n".join(out))
 
 
 def list_scenarios_cmd(args):
     """List available scenarios."""
-    store = StateStore(args.db)
+    from src.setup import ScenarioLoader
+
+    store = _get_store(args.db)
     loader = ScenarioLoader(store)
     scenarios = loader.list_scenarios()
 
@@ -700,6 +972,13 @@ def list_scenarios_cmd(args):
     print()
 
 
+def vibe_check_cmd(args):
+    """Test content pack quality with scene prompts."""
+    from src.cli.vibe_check import vibe_check_cmd as run_vibe_check
+
+    run_vibe_check(args)
+
+
 def pack_test_cmd(args):
     """Test a content pack: analyze, generate scenario, run retrieval probes."""
     from src.ingest.pack_test import PackTester
@@ -714,13 +993,17 @@ def pack_test_cmd(args):
 
 def install_pack_cmd(args):
     """Install (index) a content pack into the database."""
-    store = StateStore(args.db)
-    store.ensure_schema()
+    from src.content.chunker import Chunker
+    from src.content.indexer import LoreIndexer
+    from src.content.pack_loader import PackLoader
+    from src.content.vector_store import create_vector_store, vector_store_path
+
+    store = _get_initialized_store(args.db)
 
     pack_path = Path(args.path)
     loader = PackLoader()
     chunker = Chunker()
-    vector_store = create_vector_store()
+    vector_store = create_vector_store(vector_store_path(args.db))
     indexer = LoreIndexer(store, vector_store)
 
     try:
@@ -744,8 +1027,7 @@ def install_pack_cmd(args):
 
 def list_packs_cmd(args):
     """List installed content packs."""
-    store = StateStore(args.db)
-    store.ensure_schema()
+    store = _get_initialized_store(args.db)
 
     packs = store.list_content_packs()
     if not packs:
@@ -767,47 +1049,59 @@ def list_packs_cmd(args):
 # Ingest Pipeline Commands
 # =============================================================================
 
+# Single-pass translation tables for deriving pack defaults from a PDF stem
+_STEM_TO_NAME = str.maketrans({"_": " ", "-": " "})
+_STEM_TO_ID = str.maketrans({" ": "_", "-": "_"})
+
+
 def _make_ingest_config(args):
     """Build IngestConfig from CLI args."""
     from src.ingest.models import IngestConfig
 
-    pdf_path = getattr(args, "input", "") or ""
+    opts = vars(args)
+    pdf_path = opts.get("input") or ""
+    output_dir = opts.get("output") or ""
     # Derive pack_id and pack_name from PDF filename when not provided
     pdf_stem = Path(pdf_path).stem if pdf_path else "unknown"
-    pack_id = getattr(args, "pack_id", None) or pdf_stem.lower().replace(" ", "_").replace("-", "_")
-    pack_name = getattr(args, "pack_name", None) or pdf_stem.replace("_", " ").replace("-", " ").title()
+    pack_id = opts.get("pack_id") or pdf_stem.lower().translate(_STEM_TO_ID)
+    pack_name = opts.get("pack_name") or pdf_stem.translate(_STEM_TO_NAME).title()
 
     return IngestConfig(
         pdf_path=pdf_path,
-        output_dir=getattr(args, "output", "") or "",
+        output_dir=output_dir,
         pack_id=pack_id,
         pack_name=pack_name,
-        pack_version=getattr(args, "pack_version", None) or "1.0",
-        pack_layer=getattr(args, "pack_layer", None) or "sourcebook",
-        pack_author=getattr(args, "pack_author", None) or "",
-        pack_description=getattr(args, "pack_description", None) or "",
-        use_ocr=getattr(args, "ocr", False),
-        extract_images=getattr(args, "extract_images", False),
-        skip_systems=getattr(args, "skip_systems", False),
-        draft_mode=getattr(args, "draft", False),
-        system_hint=getattr(args, "system_hint", "") or "",
-        work_dir=getattr(args, "output", "") or "",
+        pack_version=opts.get("pack_version") or "1.0",
+        pack_layer=opts.get("pack_layer") or "sourcebook",
+        pack_author=opts.get("pack_author") or "",
+        pack_description=opts.get("pack_description") or "",
+        use_ocr=opts.get("ocr", False),
+        extract_images=opts.get("extract_images", False),
+        skip_systems=opts.get("skip_systems", False),
+        draft_mode=opts.get("draft", False),
+        system_hint=opts.get("system_hint") or "",
+        work_dir=output_dir,
     )
 
 
+_INGEST_FAST_MODEL = "claude-3-5-haiku-20241022"
+
+
 def _make_gateways(args):
-    """Create LLM gateways for ingest pipeline."""
+    """Create LLM gateways for ingest pipeline.
+
+    Returns the process-wide cached gateways and prompt registry, so
+    stages run in one process share clients and already-loaded prompts.
+    """
     api_key = check_auth_or_prompt()
     if not api_key:
         print("Cannot run ingest without an API key.")
         print("Run 'login' to set one up, or set ANTHROPIC_API_KEY.")
         sys.exit(1)
 
-    sonnet = ClaudeGateway(api_key=api_key)
-    haiku = ClaudeGateway(api_key=api_key, model="claude-3-5-haiku-20241022")
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    registry = PromptRegistry(prompts_dir)
-    return sonnet, haiku, registry
+    sonnet = _get_gateway(api_key)
+    haiku = _get_gateway(api_key, _INGEST_FAST_MODEL)
+    return sonnet, haiku, _get_prompt_registry()
 
 
 def pack_ingest_cmd(args):
@@ -821,10 +1115,21 @@ def pack_ingest_cmd(args):
         print("Error: --output is required in non-interactive mode.")
         sys.exit(1)
 
-    from src.ingest.pipeline import IngestPipeline
+    from src.ingest.pipeline import IngestPipeline, load_completed_summary
     from src.cli.ingest_flow import InstrumentedPipeline
 
     config = _make_ingest_config(args)
+    resume = not getattr(args, "no_resume", False)
+    from_stage = getattr(args, "from_stage", None)
+
+    # A finished work dir needs no gateways: every stage would load from disk
+    if resume and not from_stage:
+        summary = load_completed_summary(config.get_work_dir(), config.skip_systems)
+        if summary is not None:
+            print("\nPipeline already complete (use --from-stage or --no-resume to re-run).")
+            _print_pipeline_summary(summary, show_timings=False)
+            return
+
     sonnet, haiku, registry = _make_gateways(args)
 
     # Get system hint from args or config
@@ -838,19 +1143,21 @@ def pack_ingest_cmd(args):
         system_hint=system_hint,
     )
     instrumented = InstrumentedPipeline(pipeline)
-    summary = instrumented.run(
-        resume=not getattr(args, "no_resume", False),
-        from_stage=getattr(args, "from_stage", None),
-    )
+    summary = instrumented.run(resume=resume, from_stage=from_stage)
 
     print(f"\nPipeline complete!")
+    _print_pipeline_summary(summary)
+
+
+def _print_pipeline_summary(summary, show_timings=True):
+    """Print the pack location, validity and errors from a pipeline summary."""
     print(f"  Pack directory: {summary['pack_dir']}")
     print(f"  Valid: {summary['pack_valid']}")
     if summary.get("validation_errors"):
         print(f"  Errors: {len(summary['validation_errors'])}")
         for err in summary["validation_errors"][:5]:
             print(f"    - {err}")
-    if summary.get("timings"):
+    if show_timings and summary.get("timings"):
         total_ms = sum(summary["timings"].values())
         print(f"  Total time: {total_ms / 1000:.1f}s")
 
@@ -968,7 +1275,7 @@ def ingest_audit_cmd(args):
     report = auditor.audit(samples=args.samples)
 
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        print(_json_dumps_pretty(report.to_dict()))
     else:
         print(auditor.format_report(report))
 
@@ -1046,6 +1353,10 @@ def ingest_systems_validate_cmd(args):
             print(f"  WARNING: {w}")
 
 
+# Review markers written into draft packs; promote-draft leaves them behind
+_DRAFT_MARKER_FILES = frozenset({"REVIEW_NEEDED.md", "DRAFT_README.md", "EXTRACTION_REPORT.md"})
+
+
 def promote_draft_cmd(args):
     """Promote a draft pack to content_packs/."""
     import shutil
@@ -1077,21 +1388,36 @@ def promote_draft_cmd(args):
     # Copy draft to target, excluding draft markers
     target_path.mkdir(parents=True)
 
-    excluded_files = {"REVIEW_NEEDED.md", "DRAFT_README.md", "EXTRACTION_REPORT.md"}
+    # Hardlinks only work within one filesystem; otherwise copy as usual.
+    copy_function = shutil.copy2
+    if args.link and os.stat(draft_path).st_dev == os.stat(target_path).st_dev:
+        copy_function = _link_or_copy
 
-    for item in draft_path.iterdir():
-        if item.name in excluded_files:
-            continue
-        if item.is_dir():
-            shutil.copytree(item, target_path / item.name)
-        else:
-            shutil.copy2(item, target_path / item.name)
+    with os.scandir(draft_path) as it:
+        for entry in it:
+            if entry.name in _DRAFT_MARKER_FILES:
+                continue
+            if entry.is_dir():
+                shutil.copytree(entry.path, target_path / entry.name, copy_function=copy_function)
+            else:
+                copy_function(entry.path, target_path / entry.name)
 
     print(f"Promoted draft to: {target_path}")
     print(f"\nTo install the pack:")
     print(f"  freeform-rpg --db {args.db} install-pack {target_path}")
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying instead if the filesystem refuses."""
+    import shutil
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def list_systems_cmd(args):
     """List available system configs."""
     from src.ingest.systems_config import get_available_systems, SYSTEMS_DIR
@@ -1116,7 +1442,7 @@ def list_systems_cmd(args):
 def _load_extraction(input_dir):
     """Load ExtractionResult from a stage 1 output directory."""
     from src.ingest.models import ExtractionResult, PageEntry
-    from src.ingest.utils import read_manifest
+    from src.ingest.utils import list_page_files, read_manifest
 
     input_dir = Path(input_dir)
     page_map = read_manifest(input_dir / "page_map.json")
@@ -1125,8 +1451,7 @@ def _load_extraction(input_dir):
     pages = []
     pages_dir = input_dir / "pages"
     if pages_dir.exists():
-        for page_file in sorted(pages_dir.glob("page_*.md")):
-            page_num = int(page_file.stem.split("_")[1])
+        for page_num, page_file in list_page_files(pages_dir):
             text = page_file.read_text(encoding="utf-8")
             info = page_map.get(str(page_num), {})
             pages.append(PageEntry(
@@ -1148,18 +1473,13 @@ def _load_extraction(input_dir):
 def _load_structure(input_dir):
     """Load DocumentStructure from a stage 2 output directory."""
     from src.ingest.models import ChapterIntent, DocumentStructure, SectionNode
-    from src.ingest.utils import read_manifest
+    from src.ingest.utils import MarkdownFileIndex, enum_or_none, read_manifest
 
     input_dir = Path(input_dir)
     data = read_manifest(input_dir / "structure.json")
 
     def parse_node(d, default_level=1):
-        intent = None
-        if d.get("intent"):
-            try:
-                intent = ChapterIntent(d["intent"])
-            except ValueError:
-                pass
+        intent = enum_or_none(ChapterIntent, d.get("intent"))
         children = [parse_node(c, 2) for c in d.get("children", [])]
         return SectionNode(
             title=d.get("title", "Untitled"),
@@ -1173,13 +1493,12 @@ def _load_structure(input_dir):
 
     # Load chapter content from files
     sections = [parse_node(s) for s in data.get("sections", [])]
-    chapters_dir = input_dir / "chapters"
-    if chapters_dir.exists():
-        for i, section in enumerate(sections):
-            # Try to load chapter content from file
-            for chapter_file in chapters_dir.glob(f"{i + 1:02d}_*.md"):
-                section.content = chapter_file.read_text(encoding="utf-8")
-                break
+    chapters = MarkdownFileIndex(input_dir / "chapters")
+    for i, section in enumerate(sections):
+        # Try to load chapter content from file
+        chapter_file = chapters.find_prefix(f"{i + 1:02d}_")
+        if chapter_file:
+            section.content = chapter_file.read_text(encoding="utf-8")
 
     return DocumentStructure(
         title=data.get("title", "Untitled"),
@@ -1191,47 +1510,29 @@ def _load_structure(input_dir):
 def _load_segment_manifest(input_dir):
     """Load SegmentManifest from a stage 3/4 output directory."""
     from src.ingest.models import ChapterIntent, ContentType, Route, SegmentEntry, SegmentManifest
-    from src.ingest.utils import read_manifest
+    from src.ingest.utils import MarkdownFileIndex, enum_or_none, read_manifest, segment_file_path
 
     input_dir = Path(input_dir)
     data = read_manifest(input_dir / "segment_manifest.json")
 
     segments = []
-    segments_dir = input_dir / "segments"
+    segment_files = MarkdownFileIndex(input_dir / "segments")
     for s in data.get("segments", []):
         # Load content from segment file
         content = ""
-        if segments_dir.exists():
-            for seg_file in segments_dir.glob(f"{s['id']}_*.md"):
-                raw = seg_file.read_text(encoding="utf-8")
-                # Strip leading H1 title
-                lines = raw.split("\n")
-                if lines and lines[0].startswith("# "):
-                    content = "\n".join(lines[1:]).strip()
-                else:
-                    content = raw.strip()
-                break
-
-        content_type = None
-        if s.get("content_type"):
-            try:
-                content_type = ContentType(s["content_type"])
-            except ValueError:
-                pass
-
-        route = None
-        if s.get("route"):
-            try:
-                route = Route(s["route"])
-            except ValueError:
-                pass
-
-        chapter_intent = None
-        if s.get("chapter_intent"):
-            try:
-                chapter_intent = ChapterIntent(s["chapter_intent"])
-            except ValueError:
-                pass
+        seg_file = segment_file_path(segment_files, s["id"], s.get("title", ""))
+        if seg_file:
+            raw = seg_file.read_text(encoding="utf-8")
+            # Strip leading H1 title
+            lines = raw.split("\n")
+            if lines and lines[0].startswith("# "):
+                content = "\n".join(lines[1:]).strip()
+            else:
+                content = raw.strip()
+
+        content_type = enum_or_none(ContentType, s.get("content_type"))
+        route = enum_or_none(Route, s.get("route"))
+        chapter_intent = enum_or_none(ChapterIntent, s.get("chapter_intent"))
 
         segments.append(SegmentEntry(
             id=s["id"],
@@ -1282,7 +1583,9 @@ def _load_entity_registry(input_dir):
 
 def _load_enriched_manifest(input_dir):
     """Load enriched files list from an enrich output directory."""
-    from src.ingest.utils import read_manifest
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.ingest.utils import read_markdown_with_frontmatter
 
     input_dir = Path(input_dir)
     # Read entity registry for reference
@@ -1291,37 +1594,54 @@ def _load_enriched_manifest(input_dir):
         print(f"Error: No enriched directory found at {enriched_dir}")
         sys.exit(1)
 
+    md_files = [
+        md_file
+        for type_dir in enriched_dir.iterdir() if type_dir.is_dir()
+        for md_file in sorted(type_dir.glob("*.md"))
+    ]
+    # Frontmatter reads are I/O-bound, so fan them out across threads;
+    # map() keeps results in directory order.
+    with ThreadPoolExecutor(max_workers=min(32, len(md_files) or 1)) as pool:
+        parsed = list(pool.map(read_markdown_with_frontmatter, md_files))
+
     files = []
-    for type_dir in enriched_dir.iterdir():
-        if type_dir.is_dir():
-            for md_file in sorted(type_dir.glob("*.md")):
-                from src.ingest.utils import read_markdown_with_frontmatter
-                fm, body = read_markdown_with_frontmatter(md_file)
-                files.append({
-                    "path": str(md_file),
-                    "title": fm.get("title", md_file.stem),
-                    "file_type": fm.get("type", "general"),
-                    "entity_id": fm.get("entity_id", md_file.stem),
-                    "frontmatter": fm,
-                })
+    for md_file, (fm, _body) in zip(md_files, parsed):
+        files.append({
+            "path": str(md_file),
+            "title": fm.get("title", md_file.stem),
+            "file_type": fm.get("type", "general"),
+            "entity_id": fm.get("entity_id", md_file.stem),
+            "frontmatter": fm,
+        })
     return files
 
 
 def _load_systems_extraction(input_dir):
     """Load SystemsExtractionManifest from a systems extract output."""
+    from concurrent.futures import ThreadPoolExecutor
+
     from src.ingest.models import SystemsExtractionManifest
     from src.ingest.utils import read_manifest
 
     import yaml
+    YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
     input_dir = Path(input_dir)
     manifest_data = read_manifest(input_dir / "extraction_manifest.json")
 
-    extractions = {}
+    yaml_paths = {}
     for key in manifest_data.get("extractors_run", []):
         yaml_path = input_dir / f"{key}.yaml"
         if yaml_path.exists():
-            extractions[key] = yaml.safe_load(yaml_path.read_text())
+            yaml_paths[key] = yaml_path
+
+    def load_yaml(yaml_path):
+        with open(yaml_path, "rb") as f:
+            return yaml.load(f, Loader=YamlLoader)
+
+    # One file per sub-extractor; overlap the reads, keep manifest order
+    with ThreadPoolExecutor(max_workers=min(8, len(yaml_paths) or 1)) as pool:
+        extractions = dict(zip(yaml_paths, pool.map(load_yaml, yaml_paths.values())))
 
     return SystemsExtractionManifest(
         extractions=extractions,
@@ -1329,7 +1649,94 @@ def _load_systems_extraction(input_dir):
     )
 
 
-def build_parser():
+# Stage-by-stage ingest commands: (name, help, input help, handler, extra
+# arguments as (flags, add_argument kwargs) pairs). build_parser registers
+# them in this order.
+_OUTPUT_ARG = (("--output", "-o"), {"required": True, "help": "Output directory"})
+_REPORT_OUTPUT_ARG = (("--output", "-o"), {"help": "Output directory for report"})
+_INGEST_STAGE_COMMANDS = (
+    ("ingest-extract", "Stage 1: PDF text extraction", "Path to PDF file", ingest_extract_cmd, (
+        _OUTPUT_ARG,
+        (("--ocr",), {"action": "store_true", "help": "Use OCR fallback"}),
+        (("--pages",), {"help": "Page range (e.g. '1-5,8')"}),
+        (("--extract-images",), {"action": "store_true", "help": "Extract images"}),
+    )),
+    ("ingest-structure", "Stage 2: Document structure detection", "Stage 1 output directory",
+     ingest_structure_cmd, (
+        _OUTPUT_ARG,
+        (("--pdf",), {"help": "Original PDF path (for font analysis)"}),
+    )),
+    ("ingest-segment", "Stage 3: Content segmentation", "Stage 2 output directory",
+     ingest_segment_cmd, (_OUTPUT_ARG,)),
+    ("ingest-classify", "Stage 4: Content classification", "Stage 3 output directory",
+     ingest_classify_cmd, (_OUTPUT_ARG,)),
+    ("ingest-enrich", "Stage 5: Lore enrichment", "Stage 4 output directory",
+     ingest_enrich_cmd, (_OUTPUT_ARG,)),
+    ("ingest-assemble", "Stage 6: Content pack assembly", "Stage 5 output directory",
+     ingest_assemble_cmd, (
+        _OUTPUT_ARG,
+        (("--pack-id",), {"default": "", "help": "Pack ID"}),
+        (("--pack-name",), {"default": "", "help": "Pack name"}),
+        (("--pack-version",), {"default": "1.0", "help": "Pack version"}),
+        (("--pack-layer",), {"default": "sourcebook", "help": "Pack layer"}),
+        (("--pack-author",), {"default": "", "help": "Pack author"}),
+        (("--pack-description",), {"default": "", "help": "Pack description"}),
+    )),
+    ("ingest-validate", "Stage 7: Pack validation", "Content pack directory",
+     ingest_validate_cmd, (_REPORT_OUTPUT_ARG,)),
+    ("ingest-systems-extract", "Stage S1: Systems extraction", "Stage 4 output directory",
+     ingest_systems_extract_cmd, (_OUTPUT_ARG,)),
+    ("ingest-systems-assemble", "Stage S2: Systems assembly", "Stage S1 output directory",
+     ingest_systems_assemble_cmd, (_OUTPUT_ARG,)),
+    ("ingest-systems-validate", "Stage S3: Systems validation", "Stage S2 output directory",
+     ingest_systems_validate_cmd, (_REPORT_OUTPUT_ARG,)),
+)
+
+
+class _SkippedParser:
+    """Stand-in for a subcommand parser this invocation won't use."""
+
+    def add_argument(self, *args, **kwargs):
+        pass
+
+    def set_defaults(self, **kwargs):
+        pass
+
+
+def _sniff_subcommand(argv):
+    """Best guess at the subcommand in argv, or None to build every parser.
+
+    Skips the global options and their values (including argparse's
+    abbreviations such as --camp); gives up on -h/--help before a command
+    so top-level help still lists every subcommand.
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif len(token) > 2 and ("--db".startswith(token) or "--campaign".startswith(token)):
+            skip_value = True
+        elif token.startswith("-"):
+            if token in ("-h", "--help"):
+                return None
+        else:
+            return token
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def build_parser(only=None, listing_only=False):
+    """Build the CLI parser.
+
+    With only set, just that subcommand's parser is built (the others are
+    skipped) and its one-line summary is dropped, since only the full
+    parser's help lists it. An unknown name falls back to the listing-only
+    parser so argparse can report the valid choices.
+
+    With listing_only set, every subcommand is registered with its summary
+    but none of its arguments: enough for top-level help and for argv that
+    names no subcommand.
+    """
     parser = argparse.ArgumentParser(
         description="Freeform RPG Engine CLI - AI-driven narrative RPG"
     )
@@ -1346,20 +1753,30 @@ def build_parser():
 
     sub = parser.add_subparsers(dest="command")
 
+    def add_parser(name, **kwargs):
+        if only is not None:
+            if name != only:
+                return _SkippedParser()
+            kwargs.pop("help", None)
+        elif listing_only:
+            sub.add_parser(name, **kwargs)
+            return _SkippedParser()
+        return sub.add_parser(name, **kwargs)
+
     # login
-    login_parser = sub.add_parser("login", help="Set up API key")
+    login_parser = add_parser("login", help="Set up API key")
     login_parser.set_defaults(func=login_cmd)
 
     # logout
-    logout_parser = sub.add_parser("logout", help="Remove stored API key")
+    logout_parser = add_parser("logout", help="Remove stored API key")
     logout_parser.set_defaults(func=logout_cmd)
 
     # init-db
-    init_db_parser = sub.add_parser("init-db", help="Initialize the SQLite schema")
+    init_db_parser = add_parser("init-db", help="Initialize the SQLite schema")
     init_db_parser.set_defaults(func=init_db)
 
     # new-game
-    new_game_parser = sub.add_parser("new-game", help="Start a new game")
+    new_game_parser = add_parser("new-game", help="Start a new game")
     new_game_parser.add_argument(
         "--scenario",
         help="Scenario file to load (e.g., dead_drop)"
@@ -1381,27 +1798,27 @@ def build_parser():
     new_game_parser.set_defaults(func=new_game)
 
     # list-scenarios
-    list_parser = sub.add_parser("list-scenarios", help="List available scenarios")
+    list_parser = add_parser("list-scenarios", help="List available scenarios")
     list_parser.set_defaults(func=list_scenarios_cmd)
 
     # install-pack
-    install_pack_parser = sub.add_parser("install-pack", help="Install a content pack")
+    install_pack_parser = add_parser("install-pack", help="Install a content pack")
     install_pack_parser.add_argument("path", help="Path to content pack directory")
     install_pack_parser.set_defaults(func=install_pack_cmd)
 
     # list-packs
-    list_packs_parser = sub.add_parser("list-packs", help="List installed content packs")
+    list_packs_parser = add_parser("list-packs", help="List installed content packs")
     list_packs_parser.set_defaults(func=list_packs_cmd)
 
     # pack-test
-    pack_test_parser = sub.add_parser("pack-test", help="Test a content pack")
+    pack_test_parser = add_parser("pack-test", help="Test a content pack")
     pack_test_parser.add_argument("pack_dir", help="Path to assembled pack directory")
     pack_test_parser.add_argument("--no-scenario", action="store_true", help="Skip scenario generation")
     pack_test_parser.add_argument("--scenario-dir", default="scenarios", help="Where to save test scenario")
     pack_test_parser.set_defaults(func=pack_test_cmd)
 
     # vibe-check
-    vibe_check_parser = sub.add_parser(
+    vibe_check_parser = add_parser(
         "vibe-check",
         help="Test content pack quality with scene prompts (no scenario setup)"
     )
@@ -1421,7 +1838,7 @@ def build_parser():
     vibe_check_parser.set_defaults(func=vibe_check_cmd)
 
     # run-turn
-    run_turn_parser = sub.add_parser("run-turn", help="Execute a single turn")
+    run_turn_parser = add_parser("run-turn", help="Execute a single turn")
     run_turn_parser.add_argument("--input", "-i", required=True, help="Player input text")
     run_turn_parser.add_argument(
         "--prompt-versions",
@@ -1431,17 +1848,17 @@ def build_parser():
     run_turn_parser.set_defaults(func=run_turn_cmd)
 
     # play (interactive mode)
-    play_parser = sub.add_parser("play", help="Interactive play mode")
+    play_parser = add_parser("play", help="Interactive play mode")
     play_parser.add_argument("--verbose", "-v", action="store_true", help="Show debug info after each turn")
     play_parser.set_defaults(func=play_cmd)
 
     # eval (evaluation report)
-    eval_parser = sub.add_parser("eval", help="Show evaluation report")
+    eval_parser = add_parser("eval", help="Show evaluation report")
     eval_parser.add_argument("--json", action="store_true", help="Output JSON")
     eval_parser.set_defaults(func=eval_cmd)
 
     # show-event
-    show_event_parser = sub.add_parser("show-event", help="Show a stored event")
+    show_event_parser = add_parser("show-event", help="Show a stored event")
     show_event_parser.add_argument("--turn", type=int, required=True, help="Turn number")
     show_event_parser.add_argument(
         "--field",
@@ -1450,13 +1867,17 @@ def build_parser():
     show_event_parser.set_defaults(func=show_event_cmd)
 
     # replay
-    replay_parser = sub.add_parser("replay", help="Replay turns for A/B testing")
+    replay_parser = add_parser("replay", help="Replay turns for A/B testing")
     replay_parser.add_argument("--start-turn", type=int, required=True)
     replay_parser.add_argument("--end-turn", type=int, required=True)
     replay_parser.add_argument(
         "--prompt-overrides",
         help='JSON object, e.g. {"narrator":"v2"}',
     )
+    replay_parser.add_argument(
+        "--stream", action="store_true",
+        help="Print each turn as soon as it is replayed",
+    )
     replay_parser.set_defaults(func=replay_cmd)
 
     # =================================================================
@@ -1464,7 +1885,7 @@ def build_parser():
     # =================================================================
 
     # pack-ingest (full pipeline)
-    ingest_parser = sub.add_parser("pack-ingest", help="Full PDF-to-content-pack pipeline")
+    ingest_parser = add_parser("pack-ingest", help="Full PDF-to-content-pack pipeline")
     ingest_parser.add_argument("input", nargs="?", default=None, help="Path to PDF file")
     ingest_parser.add_argument("--output", "-o", default=None, help="Output directory")
     ingest_parser.add_argument("--pack-id", help="Content pack ID")
@@ -1494,99 +1915,57 @@ def build_parser():
     )
     ingest_parser.set_defaults(func=pack_ingest_cmd)
 
-    # ingest-extract (stage 1)
-    extract_parser = sub.add_parser("ingest-extract", help="Stage 1: PDF text extraction")
-    extract_parser.add_argument("input", help="Path to PDF file")
-    extract_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    extract_parser.add_argument("--ocr", action="store_true", help="Use OCR fallback")
-    extract_parser.add_argument("--pages", help="Page range (e.g. '1-5,8')")
-    extract_parser.add_argument("--extract-images", action="store_true", help="Extract images")
-    extract_parser.set_defaults(func=ingest_extract_cmd)
-
-    # ingest-structure (stage 2)
-    structure_parser = sub.add_parser("ingest-structure", help="Stage 2: Document structure detection")
-    structure_parser.add_argument("input", help="Stage 1 output directory")
-    structure_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    structure_parser.add_argument("--pdf", help="Original PDF path (for font analysis)")
-    structure_parser.set_defaults(func=ingest_structure_cmd)
-
-    # ingest-segment (stage 3)
-    segment_parser = sub.add_parser("ingest-segment", help="Stage 3: Content segmentation")
-    segment_parser.add_argument("input", help="Stage 2 output directory")
-    segment_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    segment_parser.set_defaults(func=ingest_segment_cmd)
-
-    # ingest-classify (stage 4)
-    classify_parser = sub.add_parser("ingest-classify", help="Stage 4: Content classification")
-    classify_parser.add_argument("input", help="Stage 3 output directory")
-    classify_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    classify_parser.set_defaults(func=ingest_classify_cmd)
-
-    # ingest-enrich (stage 5)
-    enrich_parser = sub.add_parser("ingest-enrich", help="Stage 5: Lore enrichment")
-    enrich_parser.add_argument("input", help="Stage 4 output directory")
-    enrich_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    enrich_parser.set_defaults(func=ingest_enrich_cmd)
-
-    # ingest-assemble (stage 6)
-    assemble_parser = sub.add_parser("ingest-assemble", help="Stage 6: Content pack assembly")
-    assemble_parser.add_argument("input", help="Stage 5 output directory")
-    assemble_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    assemble_parser.add_argument("--pack-id", default="", help="Pack ID")
-    assemble_parser.add_argument("--pack-name", default="", help="Pack name")
-    assemble_parser.add_argument("--pack-version", default="1.0", help="Pack version")
-    assemble_parser.add_argument("--pack-layer", default="sourcebook", help="Pack layer")
-    assemble_parser.add_argument("--pack-author", default="", help="Pack author")
-    assemble_parser.add_argument("--pack-description", default="", help="Pack description")
-    assemble_parser.set_defaults(func=ingest_assemble_cmd)
-
-    # ingest-validate (stage 7)
-    validate_parser = sub.add_parser("ingest-validate", help="Stage 7: Pack validation")
-    validate_parser.add_argument("input", help="Content pack directory")
-    validate_parser.add_argument("--output", "-o", help="Output directory for report")
-    validate_parser.set_defaults(func=ingest_validate_cmd)
-
-    # ingest-systems-extract (stage S1)
-    sys_extract_parser = sub.add_parser("ingest-systems-extract", help="Stage S1: Systems extraction")
-    sys_extract_parser.add_argument("input", help="Stage 4 output directory")
-    sys_extract_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    sys_extract_parser.set_defaults(func=ingest_systems_extract_cmd)
-
-    # ingest-systems-assemble (stage S2)
-    sys_assemble_parser = sub.add_parser("ingest-systems-assemble", help="Stage S2: Systems assembly")
-    sys_assemble_parser.add_argument("input", help="Stage S1 output directory")
-    sys_assemble_parser.add_argument("--output", "-o", required=True, help="Output directory")
-    sys_assemble_parser.set_defaults(func=ingest_systems_assemble_cmd)
-
-    # ingest-systems-validate (stage S3)
-    sys_validate_parser = sub.add_parser("ingest-systems-validate", help="Stage S3: Systems validation")
-    sys_validate_parser.add_argument("input", help="Stage S2 output directory")
-    sys_validate_parser.add_argument("--output", "-o", help="Output directory for report")
-    sys_validate_parser.set_defaults(func=ingest_systems_validate_cmd)
+    # ingest-* stage commands (stages 1-7, S1-S3)
+    for name, help_text, input_help, func, extra_args in _INGEST_STAGE_COMMANDS:
+        stage_parser = add_parser(name, help=help_text)
+        stage_parser.add_argument("input", help=input_help)
+        for flags, kwargs in extra_args:
+            stage_parser.add_argument(*flags, **kwargs)
+        stage_parser.set_defaults(func=func)
 
     # Audit tool
-    audit_parser = sub.add_parser("ingest-audit", help="Audit pipeline output quality")
+    audit_parser = add_parser("ingest-audit", help="Audit pipeline output quality")
     audit_parser.add_argument("input", help="Pipeline work directory")
     audit_parser.add_argument("--samples", type=int, default=5, help="Pages to spot-check (default 5)")
     audit_parser.add_argument("--json", action="store_true", help="Output as JSON")
     audit_parser.set_defaults(func=ingest_audit_cmd)
 
     # promote-draft
-    promote_parser = sub.add_parser("promote-draft", help="Promote a draft pack to content_packs/")
+    promote_parser = add_parser("promote-draft", help="Promote a draft pack to content_packs/")
     promote_parser.add_argument("draft_path", help="Path to draft pack directory")
     promote_parser.add_argument("--target", "-t", help="Target directory (default: content_packs/)")
     promote_parser.add_argument("--force", "-f", action="store_true", help="Overwrite existing pack")
+    promote_parser.add_argument("--link", action="store_true",
+                                help="Hardlink files instead of copying (same filesystem only)")
     promote_parser.set_defaults(func=promote_draft_cmd)
 
     # list-systems
-    list_systems_parser = sub.add_parser("list-systems", help="List available system configs")
+    list_systems_parser = add_parser("list-systems", help="List available system configs")
     list_systems_parser.set_defaults(func=list_systems_cmd)
 
+    if only is not None and only not in sub.choices:
+        return build_parser(listing_only=True)
     return parser
 
 
+def _autocomplete():
+    """Answer a shell-completion request if argcomplete is installed.
+
+    Completion needs every subcommand's options, so this builds the full
+    parser; argcomplete prints the candidates and exits.
+    """
+    try:
+        import argcomplete
+    except ImportError:
+        return
+    argcomplete.autocomplete(build_parser())
+
+
 def main():
-    parser = build_parser()
+    if "_ARGCOMPLETE" in os.environ:
+        _autocomplete()
+    only = _sniff_subcommand(sys.argv[1:])
+    parser = build_parser(only=only, listing_only=only is None)
     args = parser.parse_args()
 
     if args.command is None:
@@ -0,0 +1,25 @@
+"""Line input for the guided CLI flows."""
+
+import sys
+
+
+def read_line(prompt: str = "") -> str:
+    """Read one line of user input, like input().
+
+    Interactive terminals go through input() to keep readline editing and
+    history. Piped or scripted stdin is read directly with readline(),
+    skipping the readline machinery entirely.
+
+    Raises:
+        EOFError: If stdin is exhausted.
+    """
+    stdin = sys.stdin
+    if stdin.isatty():
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
@@ -1,5 +1,7 @@
 """Simple terminal spinner for long-running operations."""
 
+import atexit
+import os
 import sys
 import threading
 import time
@@ -16,32 +18,74 @@ class Spinner:
 
     FRAMES = [".", "..", "...", "   "]
     INTERVAL = 0.4
+    START_DELAY = 0.2  # Work that finishes sooner never draws a frame
 
     def __init__(self, message: str = "Thinking"):
         self.message = message
         self._stop = threading.Event()
         self._thread = None
 
+    @staticmethod
+    def _make_writer():
+        """Return a callable that writes text to stderr in a single syscall.
+
+        Frames go straight to the stderr fd with os.write, skipping the
+        TextIOWrapper write + flush pair. Falls back to the stream when
+        stderr has no real fd (e.g. captured under test).
+        """
+        stream = sys.stderr
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            def write(text: str) -> None:
+                stream.write(text)
+                stream.flush()
+            return write
+
+        stream.flush()  # Don't let buffered text land after our frames
+        encoding = getattr(stream, "encoding", None) or "utf-8"
+        encoded: dict[str, bytes] = {}  # Frames repeat, so encode each once
+
+        def write(text: str) -> None:
+            data = encoded.get(text)
+            if data is None:
+                data = encoded[text] = text.encode(encoding, "replace")
+            os.write(fd, data)
+        return write
+
     def _spin(self):
+        if self._stop.wait(self.START_DELAY):
+            return
+        write = self._make_writer()
+        message, lines = None, []
         idx = 0
         while not self._stop.is_set():
-            frame = self.FRAMES[idx % len(self.FRAMES)]
-            sys.stderr.write(f"\r  {self.message}{frame}   ")
-            sys.stderr.flush()
+            # Rebuild the formatted frames only when update() changes the message
+            if self.message is not message:
+                message = self.message
+                lines = [f"\r  {message}{frame}   " for frame in self.FRAMES]
+            write(lines[idx % len(lines)])
             idx += 1
             self._stop.wait(self.INTERVAL)
         # Clear the spinner line
-        sys.stderr.write(f"\r{' ' * (len(self.message) + 12)}\r")
-        sys.stderr.flush()
+        write(f"\r{' ' * (len(self.message) + 12)}\r")
 
     def __enter__(self):
         self._thread = threading.Thread(target=self._spin, daemon=True)
         self._thread.start()
+        # Clear the line even if the interpreter exits mid-operation
+        atexit.register(self.stop)
         return self
 
     def __exit__(self, *args):
+        self.stop()
+
+    def stop(self):
+        """Stop and clear the spinner; safe to call more than once."""
         self._stop.set()
-        self._thread.join()
+        if self._thread is not None:
+            self._thread.join()
+            atexit.unregister(self.stop)
 
     def update(self, message: str):
         """Update the spinner message mid-operation."""
@@ -21,11 +21,25 @@ from src.content.pack_loader import PackLoader
 from src.content.retriever import LoreRetriever
 from src.content.scene_cache import SceneLoreCacheManager
 from src.content.session_manager import SessionManager
-from src.content.vector_store import create_vector_store
+from src.content.vector_store import create_vector_store, vector_store_path
 from src.core.orchestrator import Orchestrator
-from src.db.state_store import StateStore
-from src.llm.gateway import ClaudeGateway
-from src.llm.prompt_registry import PromptRegistry
+
+
+_QUIT_COMMANDS = frozenset({'quit', 'exit', 'q', '/quit'})
+
+_api_key: Optional[str] = None
+
+
+def _get_api_key() -> Optional[str]:
+    """Resolve the API key once per process, prompting if none is stored.
+
+    Only a found key is kept, so a declined prompt is offered again on the
+    next vibe-check run in the same process.
+    """
+    global _api_key
+    if _api_key is None:
+        _api_key = check_auth_or_prompt()
+    return _api_key
 
 
 def _format_lore_panel(scene_cache, campaign_id: str, scene_id: str) -> str:
@@ -37,54 +51,44 @@ def _format_lore_panel(scene_cache, campaign_id: str, scene_id: str) -> str:
     if not lore:
         return ""
 
-    lines = ["─── lore retrieved ───"]
+    entries = [
+        (chunk.get("type", default_type), chunk.get("title", default_title), _chunk_tokens(chunk))
+        for chunk, default_type, default_title in _iter_lore_chunks(lore)
+    ]
 
-    total_tokens = 0
-    chunk_count = 0
-
-    # Location lore
-    location_chunks = lore.get("location_chunks", [])
-    for chunk in location_chunks:
-        chunk_type = chunk.get("type", "lore")
-        title = chunk.get("title", "Untitled")
-        tokens = chunk.get("token_count", len(chunk.get("content", "")) // 4)
-        lines.append(f"  [{chunk_type}] {title} ({tokens} tokens)")
-        total_tokens += tokens
-        chunk_count += 1
-
-    # Thread lore
-    thread_chunks = lore.get("thread_chunks", [])
-    for chunk in thread_chunks:
-        chunk_type = chunk.get("type", "lore")
-        title = chunk.get("title", "Untitled")
-        tokens = chunk.get("token_count", len(chunk.get("content", "")) // 4)
-        lines.append(f"  [{chunk_type}] {title} ({tokens} tokens)")
-        total_tokens += tokens
-        chunk_count += 1
-
-    # NPC briefings
-    npc_briefings = lore.get("npc_briefings", {})
-    for npc_id, briefing in npc_briefings.items():
-        chunks = briefing.get("chunks", [])
-        for chunk in chunks:
-            chunk_type = chunk.get("type", "npc")
-            title = chunk.get("title", npc_id)
-            tokens = chunk.get("token_count", len(chunk.get("content", "")) // 4)
-            lines.append(f"  [{chunk_type}] {title} ({tokens} tokens)")
-            total_tokens += tokens
-            chunk_count += 1
-
-    if chunk_count > 0:
-        lines.append(f"  Total: {total_tokens} tokens from {chunk_count} chunks")
+    lines = ["─── lore retrieved ───"]
+    lines.extend(f"  [{chunk_type}] {title} ({tokens} tokens)" for chunk_type, title, tokens in entries)
+    if entries:
+        total_tokens = sum(tokens for _, _, tokens in entries)
+        lines.append(f"  Total: {total_tokens} tokens from {len(entries)} chunks")
     else:
         lines.append("  (no lore chunks retrieved)")
-
     lines.append("──────────────────────")
     return "\n".join(lines)
 
 
+def _iter_lore_chunks(lore: dict):
+    """Yield (chunk, default_type, default_title) for location, thread, then NPC lore."""
+    for chunk in lore.get("location_chunks", []):
+        yield chunk, "lore", "Untitled"
+    for chunk in lore.get("thread_chunks", []):
+        yield chunk, "lore", "Untitled"
+    for npc_id, briefing in lore.get("npc_briefings", {}).items():
+        for chunk in briefing.get("chunks", []):
+            yield chunk, "npc", npc_id
+
+
+def _chunk_tokens(chunk: dict) -> int:
+    """Token count for a chunk, estimated from its content only when not stored."""
+    tokens = chunk.get("token_count")
+    if tokens is None:
+        tokens = len(chunk.get("content", "")) // 4
+    return tokens
+
+
 def vibe_check_cmd(args):
     """Run vibe check mode for content pack testing."""
+    from src.cli.main import _get_gateway, _get_initialized_store, _get_prompt_registry
     from src.cli.spinner import Spinner
 
     pack_path = Path(args.pack)
@@ -93,7 +97,7 @@ def vibe_check_cmd(args):
         sys.exit(1)
 
     # Check for API key
-    api_key = check_auth_or_prompt()
+    api_key = _get_api_key()
     if not api_key:
         print("\n  Cannot run vibe-check without an API key.")
         print("  Run 'login' to set one up, or set ANTHROPIC_API_KEY environment variable.")
@@ -113,14 +117,13 @@ def vibe_check_cmd(args):
     print()
 
     # Initialize database
-    store = StateStore(db_path)
-    store.ensure_schema()
+    store = _get_initialized_store(db_path)
 
     # Load and install the content pack
     print("Loading content pack...")
     loader = PackLoader()
     chunker = Chunker()
-    vector_store = create_vector_store()
+    vector_store = create_vector_store(vector_store_path(db_path))
     indexer = LoreIndexer(store, vector_store)
 
     try:
@@ -171,9 +174,8 @@ def vibe_check_cmd(args):
     )
 
     # Setup LLM and orchestrator
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    prompt_registry = PromptRegistry(prompts_dir)
-    gateway = ClaudeGateway(api_key=api_key)
+    prompt_registry = _get_prompt_registry()
+    gateway = _get_gateway(api_key)
 
     # Setup content pack components
     lore_retriever = LoreRetriever(store, vector_store, entity_manifest={})
@@ -229,13 +231,14 @@ def vibe_check_cmd(args):
         if not user_input:
             continue
 
-        if user_input.lower() in ['quit', 'exit', 'q', '/quit']:
+        command = user_input.lower()
+        if command in _QUIT_COMMANDS:
             if session_mgr and active_session:
                 session_mgr.end_session(active_session["id"])
             print("Goodbye!")
             break
 
-        if user_input.lower() == '/lore':
+        if command == '/lore':
             lore_panel = _format_lore_panel(scene_cache, campaign_id, current_scene_id)
             if lore_panel:
                 print(lore_panel)
@@ -243,7 +246,7 @@ def vibe_check_cmd(args):
                 print("No lore retrieved yet.")
             continue
 
-        if user_input.lower() == '/verbose':
+        if command == '/verbose':
             verbose = not verbose
             print(f"Verbose mode: {'on' if verbose else 'off'}")
             continue
@@ -262,9 +265,8 @@ def vibe_check_cmd(args):
             print(f"\n{result.final_text}\n")
 
             # Update current scene for lore tracking
-            scene = store.get_scene()
-            if scene:
-                current_scene_id = scene.get("location_id", current_scene_id)
+            if result.scene_id:
+                current_scene_id = result.scene_id
 
             # Show lore panel in verbose mode
             if verbose:
@@ -4,19 +4,34 @@ Configuration management for Freeform RPG.
 Handles API key storage and retrieval with interactive login flow.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Optional
+
+# (config path, st_mtime_ns, parsed config) from the last load or save
+_config_cache: tuple[Path, int, dict] | None = None
 
 
 def get_config_dir() -> Path:
     """Get the configuration directory, creating it if needed."""
     # Use XDG_CONFIG_HOME if set, otherwise ~/.config
     config_home = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
-    config_dir = Path(config_home) / "freeform-rpg"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return _ensure_dir(Path(config_home) / "freeform-rpg")
+
+
+@functools.lru_cache(maxsize=8)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process; later calls skip the mkdir."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory, creating it if needed."""
+    # Use XDG_CACHE_HOME if set, otherwise ~/.cache
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return _ensure_dir(Path(cache_home) / "freeform-rpg")
 
 
 def get_config_path() -> Path:
@@ -25,27 +40,40 @@ def get_config_path() -> Path:
 
 
 def load_config() -> dict:
-    """Load configuration from disk."""
+    """Load configuration from disk.
+
+    The parsed file is cached and reused until its mtime changes; callers
+    get their own copy, so mutating it before save_config() is safe.
+    """
+    global _config_cache
     config_path = get_config_path()
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _config_cache is not None and _config_cache[:2] == (config_path, mtime):
+        return dict(_config_cache[2])
+    try:
+        with open(config_path) as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
+    _config_cache = (config_path, mtime, config)
+    return dict(config)
 
 
 def save_config(config: dict) -> None:
     """Save configuration to disk."""
+    global _config_cache
     config_path = get_config_path()
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
     # Secure the file (owner read/write only)
     os.chmod(config_path, 0o600)
+    _config_cache = (config_path, config_path.stat().st_mtime_ns, dict(config))
 
 
-def get_api_key() -> Optional[str]:
+def get_api_key() -> str | None:
     """
     Get the Anthropic API key from config or environment.
 
@@ -176,7 +204,7 @@ def interactive_login() -> bool:
         return False
 
 
-def check_auth_or_prompt() -> Optional[str]:
+def check_auth_or_prompt() -> str | None:
     """
     Check for API key, prompting for login if not found.
 
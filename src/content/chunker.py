@@ -14,8 +14,13 @@ from typing import Optional
 
 from .pack_loader import ContentFile
 
+# H1/H2 header lines; [^\S\n] keeps the match on one line, like \s did per line
+_SECTION_HEADER_RE = re.compile(r"^(#{1,2})[^\S\n]+(.+)$", re.MULTILINE)
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s_-]")
+_SLUG_COLLAPSE_RE = re.compile(r"[\s_-]+")
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentChunk:
     """A single indexed chunk of content."""
     id: str  # {pack_id}:{file_id}:{section_slug}
@@ -24,8 +29,9 @@ class ContentChunk:
     section_title: str
     content: str
     chunk_type: str  # location, npc, faction, culture, item, general
-    entity_refs: list[str] = field(default_factory=list)
-    tags: list[str] = field(default_factory=list)
+    # Shared by every chunk of a file, so kept immutable
+    entity_refs: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
     metadata: dict = field(default_factory=dict)
     token_estimate: int = 0
 
@@ -53,8 +59,8 @@ class Chunker:
         if content_file.entity_id:
             entity_refs.append(content_file.entity_id)
         # Deduplicate
-        entity_refs = list(dict.fromkeys(entity_refs))
-        base_tags = list(dict.fromkeys(base_tags))
+        entity_refs = tuple(dict.fromkeys(entity_refs))
+        base_tags = tuple(dict.fromkeys(base_tags))
 
         for section in sections:
             section_slug = _slugify(section["title"]) if section["title"] else "overview"
@@ -78,8 +84,8 @@ class Chunker:
                 section_title=section["title"] or content_file.title,
                 content=content,
                 chunk_type=content_file.file_type,
-                entity_refs=entity_refs.copy(),
-                tags=base_tags.copy(),
+                entity_refs=entity_refs,
+                tags=base_tags,
                 metadata=metadata,
                 token_estimate=estimate_tokens(content)
             )
@@ -100,16 +106,22 @@ class Chunker:
 
 
 def estimate_tokens(text: str) -> int:
-    """Rough token estimate: ~0.75 tokens per word for English text."""
-    word_count = len(text.split())
+    """Rough token estimate: ~0.75 tokens per word for English text.
+
+    Words are approximated by counting space and newline separators,
+    which avoids building the list text.split() would allocate.
+    """
+    if not text:
+        return 0
+    word_count = text.count(" ") + text.count("\n") + 1
     return int(word_count * 1.33)
 
 
 def _slugify(text: str) -> str:
     """Convert text to a slug suitable for chunk IDs."""
     slug = text.lower().strip()
-    slug = re.sub(r"[^a-z0-9\s_-]", "", slug)
-    slug = re.sub(r"[\s_-]+", "_", slug)
+    slug = _SLUG_STRIP_RE.sub("", slug)
+    slug = _SLUG_COLLAPSE_RE.sub("_", slug)
     return slug.strip("_") or "untitled"
 
 
@@ -120,41 +132,32 @@ def _split_by_headers(body: str) -> list[dict]:
 
     Returns list of {"title": str, "content": str, "level": int}.
     """
-    lines = body.split("\n")
     sections = []
     current_title = ""
     current_level = 0
-    current_lines = []
-
-    for line in lines:
-        header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-
-        if header_match:
-            level = len(header_match.group(1))
-            title = header_match.group(2).strip()
-
-            if level <= 2:
-                # H1 or H2: start a new section
-                if current_lines or current_title:
-                    sections.append({
-                        "title": current_title,
-                        "content": "\n".join(current_lines),
-                        "level": current_level
-                    })
-                current_title = title
-                current_level = level
-                current_lines = []
-            else:
-                # H3+: merge into current section (include the header line)
-                current_lines.append(line)
-        else:
-            current_lines.append(line)
-
-    # Flush remaining content
-    if current_lines or current_title:
+    start = 0  # Offset where the current section's content begins
+
+    # Slice each section out of body between H1/H2 header lines, rather
+    # than splitting into lines and re-joining them
+    for match in _SECTION_HEADER_RE.finditer(body):
+        end = match.start()
+        if start < end or current_title:
+            sections.append({
+                "title": current_title,
+                # Drop the newline that ends the line before the header
+                "content": body[start:end - 1] if start < end else "",
+                "level": current_level
+            })
+        current_title = match.group(2).strip()
+        current_level = len(match.group(1))
+        start = match.end() + 1
+
+    # Flush remaining content (start is past the end only when the body
+    # ends on a header line with no trailing newline)
+    if start <= len(body) or current_title:
         sections.append({
             "title": current_title,
-            "content": "\n".join(current_lines),
+            "content": body[start:],
             "level": current_level
         })
 
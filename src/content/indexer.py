@@ -17,7 +17,7 @@ from .vector_store import VectorStore, NullVectorStore
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexStats:
     """Statistics from an indexing operation."""
     pack_id: str
@@ -64,22 +64,23 @@ class LoreIndexer:
             }
         )
 
-        # Insert chunks into SQLite + FTS5
-        fts_count = 0
-        for chunk in chunks:
-            self.store.insert_pack_chunk(
-                chunk_id=chunk.id,
-                pack_id=chunk.pack_id,
-                file_path=chunk.file_path,
-                section_title=chunk.section_title,
-                content=chunk.content,
-                chunk_type=chunk.chunk_type,
-                entity_refs=chunk.entity_refs,
-                tags=chunk.tags,
-                metadata=chunk.metadata,
-                token_estimate=chunk.token_estimate
-            )
-            fts_count += 1
+        # Insert chunks into SQLite + FTS5 in a single transaction
+        self.store.insert_pack_chunks([
+            {
+                "chunk_id": chunk.id,
+                "pack_id": chunk.pack_id,
+                "file_path": chunk.file_path,
+                "section_title": chunk.section_title,
+                "content": chunk.content,
+                "chunk_type": chunk.chunk_type,
+                "entity_refs": chunk.entity_refs,
+                "tags": chunk.tags,
+                "metadata": chunk.metadata,
+                "token_estimate": chunk.token_estimate,
+            }
+            for chunk in chunks
+        ])
+        fts_count = len(chunks)
 
         # Index into vector store
         vector_count = self.vector.add_chunks(chunks, collection=pack_id)
@@ -107,19 +108,14 @@ class LoreIndexer:
 
         # Clear existing FTS entries for this pack
         with self.store.connect() as conn:
-            # Get existing chunk IDs
-            rows = conn.execute(
-                "SELECT id FROM pack_chunks WHERE pack_id = ?",
+            # Delete from FTS5 (must run before its pack_chunks rows go)
+            conn.execute(
+                """
+                DELETE FROM pack_chunks_fts WHERE chunk_id IN
+                    (SELECT id FROM pack_chunks WHERE pack_id = ?)
+                """,
                 (pack_id,)
-            ).fetchall()
-            old_ids = [row["id"] for row in rows]
-
-            # Delete from FTS5
-            for cid in old_ids:
-                conn.execute(
-                    "DELETE FROM pack_chunks_fts WHERE chunk_id = ?",
-                    (cid,)
-                )
+            )
 
             # Delete from pack_chunks
             conn.execute(
@@ -10,14 +10,16 @@ A content pack is a directory with:
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-import yaml
+# re.match anchors at the start, so only an H1 on the body's first line counts
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
 
 
-@dataclass
+@dataclass(slots=True)
 class PackManifest:
     """Parsed content pack manifest."""
     id: str
@@ -31,7 +33,7 @@ class PackManifest:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentFile:
     """A parsed markdown content file with frontmatter."""
     path: str
@@ -42,7 +44,7 @@ class ContentFile:
     entity_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of pack validation."""
     valid: bool
@@ -162,7 +164,7 @@ class PackLoader:
         # Derive title: frontmatter > first H1 > filename
         title = frontmatter.get("title", "")
         if not title:
-            h1_match = re.match(r"^#\s+(.+)$", body, re.MULTILINE)
+            h1_match = _H1_RE.match(body)
             if h1_match:
                 title = h1_match.group(1).strip()
             else:
@@ -186,7 +188,7 @@ class PackLoader:
 
     def _parse_manifest(self, manifest_path: Path) -> PackManifest:
         """Parse a pack.yaml manifest file."""
-        data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+        data = _yaml_load(manifest_path.read_text(encoding="utf-8"))
         if not isinstance(data, dict):
             raise ValueError("pack.yaml must be a YAML mapping")
 
@@ -212,23 +214,26 @@ class PackLoader:
         pack_id: str
     ) -> list[ContentFile]:
         """Scan all content files in a pack directory."""
-        files = []
+        paths = []
+        file_types = []
 
         for subdir_name, file_type in TYPE_DIRS.items():
             subdir = pack_dir / subdir_name
             if subdir.is_dir():
                 for md_file in sorted(subdir.glob("*.md")):
-                    cf = self.parse_content_file(md_file, file_type)
-                    files.append(cf)
+                    paths.append(md_file)
+                    file_types.append(file_type)
 
         # Root-level .md files (general type)
         for md_file in sorted(pack_dir.glob("*.md")):
             if md_file.name in ("README.md",):
                 continue
-            cf = self.parse_content_file(md_file, "general")
-            files.append(cf)
+            paths.append(md_file)
+            file_types.append("general")
 
-        return files
+        # Overlap the file reads; map keeps the scan order
+        with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as pool:
+            return list(pool.map(self.parse_content_file, paths, file_types))
 
 
 def _split_frontmatter(raw: str) -> tuple[dict, str]:
@@ -240,9 +245,38 @@ def _split_frontmatter(raw: str) -> tuple[dict, str]:
         parts = raw.split("---", 2)
         if len(parts) >= 3:
             try:
-                fm = yaml.safe_load(parts[1]) or {}
+                fm = _yaml_load(parts[1]) or {}
                 body = parts[2].strip()
                 return fm, body
-            except yaml.YAMLError:
+            except _YAML_ERROR:
                 pass
     return {}, raw.strip()
+
+
+# Resolved by the first _yaml_load(). Until then _YAML_ERROR is an empty
+# tuple, which an except clause accepts and never matches.
+_YAML_LOADER = None
+_YAML_ERROR: type | tuple = ()
+
+
+def _yaml_load(text: str):
+    """Parse YAML with libyaml's C loader when PyYAML was built with it.
+
+    yaml is imported on first use rather than at module level: the
+    retriever and vector store import this module (via the chunker) only
+    for its dataclasses, and shouldn't pay for PyYAML unless a pack is
+    parsed.
+    """
+    global _YAML_LOADER, _YAML_ERROR
+    if _YAML_LOADER is None:
+        import yaml
+
+        _YAML_ERROR = yaml.YAMLError
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # What yaml.load() does, minus the per-call attribute lookups
+    loader = _YAML_LOADER(text)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
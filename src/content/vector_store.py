@@ -3,7 +3,9 @@
 Provides ChromaDB integration when available, with NullVectorStore fallback.
 """
 
+import importlib.util
 import logging
+from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 from .chunker import ContentChunk
@@ -54,21 +56,65 @@ class NullVectorStore:
 
 
 class ChromaVectorStore:
-    """ChromaDB-backed vector store for semantic similarity search."""
+    """ChromaDB-backed vector store for semantic similarity search.
 
-    def __init__(self, persist_directory: str | None = None):
-        import chromadb
+    Chunks are upserted in batches of ``batch_size`` so Chroma embeds each
+    batch in one pass; the size is capped at the client's maximum batch
+    size, which Chroma enforces on every upsert.
 
-        if persist_directory:
-            self.client = chromadb.PersistentClient(path=persist_directory)
-        else:
-            self.client = chromadb.Client()
+    The Chroma client (and with it chromadb's import and the on-disk
+    index) is opened on first use, so a play session that never reaches
+    a semantic query does not pay for loading it. If the client cannot be
+    created (chromadb fails to import or initialise, e.g. on an sqlite3
+    that is too old), the store logs a warning once and then behaves like
+    NullVectorStore, leaving retrieval to FTS5.
+    """
+
+    DEFAULT_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        persist_directory: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        if importlib.util.find_spec("chromadb") is None:
+            raise ImportError("chromadb is not installed")
+
+        self.persist_directory = persist_directory
+        self.batch_size = max(1, batch_size)
+        self._client = None
+        self._client_failed = False
+
+    @property
+    def client(self):
+        """The Chroma client, created on first access; None if it failed."""
+        if self._client is None and not self._client_failed:
+            try:
+                import chromadb
+
+                if self.persist_directory:
+                    client = chromadb.PersistentClient(path=self.persist_directory)
+                else:
+                    client = chromadb.Client()
+            except Exception as e:
+                logger.warning("ChromaDB init failed (%s); using FTS5-only retrieval", e)
+                self._client_failed = True
+                return None
+
+            get_max = getattr(client, "get_max_batch_size", None)
+            if get_max is not None:
+                self.batch_size = max(1, min(self.batch_size, get_max()))
+            self._client = client
+        return self._client
 
     def add_chunks(self, chunks: list[ContentChunk], collection: str) -> int:
         if not chunks:
             return 0
+        client = self.client
+        if client is None:
+            return 0
 
-        coll = self.client.get_or_create_collection(
+        coll = client.get_or_create_collection(
             name=collection,
             metadata={"hnsw:space": "cosine"}
         )
@@ -87,7 +133,14 @@ class ChromaVectorStore:
             for c in chunks
         ]
 
-        coll.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        step = self.batch_size
+        for start in range(0, len(chunks), step):
+            end = start + step
+            coll.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+            )
         return len(chunks)
 
     def query(
@@ -97,8 +150,11 @@ class ChromaVectorStore:
         n_results: int = 10,
         where: dict | None = None
     ) -> list[dict]:
+        client = self.client
+        if client is None:
+            return []
         try:
-            coll = self.client.get_collection(collection)
+            coll = client.get_collection(collection)
         except Exception:
             return []
 
@@ -120,12 +176,27 @@ class ChromaVectorStore:
         return output
 
     def delete_collection(self, collection: str) -> None:
+        client = self.client
+        if client is None:
+            return
         try:
-            self.client.delete_collection(collection)
+            client.delete_collection(collection)
         except Exception:
             pass
 
 
+def vector_store_path(db_path: str | Path) -> str | None:
+    """Directory for the persistent vector index that belongs to a database.
+
+    The index lives next to the SQLite file (game.db -> game.vectors) so
+    embeddings built by install-pack are reused by play instead of being
+    rebuilt in memory every run. In-memory databases get no directory.
+    """
+    if str(db_path) == ":memory:":
+        return None
+    return str(Path(db_path).with_suffix(".vectors"))
+
+
 def create_vector_store(persist_directory: str | None = None) -> VectorStore:
     """Factory: create ChromaVectorStore if available, else NullVectorStore."""
     try:
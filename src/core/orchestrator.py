@@ -36,6 +36,7 @@ class TurnResult:
     suggested_actions: list = field(default_factory=list)
     clock_deltas: list = field(default_factory=list)
     debug_info: dict = field(default_factory=dict)
+    scene_id: Optional[str] = None  # New location_id if the turn changed scene
 
     def to_dict(self) -> dict:
         return {
@@ -67,12 +68,15 @@ class Orchestrator:
         lore_retriever=None,
         scene_cache=None,
         session_manager=None,
-        pack_ids: Optional[list] = None
+        pack_ids: Optional[list] = None,
+        on_text: Optional[Callable[[str], None]] = None
     ):
         self.store = state_store
         self.gateway = llm_gateway
         self.prompts = prompt_registry
         self.on_stage = on_stage
+        # Receives narrator prose as it streams (gateways that can't stream ignore it)
+        self.on_text = on_text
 
         # Optional content pack components (None = v0 behavior)
         self.lore_retriever = lore_retriever
@@ -390,13 +394,20 @@ class Orchestrator:
                     "planner_output": planner_output,
                     "blocked_actions": validator_output.get("blocked_actions", [])
                 },
-                schema=schema
+                schema=schema,
+                options=self._narrator_options()
             )
             return response.content
         except Exception as e:
             print(f"[engine] Narrator LLM failed ({type(e).__name__}: {e}), using stub", file=sys.stderr)
             return self._stub_narrator_output(resolver_output)
 
+    def _narrator_options(self) -> Optional[dict]:
+        """Gateway options that stream the narrator's final_text to on_text."""
+        if not self.on_text:
+            return None
+        return {"stream_field": "final_text", "on_text": self.on_text}
+
     def _stub_interpreter_output(self, context_packet: dict) -> dict:
         """Generate stub interpreter output for testing."""
         player_input = context_packet.get("player_input", "")
@@ -769,7 +780,8 @@ class Orchestrator:
             clarification_needed=False,
             clarification_question="",
             suggested_actions=narrator_output.get("suggested_actions", []),
-            clock_deltas=clock_deltas or []
+            clock_deltas=clock_deltas or [],
+            scene_id=scene_transition["location_id"] if scene_transition else None
         )
 
 
@@ -6,11 +6,17 @@ Provides CRUD operations for all game state tables with JSON serialization.
 
 import json
 import sqlite3
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works the same
+    orjson = None
+
 
 class StateStore:
     """
@@ -19,21 +25,63 @@ class StateStore:
     All JSON fields are automatically serialized/deserialized.
     """
 
-    def __init__(self, db_path: str | Path):
+    def __init__(self, db_path: str | Path, readonly: bool = False):
+        """
+        Args:
+            db_path: SQLite database file
+            readonly: Open every connection with mode=ro, for readers such
+                as replay that must never write or take the write lock
+        """
         self.db_path = Path(db_path)
+        self.readonly = readonly
+        self._local = threading.local()
 
     def connect(self) -> sqlite3.Connection:
-        """Create a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+        """Create a new database connection with row factory.
+
+        The caller owns the returned connection. Store methods use a
+        per-thread connection from _connection() instead.
+        """
+        if self.readonly:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        # In WAL mode NORMAL only syncs at checkpoints, not on every commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's long-lived connection, opening it on first use.
+
+        Store methods run many small queries per turn; reusing one
+        connection per thread skips the open and pragma setup on each call.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.connect()
         return conn
 
+    def close(self) -> None:
+        """Close this thread's cached connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def ensure_schema(self) -> None:
-        """Initialize database schema from schema.sql, then apply v1 additions."""
+        """Initialize database schema from schema.sql, then apply v1 additions.
+
+        Also switches the database to WAL journaling. The mode is stored in
+        the file, so it sticks for every later connection.
+        """
         schema_path = Path(__file__).with_name("schema.sql")
         sql = schema_path.read_text(encoding="utf-8")
-        with self.connect() as conn:
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(sql)
             conn.commit()
         self.ensure_schema_v1()
@@ -45,7 +93,7 @@ class StateStore:
         """
         schema_path = Path(__file__).with_name("schema_v1.sql")
         sql = schema_path.read_text(encoding="utf-8")
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.executescript(sql)
             conn.commit()
 
@@ -66,7 +114,7 @@ class StateStore:
             ("campaigns", "pack_ids_json", "TEXT DEFAULT '[]'"),
             ("campaigns", "lore_manifest_json", "TEXT DEFAULT '{}'"),
         ]
-        with self.connect() as conn:
+        with self._connection() as conn:
             for table, column, col_type in alter_statements:
                 try:
                     conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}")
@@ -89,7 +137,7 @@ class StateStore:
     ) -> dict:
         """Create a new campaign."""
         now = datetime.utcnow().isoformat()
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO campaigns (id, name, created_at, updated_at,
@@ -117,7 +165,7 @@ class StateStore:
         manifest: dict
     ) -> None:
         """Store the entity→chunk_ids lore manifest for a campaign."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 "UPDATE campaigns SET lore_manifest_json = ? WHERE id = ?",
                 (json_dumps(manifest), campaign_id)
@@ -126,7 +174,7 @@ class StateStore:
 
     def get_campaign(self, campaign_id: str) -> Optional[dict]:
         """Get campaign by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM campaigns WHERE id = ?",
                 (campaign_id,)
@@ -165,7 +213,7 @@ class StateStore:
             params.append(datetime.utcnow().isoformat())
             params.append(campaign_id)
 
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     f"UPDATE campaigns SET {', '.join(updates)} WHERE id = ?",
                     params
@@ -174,7 +222,7 @@ class StateStore:
 
     def list_campaigns(self) -> list[dict]:
         """List all campaigns, most recently updated first."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM campaigns ORDER BY updated_at DESC"
             ).fetchall()
@@ -193,7 +241,7 @@ class StateStore:
         tags: Optional[list] = None
     ) -> dict:
         """Create a new entity."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO entities (id, type, name, attrs_json, tags)
@@ -212,7 +260,7 @@ class StateStore:
 
     def get_entity(self, entity_id: str) -> Optional[dict]:
         """Get entity by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM entities WHERE id = ?",
                 (entity_id,)
@@ -223,7 +271,7 @@ class StateStore:
 
     def get_entities_by_type(self, entity_type: str) -> list[dict]:
         """Get all entities of a given type."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM entities WHERE type = ?",
                 (entity_type,)
@@ -235,7 +283,7 @@ class StateStore:
         if not entity_ids:
             return []
         placeholders = ",".join("?" * len(entity_ids))
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 f"SELECT * FROM entities WHERE id IN ({placeholders})",
                 entity_ids
@@ -265,7 +313,7 @@ class StateStore:
 
         if updates:
             params.append(entity_id)
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     f"UPDATE entities SET {', '.join(updates)} WHERE id = ?",
                     params
@@ -274,7 +322,7 @@ class StateStore:
 
     def delete_entity(self, entity_id: str) -> None:
         """Delete an entity."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute("DELETE FROM entities WHERE id = ?", (entity_id,))
             conn.commit()
 
@@ -295,7 +343,7 @@ class StateStore:
         discovery_method: Optional[str] = None
     ) -> dict:
         """Create a new fact."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO facts (id, subject_id, predicate, object_json,
@@ -319,7 +367,7 @@ class StateStore:
 
     def get_fact(self, fact_id: str) -> Optional[dict]:
         """Get fact by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM facts WHERE id = ?",
                 (fact_id,)
@@ -330,7 +378,7 @@ class StateStore:
 
     def get_facts_for_subject(self, subject_id: str) -> list[dict]:
         """Get all facts about a subject."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM facts WHERE subject_id = ?",
                 (subject_id,)
@@ -339,7 +387,7 @@ class StateStore:
 
     def get_facts_by_visibility(self, visibility: str) -> list[dict]:
         """Get all facts with a given visibility."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM facts WHERE visibility = ?",
                 (visibility,)
@@ -348,7 +396,7 @@ class StateStore:
 
     def get_known_facts(self) -> list[dict]:
         """Get all facts known to the player."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM facts WHERE visibility = 'known'"
             ).fetchall()
@@ -385,7 +433,7 @@ class StateStore:
 
         if updates:
             params.append(fact_id)
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     f"UPDATE facts SET {', '.join(updates)} WHERE id = ?",
                     params
@@ -420,7 +468,7 @@ class StateStore:
         tags: Optional[list] = None
     ) -> dict:
         """Create a new clock."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO clocks (id, name, value, max, triggers_json, tags)
@@ -440,7 +488,7 @@ class StateStore:
 
     def get_clock(self, clock_id: str) -> Optional[dict]:
         """Get clock by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM clocks WHERE id = ?",
                 (clock_id,)
@@ -451,7 +499,7 @@ class StateStore:
 
     def get_clock_by_name(self, name: str) -> Optional[dict]:
         """Get clock by name (case-insensitive)."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM clocks WHERE LOWER(name) = LOWER(?)",
                 (name,)
@@ -462,7 +510,7 @@ class StateStore:
 
     def get_all_clocks(self) -> list[dict]:
         """Get all clocks."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute("SELECT * FROM clocks").fetchall()
         return [_parse_clock_row(row) for row in rows]
 
@@ -507,7 +555,7 @@ class StateStore:
 
         if updates:
             params.append(clock_id)
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     f"UPDATE clocks SET {', '.join(updates)} WHERE id = ?",
                     params
@@ -543,7 +591,7 @@ class StateStore:
 
     def get_scene(self, scene_id: str = "current") -> Optional[dict]:
         """Get scene by ID (default: 'current')."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM scene WHERE id = ?",
                 (scene_id,)
@@ -564,7 +612,7 @@ class StateStore:
         scene_id: str = "current"
     ) -> dict:
         """Set or update the current scene."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO scene (id, location_id, present_entity_ids_json,
@@ -592,7 +640,7 @@ class StateStore:
         scene_id: str = "current"
     ) -> None:
         """Update which entities are present in the scene."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 "UPDATE scene SET present_entity_ids_json = ? WHERE id = ?",
                 (json_dumps(present_entity_ids), scene_id)
@@ -601,7 +649,7 @@ class StateStore:
 
     def update_scene_time(self, time_dict: dict, scene_id: str = "current") -> None:
         """Update the time component of the current scene."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 "UPDATE scene SET time_json = ? WHERE id = ?",
                 (json_dumps(time_dict), scene_id)
@@ -622,7 +670,7 @@ class StateStore:
         tags: Optional[list] = None
     ) -> dict:
         """Create a new thread."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO threads (id, title, status, stakes_json,
@@ -643,7 +691,7 @@ class StateStore:
 
     def get_thread(self, thread_id: str) -> Optional[dict]:
         """Get thread by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM threads WHERE id = ?",
                 (thread_id,)
@@ -654,7 +702,7 @@ class StateStore:
 
     def get_active_threads(self) -> list[dict]:
         """Get all active threads."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM threads WHERE status = 'active'"
             ).fetchall()
@@ -683,7 +731,7 @@ class StateStore:
 
         if updates:
             params.append(thread_id)
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     f"UPDATE threads SET {', '.join(updates)} WHERE id = ?",
                     params
@@ -702,7 +750,7 @@ class StateStore:
         flags: Optional[dict] = None
     ) -> dict:
         """Add or update inventory item."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO inventory (owner_id, item_id, qty, flags_json)
@@ -718,7 +766,7 @@ class StateStore:
 
     def get_inventory_item(self, owner_id: str, item_id: str) -> Optional[dict]:
         """Get a specific inventory item."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM inventory WHERE owner_id = ? AND item_id = ?",
                 (owner_id, item_id)
@@ -729,7 +777,7 @@ class StateStore:
 
     def get_inventory(self, owner_id: str) -> list[dict]:
         """Get all inventory for an owner."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM inventory WHERE owner_id = ?",
                 (owner_id,)
@@ -744,7 +792,7 @@ class StateStore:
 
         new_qty = item["qty"] - qty
         if new_qty <= 0:
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     "DELETE FROM inventory WHERE owner_id = ? AND item_id = ?",
                     (owner_id, item_id)
@@ -752,7 +800,7 @@ class StateStore:
                 conn.commit()
             return False
         else:
-            with self.connect() as conn:
+            with self._connection() as conn:
                 conn.execute(
                     "UPDATE inventory SET qty = ? WHERE owner_id = ? AND item_id = ?",
                     (new_qty, owner_id, item_id)
@@ -773,7 +821,7 @@ class StateStore:
         notes: Optional[dict] = None
     ) -> dict:
         """Create or update a relationship."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO relationships (a_id, b_id, rel_type, intensity, notes_json)
@@ -794,7 +842,7 @@ class StateStore:
         rel_type: str
     ) -> Optional[dict]:
         """Get a specific relationship."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 """
                 SELECT * FROM relationships
@@ -808,7 +856,7 @@ class StateStore:
 
     def get_relationships_for_entity(self, entity_id: str) -> list[dict]:
         """Get all relationships involving an entity."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM relationships
@@ -831,7 +879,7 @@ class StateStore:
             return None
 
         new_intensity = rel["intensity"] + delta
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 UPDATE relationships SET intensity = ?
@@ -951,7 +999,7 @@ class StateStore:
     ) -> dict:
         """Create a new session."""
         started = started_at or datetime.utcnow().isoformat()
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO sessions (id, campaign_id, started_at)
@@ -964,7 +1012,7 @@ class StateStore:
 
     def get_session(self, session_id: str) -> Optional[dict]:
         """Get session by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM sessions WHERE id = ?",
                 (session_id,)
@@ -975,7 +1023,7 @@ class StateStore:
 
     def get_active_session(self, campaign_id: str) -> Optional[dict]:
         """Get the most recent session without an ended_at timestamp."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 """
                 SELECT * FROM sessions
@@ -996,7 +1044,7 @@ class StateStore:
     ) -> None:
         """End a session by setting ended_at and optional recap."""
         ended = ended_at or datetime.utcnow().isoformat()
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 UPDATE sessions SET ended_at = ?, recap_text = ?
@@ -1023,7 +1071,7 @@ class StateStore:
     ) -> dict:
         """Register a content pack."""
         now = datetime.utcnow().isoformat()
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO content_packs
@@ -1041,7 +1089,7 @@ class StateStore:
 
     def get_content_pack(self, pack_id: str) -> Optional[dict]:
         """Get content pack by ID."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM content_packs WHERE id = ?",
                 (pack_id,)
@@ -1052,7 +1100,7 @@ class StateStore:
 
     def list_content_packs(self) -> list[dict]:
         """List all installed content packs."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM content_packs ORDER BY installed_at DESC"
             ).fetchall()
@@ -1076,8 +1124,45 @@ class StateStore:
         token_estimate: int = 0
     ) -> None:
         """Insert a content chunk and its FTS5 index entry."""
-        with self.connect() as conn:
-            conn.execute(
+        self.insert_pack_chunks([{
+            "chunk_id": chunk_id,
+            "pack_id": pack_id,
+            "file_path": file_path,
+            "section_title": section_title,
+            "content": content,
+            "chunk_type": chunk_type,
+            "entity_refs": entity_refs,
+            "tags": tags,
+            "metadata": metadata,
+            "token_estimate": token_estimate,
+        }])
+
+    def insert_pack_chunks(self, chunks: list[dict]) -> None:
+        """Insert many content chunks and their FTS5 entries in one transaction.
+
+        Each dict takes the keyword arguments of insert_pack_chunk().
+        """
+        chunk_rows = []
+        fts_rows = []
+        for chunk in chunks:
+            chunk_type = chunk.get("chunk_type", "general")
+            tags = chunk.get("tags") or []
+            chunk_rows.append((
+                chunk["chunk_id"], chunk["pack_id"], chunk["file_path"],
+                chunk["section_title"], chunk["content"], chunk_type,
+                json_dumps(chunk.get("entity_refs") or []),
+                json_dumps(tags),
+                json_dumps(chunk.get("metadata") or {}),
+                chunk.get("token_estimate", 0)
+            ))
+            # Column 'body' avoids FTS5 content= conflict
+            fts_rows.append((
+                chunk["chunk_id"], chunk["section_title"], chunk["content"],
+                chunk_type, " ".join(tags)
+            ))
+
+        with self._connection() as conn:
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO pack_chunks
                     (id, pack_id, file_path, section_title, content,
@@ -1085,29 +1170,20 @@ class StateStore:
                      token_estimate)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    chunk_id, pack_id, file_path, section_title, content,
-                    chunk_type,
-                    json_dumps(entity_refs or []),
-                    json_dumps(tags or []),
-                    json_dumps(metadata or {}),
-                    token_estimate
-                )
+                chunk_rows
             )
-            # Insert into FTS5 index (column 'body' avoids FTS5 content= conflict)
-            tags_text = " ".join(tags or [])
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO pack_chunks_fts (chunk_id, section_title, body, chunk_type, tags)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (chunk_id, section_title, content, chunk_type, tags_text)
+                fts_rows
             )
             conn.commit()
 
     def get_pack_chunks(self, pack_id: str) -> list[dict]:
         """Get all chunks for a pack."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM pack_chunks WHERE pack_id = ? ORDER BY file_path, id",
                 (pack_id,)
@@ -1118,7 +1194,7 @@ class StateStore:
         """Fetch specific chunks by their IDs."""
         if not chunk_ids:
             return []
-        with self.connect() as conn:
+        with self._connection() as conn:
             placeholders = ",".join("?" * len(chunk_ids))
             rows = conn.execute(
                 f"SELECT * FROM pack_chunks WHERE id IN ({placeholders})",
@@ -1138,7 +1214,7 @@ class StateStore:
         Returns chunks matching the query, optionally filtered by pack_id
         and chunk_type.
         """
-        with self.connect() as conn:
+        with self._connection() as conn:
             # Get matching chunk IDs from FTS5
             fts_rows = conn.execute(
                 """
@@ -1191,7 +1267,7 @@ class StateStore:
     ) -> dict:
         """Set or replace the lore cache for a scene."""
         now = datetime.utcnow().isoformat()
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO scene_lore
@@ -1214,7 +1290,7 @@ class StateStore:
         scene_id: str = "current"
     ) -> Optional[dict]:
         """Get the lore cache for a scene."""
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 """
                 SELECT * FROM scene_lore
@@ -1232,7 +1308,7 @@ class StateStore:
     # =========================================================================
 
     def get_next_turn_no(self, campaign_id):
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT COALESCE(MAX(turn_no), 0) AS max_turn FROM events WHERE campaign_id = ?",
                 (campaign_id,),
@@ -1256,7 +1332,7 @@ class StateStore:
         if missing:
             raise ValueError(f"Missing event fields: {', '.join(missing)}")
 
-        with self.connect() as conn:
+        with self._connection() as conn:
             conn.execute(
                 """
                 INSERT INTO events (
@@ -1281,15 +1357,36 @@ class StateStore:
             conn.commit()
 
     def get_event(self, campaign_id, turn_no):
-        with self.connect() as conn:
+        with self._connection() as conn:
             row = conn.execute(
                 "SELECT * FROM events WHERE campaign_id = ? AND turn_no = ?",
                 (campaign_id, turn_no),
             ).fetchone()
         return dict(row) if row else None
 
+    def get_last_event(self, campaign_id):
+        """Get the most recent event for a campaign, or None."""
+        with self._connection() as conn:
+            row = conn.execute(
+                """
+                SELECT * FROM events WHERE campaign_id = ?
+                ORDER BY turn_no DESC LIMIT 1
+                """,
+                (campaign_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def count_events(self, campaign_id):
+        """Count the events recorded for a campaign."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n FROM events WHERE campaign_id = ?",
+                (campaign_id,),
+            ).fetchone()
+        return int(row["n"])
+
     def get_events_range(self, campaign_id, start_turn, end_turn):
-        with self.connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM events
@@ -1321,8 +1418,19 @@ def json_dumps(value: Any) -> str:
 
 
 def json_loads(value: str) -> Any:
-    """Deserialize JSON string to value."""
-    return json.loads(value) if value else None
+    """Deserialize JSON string to value (with orjson when it is installed).
+
+    orjson reads integers wider than 64 bits as floats; game state never
+    stores numbers that large.
+    """
+    if not value:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity, which only the stdlib accepts
+    return json.loads(value)
 
 
 def _parse_campaign_row(row: sqlite3.Row) -> dict:
@@ -9,9 +9,12 @@ from .evaluation import (
 )
 from .replay import (
     rerun_turns,
+    stream_turns,
+    summarize_replay_result,
     ab_test_turn,
     compare_prompt_versions,
     format_replay_report,
+    format_replay_entry,
     format_ab_report,
 )
 from .snapshots import (
@@ -32,9 +35,12 @@ __all__ = [
     "extract_metrics_from_turn",
     # Replay
     "rerun_turns",
+    "stream_turns",
+    "summarize_replay_result",
     "ab_test_turn",
     "compare_prompt_versions",
     "format_replay_report",
+    "format_replay_entry",
     "format_ab_report",
     # Snapshots
     "StateSnapshot",
@@ -344,135 +344,144 @@ class EvaluationTracker:
     def get_metrics_summary(self, campaign_id: str) -> dict:
         """Get summary of metrics for a campaign."""
         conn = self.store.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT metrics_json FROM eval_metrics
-            WHERE campaign_id = ?
-            ORDER BY turn_no
-        """, (campaign_id,))
-
-        rows = cursor.fetchall()
+        metrics_list = self._fetch_metrics(conn, campaign_id)
         conn.close()
-
-        if not rows:
-            return {"turns": 0, "summary": {}}
-
-        metrics_list = [json.loads(row[0]) for row in rows]
-
-        # Aggregate metrics
-        total_turns = len(metrics_list)
-        avg_latency = sum(m["timing"]["total_ms"] for m in metrics_list) / total_turns
-        total_clarifications = sum(1 for m in metrics_list if m["actions"]["clarification_needed"])
-        avg_narrative_length = sum(m["output"]["narrative_length"] for m in metrics_list) / total_turns
-
-        roll_outcomes = []
-        for m in metrics_list:
-            roll_outcomes.extend(m["rolls"]["outcomes"])
-
-        return {
-            "turns": total_turns,
-            "summary": {
-                "avg_latency_ms": round(avg_latency, 2),
-                "clarification_rate": round(total_clarifications / total_turns, 2),
-                "avg_narrative_length": round(avg_narrative_length, 0),
-                "roll_distribution": _count_outcomes(roll_outcomes),
-            }
-        }
+        return _summarize_metrics(metrics_list)
 
     def get_feedback_summary(self, campaign_id: str) -> dict:
         """Get summary of player feedback for a campaign."""
         conn = self.store.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT feedback_type, value, turn_no FROM eval_feedback
-            WHERE campaign_id = ?
-        """, (campaign_id,))
-
-        rows = cursor.fetchall()
+        rows = self._fetch_feedback(conn, campaign_id)
         conn.close()
-
-        if not rows:
-            return {"total": 0, "by_type": {}}
-
-        by_type = {}
-        for feedback_type, value, turn_no in rows:
-            if feedback_type not in by_type:
-                by_type[feedback_type] = []
-            by_type[feedback_type].append({"turn": turn_no, "value": value})
-
-        # Calculate sentiment
-        thumbs_up = len(by_type.get("thumbs_up", []))
-        thumbs_down = len(by_type.get("thumbs_down", []))
-        total_votes = thumbs_up + thumbs_down
-
-        return {
-            "total": len(rows),
-            "by_type": by_type,
-            "sentiment": {
-                "positive": thumbs_up,
-                "negative": thumbs_down,
-                "ratio": round(thumbs_up / total_votes, 2) if total_votes > 0 else None
-            }
-        }
+        return _summarize_feedback(rows)
 
     def get_problematic_turns(self, campaign_id: str) -> list:
         """Get turns that had issues (flags, low ratings, clarifications)."""
         conn = self.store.connect()
-        cursor = conn.cursor()
+        metrics_list = self._fetch_metrics(conn, campaign_id)
+        rows = self._fetch_feedback(conn, campaign_id)
+        conn.close()
+        return _find_problem_turns(metrics_list, rows)
 
-        # Get flagged turns
-        cursor.execute("""
-            SELECT turn_no, value FROM eval_feedback
-            WHERE campaign_id = ? AND feedback_type = 'flag_issue'
-        """, (campaign_id,))
-        flagged = [(row[0], row[1]) for row in cursor.fetchall()]
+    def get_report(self, campaign_id: str) -> tuple[dict, dict, list]:
+        """Get metrics summary, feedback summary and problem turns together.
 
-        # Get thumbs down turns
-        cursor.execute("""
-            SELECT turn_no FROM eval_feedback
-            WHERE campaign_id = ? AND feedback_type = 'thumbs_down'
-        """, (campaign_id,))
-        thumbs_down = [row[0] for row in cursor.fetchall()]
+        Same results as the three getters, but each table is read once
+        over a single connection.
+        """
+        conn = self.store.connect()
+        metrics_list = self._fetch_metrics(conn, campaign_id)
+        rows = self._fetch_feedback(conn, campaign_id)
+        conn.close()
+        return (
+            _summarize_metrics(metrics_list),
+            _summarize_feedback(rows),
+            _find_problem_turns(metrics_list, rows),
+        )
 
-        # Get clarification turns
-        cursor.execute("""
+    @staticmethod
+    def _fetch_metrics(conn, campaign_id: str) -> list[tuple[int, dict]]:
+        """(turn_no, metrics) pairs for a campaign, in turn order."""
+        rows = conn.execute("""
             SELECT turn_no, metrics_json FROM eval_metrics
             WHERE campaign_id = ?
-        """, (campaign_id,))
-
-        clarification_turns = []
-        for turn_no, metrics_json in cursor.fetchall():
-            metrics = json.loads(metrics_json)
-            if metrics["actions"]["clarification_needed"]:
-                clarification_turns.append(turn_no)
-
-        conn.close()
+            ORDER BY turn_no
+        """, (campaign_id,)).fetchall()
+        return [(turn_no, json.loads(metrics_json)) for turn_no, metrics_json in rows]
 
-        # Compile problem turns
-        problems = []
-        all_problem_turns = set(
-            [t for t, _ in flagged] +
-            thumbs_down +
-            clarification_turns
-        )
+    @staticmethod
+    def _fetch_feedback(conn, campaign_id: str) -> list[tuple]:
+        """(feedback_type, value, turn_no) rows for a campaign."""
+        return conn.execute("""
+            SELECT feedback_type, value, turn_no FROM eval_feedback
+            WHERE campaign_id = ?
+        """, (campaign_id,)).fetchall()
+
+
+def _summarize_metrics(metrics_list: list[tuple[int, dict]]) -> dict:
+    """Aggregate per-turn metrics into a campaign summary."""
+    if not metrics_list:
+        return {"turns": 0, "summary": {}}
+
+    total_turns = len(metrics_list)
+    avg_latency = sum(m["timing"]["total_ms"] for _, m in metrics_list) / total_turns
+    total_clarifications = sum(1 for _, m in metrics_list if m["actions"]["clarification_needed"])
+    avg_narrative_length = sum(m["output"]["narrative_length"] for _, m in metrics_list) / total_turns
+
+    roll_outcomes = []
+    for _, m in metrics_list:
+        roll_outcomes.extend(m["rolls"]["outcomes"])
+
+    return {
+        "turns": total_turns,
+        "summary": {
+            "avg_latency_ms": round(avg_latency, 2),
+            "clarification_rate": round(total_clarifications / total_turns, 2),
+            "avg_narrative_length": round(avg_narrative_length, 0),
+            "roll_distribution": _count_outcomes(roll_outcomes),
+        }
+    }
+
+
+def _summarize_feedback(rows: list[tuple]) -> dict:
+    """Group feedback rows by type and compute thumbs sentiment."""
+    if not rows:
+        return {"total": 0, "by_type": {}}
+
+    by_type = {}
+    for feedback_type, value, turn_no in rows:
+        if feedback_type not in by_type:
+            by_type[feedback_type] = []
+        by_type[feedback_type].append({"turn": turn_no, "value": value})
+
+    # Calculate sentiment
+    thumbs_up = len(by_type.get("thumbs_up", []))
+    thumbs_down = len(by_type.get("thumbs_down", []))
+    total_votes = thumbs_up + thumbs_down
+
+    return {
+        "total": len(rows),
+        "by_type": by_type,
+        "sentiment": {
+            "positive": thumbs_up,
+            "negative": thumbs_down,
+            "ratio": round(thumbs_up / total_votes, 2) if total_votes > 0 else None
+        }
+    }
+
+
+def _find_problem_turns(metrics_list: list[tuple[int, dict]], rows: list[tuple]) -> list:
+    """Turns that were flagged, thumbed down, or needed clarification."""
+    flagged = [(turn_no, value) for feedback_type, value, turn_no in rows
+               if feedback_type == "flag_issue"]
+    thumbs_down = [turn_no for feedback_type, _, turn_no in rows
+                   if feedback_type == "thumbs_down"]
+    clarification_turns = [turn_no for turn_no, m in metrics_list
+                           if m["actions"]["clarification_needed"]]
+
+    # Compile problem turns
+    problems = []
+    all_problem_turns = set(
+        [t for t, _ in flagged] +
+        thumbs_down +
+        clarification_turns
+    )
 
-        for turn_no in sorted(all_problem_turns):
-            issue = {
-                "turn_no": turn_no,
-                "issues": []
-            }
-            for t, flag in flagged:
-                if t == turn_no:
-                    issue["issues"].append(f"flagged: {flag}")
-            if turn_no in thumbs_down:
-                issue["issues"].append("thumbs_down")
-            if turn_no in clarification_turns:
-                issue["issues"].append("needed_clarification")
-            problems.append(issue)
-
-        return problems
+    for turn_no in sorted(all_problem_turns):
+        issue = {
+            "turn_no": turn_no,
+            "issues": []
+        }
+        for t, flag in flagged:
+            if t == turn_no:
+                issue["issues"].append(f"flagged: {flag}")
+        if turn_no in thumbs_down:
+            issue["issues"].append("thumbs_down")
+        if turn_no in clarification_turns:
+            issue["issues"].append("needed_clarification")
+        problems.append(issue)
+
+    return problems
 
 
 def _count_outcomes(outcomes: list) -> dict:
@@ -10,7 +10,7 @@ Supports:
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import json
 import time
 
@@ -49,19 +49,19 @@ class ABTestResult:
     metrics_b: dict
 
 
-def rerun_turns(
+def stream_turns(
     state_store: StateStore,
     campaign_id: str,
     start_turn: int,
     end_turn: int,
     prompt_overrides: Optional[dict] = None,
-    llm_gateway: Optional[LLMGateway] = None,
-    prompt_registry: Optional[PromptRegistry] = None
-) -> dict:
+    llm_gateway: Optional[LLMGateway] = None
+) -> Iterator[ReplayResult]:
     """
-    Replay turns with optional prompt version overrides.
+    Replay turns one at a time, yielding each result as soon as it is ready.
 
-    Uses state snapshots to replay each turn in an isolated sandbox.
+    Only events in [start_turn, end_turn] are loaded. Stopping iteration
+    early (e.g. Ctrl-C in the CLI) skips the remaining turns entirely.
 
     Args:
         state_store: Database connection
@@ -70,25 +70,13 @@ def rerun_turns(
         end_turn: Last turn to replay
         prompt_overrides: Dict of {"interpreter": "v1", ...}
         llm_gateway: LLM gateway to use (defaults to mock)
-        prompt_registry: Prompt registry to use
 
-    Returns:
-        Report dict with original and replayed outputs
+    Yields:
+        ReplayResult for each replayed turn, in turn order
     """
-    # Get original events
     events = state_store.get_events_range(campaign_id, start_turn, end_turn)
-
-    if not events:
-        return {
-            "status": "error",
-            "note": f"No events found for turns {start_turn}-{end_turn}",
-            "events": []
-        }
-
-    # Setup for replay
     gateway = llm_gateway or MockGateway()
 
-    results = []
     for event in events:
         turn_no = event["turn_no"]
         player_input = event["player_input"]
@@ -115,7 +103,7 @@ def rerun_turns(
 
         latency_ms = (time.time() - start_time) * 1000
 
-        results.append(ReplayResult(
+        yield ReplayResult(
             turn_no=turn_no,
             original_input=player_input,
             original_output=original_output,
@@ -123,24 +111,66 @@ def rerun_turns(
             prompt_versions=prompt_overrides or {},
             latency_ms=latency_ms,
             matches_original=(original_output == replay_output)
-        ))
+        )
+
+
+def summarize_replay_result(r: ReplayResult) -> dict:
+    """Report entry for one replayed turn (outputs truncated to 200 chars)."""
+    return {
+        "turn_no": r.turn_no,
+        "input": r.original_input,
+        "original": r.original_output[:200] + "..." if len(r.original_output) > 200 else r.original_output,
+        "replay": r.replay_output[:200] + "..." if len(r.replay_output) > 200 else r.replay_output,
+        "matches": r.matches_original,
+        "latency_ms": r.latency_ms
+    }
+
+
+def rerun_turns(
+    state_store: StateStore,
+    campaign_id: str,
+    start_turn: int,
+    end_turn: int,
+    prompt_overrides: Optional[dict] = None,
+    llm_gateway: Optional[LLMGateway] = None,
+    prompt_registry: Optional[PromptRegistry] = None
+) -> dict:
+    """
+    Replay turns with optional prompt version overrides.
+
+    Uses state snapshots to replay each turn in an isolated sandbox.
+    See stream_turns() for an incremental version.
+
+    Args:
+        state_store: Database connection
+        campaign_id: Campaign to replay
+        start_turn: First turn to replay
+        end_turn: Last turn to replay
+        prompt_overrides: Dict of {"interpreter": "v1", ...}
+        llm_gateway: LLM gateway to use (defaults to mock)
+        prompt_registry: Prompt registry to use
+
+    Returns:
+        Report dict with original and replayed outputs
+    """
+    results = list(stream_turns(
+        state_store, campaign_id, start_turn, end_turn,
+        prompt_overrides, llm_gateway
+    ))
+
+    if not results:
+        return {
+            "status": "error",
+            "note": f"No events found for turns {start_turn}-{end_turn}",
+            "events": []
+        }
 
     return {
         "status": "completed",
         "campaign_id": campaign_id,
         "turns_replayed": len(results),
         "prompt_overrides": prompt_overrides or {},
-        "results": [
-            {
-                "turn_no": r.turn_no,
-                "input": r.original_input,
-                "original": r.original_output[:200] + "..." if len(r.original_output) > 200 else r.original_output,
-                "replay": r.replay_output[:200] + "..." if len(r.replay_output) > 200 else r.replay_output,
-                "matches": r.matches_original,
-                "latency_ms": r.latency_ms
-            }
-            for r in results
-        ],
+        "results": [summarize_replay_result(r) for r in results],
         "note": "Turns replayed in isolated sandbox environments using state snapshots."
     }
 
@@ -264,14 +294,22 @@ def format_replay_report(report: dict) -> str:
     lines.append("-" * 40)
 
     for r in report.get('results', []):
-        lines.append(f"Turn {r['turn_no']}:")
-        lines.append(f"  Input: {r['input'][:50]}...")
-        lines.append(f"  Original: {r['original'][:50]}...")
-        if not r['matches']:
-            lines.append(f"  Replay: {r['replay'][:50]}...")
-        lines.append(f"  Matches: {'✓' if r['matches'] else '✗'}")
-        lines.append("")
+        lines.append(format_replay_entry(r))
+
+    return "\n".join(lines)
 
+
+def format_replay_entry(r: dict) -> str:
+    """Format one report entry (see summarize_replay_result) for display."""
+    lines = [
+        f"Turn {r['turn_no']}:",
+        f"  Input: {r['input'][:50]}...",
+        f"  Original: {r['original'][:50]}...",
+    ]
+    if not r['matches']:
+        lines.append(f"  Replay: {r['replay'][:50]}...")
+    lines.append(f"  Matches: {'✓' if r['matches'] else '✗'}")
+    lines.append("")
     return "\n".join(lines)
 
 
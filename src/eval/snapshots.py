@@ -78,10 +78,23 @@ class SnapshotManager:
 
     def __init__(self, state_store: StateStore):
         self.store = state_store
+        self._has_table = True
         self._ensure_snapshot_table()
 
     def _ensure_snapshot_table(self):
-        """Ensure snapshot storage table exists."""
+        """Ensure snapshot storage table exists.
+
+        A read-only store can't create it, so just record whether it exists.
+        """
+        if self.store.readonly:
+            conn = self.store.connect()
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'state_snapshots'"
+            ).fetchone()
+            conn.close()
+            self._has_table = row is not None
+            return
+
         conn = self.store.connect()
         cursor = conn.cursor()
 
@@ -216,6 +229,9 @@ class SnapshotManager:
         turn_no: int
     ) -> Optional[StateSnapshot]:
         """Get the snapshot taken at or before a specific turn."""
+        if not self._has_table:
+            return None
+
         conn = self.store.connect()
         cursor = conn.cursor()
 
@@ -285,6 +301,8 @@ class SandboxEnvironment:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up sandbox."""
+        if self.sandbox_store:
+            self.sandbox_store.close()
         if self.temp_dir:
             shutil.rmtree(self.temp_dir, ignore_errors=True)
         return False
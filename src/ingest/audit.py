@@ -12,7 +12,7 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .utils import count_words, read_markdown_with_frontmatter, read_stage_meta
+from .utils import count_words, list_page_files, read_markdown_with_frontmatter, read_stage_meta
 
 logger = logging.getLogger(__name__)
 
@@ -158,7 +158,7 @@ class IngestAuditor:
         if pages_dir.exists():
             total_words = 0
             page_count = 0
-            for page_file in pages_dir.glob("page_*.md"):
+            for _, page_file in list_page_files(pages_dir):
                 text = page_file.read_text(encoding="utf-8")
                 total_words += count_words(text)
                 page_count += 1
@@ -330,15 +330,14 @@ class IngestAuditor:
             pack_text += " " + body.lower()
 
         # Select random pages
-        page_files = sorted(pages_dir.glob("page_*.md"))
+        page_files = list_page_files(pages_dir)
         if not page_files:
             return
 
         sample_count = min(n, len(page_files))
         sampled = random.sample(page_files, sample_count)
 
-        for page_file in sampled:
-            page_num = int(page_file.stem.split("_")[1])
+        for page_num, page_file in sampled:
             text = page_file.read_text(encoding="utf-8")
 
             # Extract distinctive terms: capitalized multi-word phrases
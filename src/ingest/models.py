@@ -126,7 +126,7 @@ class SegmentManifest:
 # Stage 5: Entity Extraction / Enrichment
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class EntityEntry:
     """An entity extracted from the source material."""
     id: str
@@ -730,6 +730,8 @@ class PackTester:
 
     def _cleanup(self) -> None:
         """Remove temp database directory."""
+        if self._store:
+            self._store.close()
         if self._temp_dir and os.path.exists(self._temp_dir):
             shutil.rmtree(self._temp_dir, ignore_errors=True)
 
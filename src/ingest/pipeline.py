@@ -21,7 +21,10 @@ from .models import (
     Route, SectionNode, SegmentEntry, SegmentManifest,
     SystemsExtractionManifest,
 )
-from .utils import ensure_dir, read_stage_meta
+from .utils import (
+    MarkdownFileIndex, ensure_dir, enum_or_none, read_manifest, read_stage_meta,
+    segment_file_path,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,26 @@ STAGE_DIRS = {
 }
 
 
+def load_completed_summary(work_dir: Path, skip_systems: bool = False) -> Optional[dict]:
+    """Return the saved pipeline summary if every stage has a complete checkpoint.
+
+    A resumed run over such a work directory would only reload stages from
+    disk, so callers can report this summary without building gateways.
+    Returns None if any stage still needs to run.
+    """
+    work_dir = Path(work_dir)
+    summary_path = work_dir / "pipeline_summary.json"
+    if not summary_path.exists():
+        return None
+
+    stages = [s for s in STAGE_ORDER if not (skip_systems and s == "systems")]
+    for stage in stages:
+        meta = read_stage_meta(work_dir / STAGE_DIRS[stage])
+        if not meta or meta.get("status") != "complete":
+            return None
+    return read_manifest(summary_path)
+
+
 class IngestPipeline:
     """Orchestrates the full PDF-to-content-pack pipeline."""
 
@@ -278,7 +301,7 @@ class IngestPipeline:
 
     def _load_extraction(self, stage_dir: Path) -> ExtractionResult:
         """Load ExtractionResult from stage 1 output."""
-        from .utils import read_manifest
+        from .utils import list_page_files, read_manifest
 
         page_map = read_manifest(stage_dir / "page_map.json")
         meta = read_stage_meta(stage_dir) or {}
@@ -286,8 +309,7 @@ class IngestPipeline:
         pages = []
         pages_dir = stage_dir / "pages"
         if pages_dir.exists():
-            for page_file in sorted(pages_dir.glob("page_*.md")):
-                page_num = int(page_file.stem.split("_")[1])
+            for page_num, page_file in list_page_files(pages_dir):
                 text = page_file.read_text(encoding="utf-8")
                 info = page_map.get(str(page_num), {})
                 pages.append(PageEntry(
@@ -312,12 +334,7 @@ class IngestPipeline:
         data = read_manifest(stage_dir / "structure.json")
 
         def parse_node(d, default_level=1):
-            intent = None
-            if d.get("intent"):
-                try:
-                    intent = ChapterIntent(d["intent"])
-                except ValueError:
-                    pass
+            intent = enum_or_none(ChapterIntent, d.get("intent"))
             children = [parse_node(c, 2) for c in d.get("children", [])]
             return SectionNode(
                 title=d.get("title", "Untitled"),
@@ -332,12 +349,11 @@ class IngestPipeline:
         sections = [parse_node(s) for s in data.get("sections", [])]
 
         # Load chapter content from files
-        chapters_dir = stage_dir / "chapters"
-        if chapters_dir.exists():
-            for i, section in enumerate(sections):
-                for chapter_file in chapters_dir.glob(f"{i + 1:02d}_*.md"):
-                    section.content = chapter_file.read_text(encoding="utf-8")
-                    break
+        chapters = MarkdownFileIndex(stage_dir / "chapters")
+        for i, section in enumerate(sections):
+            chapter_file = chapters.find_prefix(f"{i + 1:02d}_")
+            if chapter_file:
+                section.content = chapter_file.read_text(encoding="utf-8")
 
         return DocumentStructure(
             title=data.get("title", "Untitled"),
@@ -352,40 +368,22 @@ class IngestPipeline:
         data = read_manifest(stage_dir / "segment_manifest.json")
 
         segments = []
-        segments_dir = stage_dir / "segments"
+        segment_files = MarkdownFileIndex(stage_dir / "segments")
         for s in data.get("segments", []):
             # Load content from segment file
             content = ""
-            if segments_dir.exists():
-                for seg_file in segments_dir.glob(f"{s['id']}_*.md"):
-                    raw = seg_file.read_text(encoding="utf-8")
-                    lines = raw.split("\n")
-                    if lines and lines[0].startswith("# "):
-                        content = "\n".join(lines[1:]).strip()
-                    else:
-                        content = raw.strip()
-                    break
-
-            content_type = None
-            if s.get("content_type"):
-                try:
-                    content_type = ContentType(s["content_type"])
-                except ValueError:
-                    pass
-
-            route = None
-            if s.get("route"):
-                try:
-                    route = Route(s["route"])
-                except ValueError:
-                    pass
-
-            chapter_intent = None
-            if s.get("chapter_intent"):
-                try:
-                    chapter_intent = ChapterIntent(s["chapter_intent"])
-                except ValueError:
-                    pass
+            seg_file = segment_file_path(segment_files, s["id"], s.get("title", ""))
+            if seg_file:
+                raw = seg_file.read_text(encoding="utf-8")
+                lines = raw.split("\n")
+                if lines and lines[0].startswith("# "):
+                    content = "\n".join(lines[1:]).strip()
+                else:
+                    content = raw.strip()
+
+            content_type = enum_or_none(ContentType, s.get("content_type"))
+            route = enum_or_none(Route, s.get("route"))
+            chapter_intent = enum_or_none(ChapterIntent, s.get("chapter_intent"))
 
             segments.append(SegmentEntry(
                 id=s["id"],
@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from .utils import list_page_files
+
 logger = logging.getLogger(__name__)
 
 SPHERE_EXTRACT_PROMPT = """Extract the ranked abilities for this magic school/sphere/discipline.
@@ -174,11 +176,10 @@ def find_sphere_page_ranges(pages_dir: Path) -> dict[str, tuple[int, int]]:
     ]
 
     sphere_starts = {}
+    page_files = list_page_files(pages_dir)
 
     # Scan pages for sphere detail sections (not just mentions)
-    page_files = sorted(pages_dir.glob("page_*.md"))
-    for page_path in page_files:
-        page_num = int(page_path.stem.split("_")[1])
+    for page_num, page_path in page_files:
         content = page_path.read_text()
 
         for sphere in sphere_names:
@@ -205,8 +206,7 @@ def find_sphere_page_ranges(pages_dir: Path) -> dict[str, tuple[int, int]]:
         if sphere in sphere_starts:
             continue
 
-        for page_path in page_files:
-            page_num = int(page_path.stem.split("_")[1])
+        for page_num, page_path in page_files:
             content = page_path.read_text()
 
             # Sphere mentioned anywhere + has ranked abilities
@@ -1,10 +1,18 @@
 """Shared utility functions for the ingest pipeline."""
 
+import functools
 import json
+import os
 import re
+from bisect import bisect_left
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works the same
+    orjson = None
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL/ID-safe slug.
@@ -51,6 +59,77 @@ def parse_page_range(spec: str, total_pages: int) -> list[int]:
     return sorted(set(pages))
 
 
+# page_NNNN.md, optionally with a suffix after the number (page_NNNN_x.md)
+_PAGE_FILE_RE = re.compile(r"^page_(\d+)(?:_.*)?\.md$")
+
+
+def list_page_files(pages_dir: Path) -> list[tuple[int, Path]]:
+    """List extracted page files (page_NNNN.md) as (page_num, path) in page order.
+
+    Sorted by page number rather than by name, so page 10000 still follows
+    page 9999 once the zero-padded names stop sorting correctly. Stray
+    page_*.md files without a page number are skipped.
+    """
+    entries = []
+    with os.scandir(pages_dir) as it:
+        for entry in it:
+            match = _PAGE_FILE_RE.match(entry.name)
+            if match:
+                entries.append((int(match.group(1)), Path(entry.path)))
+    entries.sort()
+    return entries
+
+
+@functools.cache
+def _enum_by_value(enum_cls) -> dict:
+    return {member.value: member for member in enum_cls}
+
+
+def enum_or_none(enum_cls, value):
+    """The member of enum_cls with this value, or None if value is empty or unknown.
+
+    A dict lookup, so loaders don't pay for a raised ValueError per
+    unrecognised manifest value.
+    """
+    if not value:
+        return None
+    return _enum_by_value(enum_cls).get(value)
+
+
+class MarkdownFileIndex:
+    """Names of a directory's .md files, listed once, with exact and prefix lookup.
+
+    Loaders that look up one file per manifest entry use this instead of a
+    glob per entry, which re-reads the whole directory every time.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        try:
+            with os.scandir(directory) as it:
+                names = [entry.name for entry in it if entry.name.endswith(".md")]
+        except FileNotFoundError:
+            names = []
+        self._names = sorted(names)
+        self._name_set = set(names)
+
+    def get(self, name: str) -> Path | None:
+        """Path of the file with exactly this name, if present."""
+        return self.directory / name if name in self._name_set else None
+
+    def find_prefix(self, prefix: str) -> Path | None:
+        """Path of the first file (in name order) whose name starts with prefix."""
+        i = bisect_left(self._names, prefix)
+        if i < len(self._names) and self._names[i].startswith(prefix):
+            return self.directory / self._names[i]
+        return None
+
+
+def segment_file_path(index: MarkdownFileIndex, seg_id: str, title: str) -> Path | None:
+    """Locate a segment's file, written as {id}_{slugify(title)}.md by the segmenter."""
+    return index.get(f"{seg_id}_{slugify(title)}.md") or index.find_prefix(f"{seg_id}_")
+
+
 def write_stage_meta(stage_dir: Path, meta: dict) -> None:
     """Write stage metadata JSON file."""
     stage_dir.mkdir(parents=True, exist_ok=True)
@@ -69,12 +148,17 @@ def read_stage_meta(stage_dir: Path) -> dict | None:
 def write_manifest(path: Path, data: Any) -> None:
     """Write a JSON manifest file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
 def read_manifest(path: Path) -> Any:
-    """Read a JSON manifest file."""
-    return json.loads(path.read_text())
+    """Read a JSON manifest file (with orjson when it is installed)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity, which only the stdlib accepts
+    return json.loads(path.read_text(encoding="utf-8"))
 
 
 def write_markdown(path: Path, content: str, frontmatter: dict | None = None) -> None:
@@ -7,6 +7,7 @@ Validates the assembled content pack by:
 """
 
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,6 +16,15 @@ from .utils import write_stage_meta
 logger = logging.getLogger(__name__)
 
 
+def _remove_scratch_db(db_path: str) -> None:
+    """Delete a scratch SQLite database along with its WAL sidecar files."""
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(db_path + suffix)
+        except FileNotFoundError:
+            pass
+
+
 @dataclass
 class ValidationReport:
     """Validation results for an assembled content pack."""
@@ -155,12 +165,11 @@ class PackValidator:
             return
 
         import tempfile
-        import os
 
         fd, db_path = tempfile.mkstemp(suffix=".db")
         os.close(fd)
+        store = StateStore(db_path)
         try:
-            store = StateStore(db_path)
             store.ensure_schema()
 
             loader = PackLoader()
@@ -185,7 +194,8 @@ class PackValidator:
         except Exception as e:
             report.add_error(f"Installation test failed: {e}")
         finally:
-            os.unlink(db_path)
+            store.close()
+            _remove_scratch_db(db_path)
 
     def _validate_retrieval(
         self,
@@ -204,12 +214,11 @@ class PackValidator:
             return
 
         import tempfile
-        import os
 
         fd, db_path = tempfile.mkstemp(suffix=".db")
         os.close(fd)
+        store = StateStore(db_path)
         try:
-            store = StateStore(db_path)
             store.ensure_schema()
 
             loader = PackLoader()
@@ -251,4 +260,5 @@ class PackValidator:
         except Exception as e:
             report.add_warning(f"Retrieval spot-check failed: {e}")
         finally:
-            os.unlink(db_path)
+            store.close()
+            _remove_scratch_db(db_path)
@@ -6,11 +6,12 @@ Handles structured output generation with schema validation.
 
 import json
 import os
+import re
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import jsonschema
 
@@ -51,7 +52,10 @@ class LLMGateway(ABC):
             prompt: The prompt template with {{placeholders}}
             input_data: Data to inject into placeholders
             schema: JSON schema for output validation
-            options: Provider-specific options (temperature, max_tokens, etc.)
+            options: Provider-specific options (temperature, max_tokens, etc.).
+                Providers that can stream also accept "stream_field" and
+                "on_text": the decoded value of that top-level string field
+                is passed to on_text piece by piece as it is generated.
 
         Returns:
             LLMResponse with parsed content
@@ -76,6 +80,65 @@ class LLMGateway(ABC):
         jsonschema.validate(instance=output, schema=schema)
 
 
+_HIGH_SURROGATE = re.compile(r"\\u[dD][89abAB]")
+
+
+class JsonFieldStream:
+    """Incrementally decodes one string field from streamed JSON text.
+
+    feed() takes raw chunks of the model's JSON output and returns whatever
+    new text of the field's value can be decoded so far. Escape sequences
+    split across chunks are held back until they are complete.
+    """
+
+    def __init__(self, field: str):
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._head = ""
+        self._pending = ""
+        self._in_value = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        if self._done:
+            return ""
+        if not self._in_value:
+            self._head += chunk
+            match = self._start.search(self._head)
+            if not match:
+                return ""
+            self._in_value = True
+            chunk = self._head[match.end():]
+            self._head = ""
+
+        raw = self._pending + chunk
+        escapes = []
+        i, n = 0, len(raw)
+        while i < n:
+            c = raw[i]
+            if c == "\\":
+                escapes.append(i)
+                i += 2
+            elif c == '"':
+                self._done = True
+                self._pending = ""
+                return json.loads(f'"{raw[:i]}"', strict=False)
+            else:
+                i += 1
+
+        cut = n
+        if escapes:
+            last = escapes[-1]
+            if last + 1 >= n or (raw[last + 1] == "u" and last + 6 > n):
+                cut = last  # incomplete escape
+                escapes.pop()
+        # Keep a high surrogate until its low half arrives
+        if escapes and escapes[-1] + 6 == cut and _HIGH_SURROGATE.match(raw, escapes[-1]):
+            cut = escapes[-1]
+
+        self._pending = raw[cut:]
+        return json.loads(f'"{raw[:cut]}"', strict=False) if cut else ""
+
+
 class ClaudeGateway(LLMGateway):
     """Claude API implementation of LLM Gateway."""
 
@@ -84,8 +147,15 @@ class ClaudeGateway(LLMGateway):
         api_key: Optional[str] = None,
         model: str = "claude-sonnet-4-20250514",
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        client: Any = None
     ):
+        """
+        Args:
+            client: Existing anthropic.Anthropic client to share. Gateways for
+                different models can reuse one client (and its HTTP
+                connection pool) instead of each opening their own.
+        """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
@@ -94,6 +164,10 @@ class ClaudeGateway(LLMGateway):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+        if client is not None:
+            self.client = client
+            return
+
         # Import anthropic lazily to allow module to load without it installed
         try:
             import anthropic
@@ -130,7 +204,7 @@ class ClaudeGateway(LLMGateway):
             try:
                 start_time = time.time()
 
-                response = self.client.messages.create(
+                request = dict(
                     model=self.model,
                     max_tokens=options.get("max_tokens", 4096),
                     temperature=options.get("temperature", 0.7),
@@ -139,6 +213,14 @@ class ClaudeGateway(LLMGateway):
                         {"role": "user", "content": full_prompt}
                     ]
                 )
+                # Only the first attempt streams, so a retry never repeats text
+                on_text = options.get("on_text")
+                if on_text is not None and attempt == 0:
+                    response = self._stream_message(
+                        request, options.get("stream_field", "final_text"), on_text
+                    )
+                else:
+                    response = self.client.messages.create(**request)
 
                 latency_ms = (time.time() - start_time) * 1000
 
@@ -192,10 +274,24 @@ class ClaudeGateway(LLMGateway):
 
         raise Exception(f"LLM call failed after {self.max_retries} attempts: {last_error.message}")
 
+    def _stream_message(
+        self,
+        request: dict,
+        field: str,
+        on_text: Callable[[str], None]
+    ):
+        """Stream a message, passing the named JSON field's text to on_text as it arrives."""
+        field_stream = JsonFieldStream(field)
+        with self.client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                piece = field_stream.feed(text)
+                if piece:
+                    on_text(piece)
+            return stream.get_final_message()
+
     def _extract_json(self, text: str) -> dict:
         """Try to extract JSON from text that might have markdown formatting."""
         # Try to find JSON in code blocks
-        import re
         patterns = [
             r"```json\s*([\s\S]*?)\s*```",
             r"```\s*([\s\S]*?)\s*```",
@@ -245,7 +341,8 @@ class MockGateway(LLMGateway):
             "prompt": prompt,
             "input_data": input_data,
             "schema": schema,
-            "rendered": rendered
+            "rendered": rendered,
+            "options": options
         })
 
         # Find matching response
@@ -39,6 +39,7 @@ class PromptRegistry:
     def __init__(self, prompts_dir: Optional[Path] = None):
         self.prompts_dir = prompts_dir or Path(__file__).parent.parent / "prompts"
         self._cache: dict[str, PromptTemplate] = {}
+        self._latest: dict[str, str] = {}  # prompt_id -> latest version, filled by preload()
         self._pinned_versions: dict[str, dict[str, str]] = {}  # campaign_id -> {prompt_id -> version}
 
     def get_prompt(
@@ -64,6 +65,8 @@ class PromptRegistry:
             version = pinned.get(prompt_id)
 
         # Use latest if no version specified
+        if version is None:
+            version = self._latest.get(prompt_id)
         if version is None:
             versions = self.list_prompt_versions(prompt_id)
             if not versions:
@@ -80,6 +83,40 @@ class PromptRegistry:
         if not file_path.exists():
             raise FileNotFoundError(f"Prompt not found: {file_path}")
 
+        prompt = self._load_template(file_path, prompt_id, version)
+        self._cache[cache_key] = prompt
+        return prompt
+
+    def preload(self) -> int:
+        """
+        Read every prompt template in prompts_dir into the cache.
+
+        After preloading, get_prompt() serves latest-version lookups from
+        memory instead of globbing the prompts directory on every call.
+
+        Returns:
+            Number of templates loaded
+        """
+        pattern = re.compile(r"^(\w+)_v(\d+)\.txt$")
+        latest: dict[str, int] = {}
+
+        for path in self.prompts_dir.glob("*_v*.txt"):
+            match = pattern.match(path.name)
+            if not match:
+                continue
+            prompt_id, number = match.group(1), int(match.group(2))
+            version = f"v{number}"
+            cache_key = f"{prompt_id}_{version}"
+            if cache_key not in self._cache:
+                self._cache[cache_key] = self._load_template(path, prompt_id, version)
+            if number > latest.get(prompt_id, -1):
+                latest[prompt_id] = number
+
+        self._latest = {pid: f"v{n}" for pid, n in latest.items()}
+        return len(self._cache)
+
+    def _load_template(self, file_path: Path, prompt_id: str, version: str) -> PromptTemplate:
+        """Read a template file and parse its header metadata."""
         with open(file_path) as f:
             template = f.read()
 
@@ -87,7 +124,7 @@ class PromptRegistry:
         metadata = self._parse_metadata(template)
         schema_name = metadata.get("schema", f"{prompt_id}_output")
 
-        prompt = PromptTemplate(
+        return PromptTemplate(
             id=prompt_id,
             version=version,
             template=template,
@@ -95,9 +132,6 @@ class PromptRegistry:
             metadata=metadata
         )
 
-        self._cache[cache_key] = prompt
-        return prompt
-
     def list_prompt_versions(self, prompt_id: str) -> list[PromptVersion]:
         """List all available versions of a prompt."""
         versions = []
@@ -155,3 +189,4 @@ class PromptRegistry:
     def clear_cache(self) -> None:
         """Clear the prompt cache."""
         self._cache.clear()
+        self._latest.clear()
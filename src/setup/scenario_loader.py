@@ -6,11 +6,21 @@ When a scenario declares content_packs, the loader builds a lore manifest
 mapping entity IDs to relevant chunk IDs for fast retrieval during play.
 """
 
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
+from ..config import get_cache_dir
 from ..db.state_store import StateStore, new_id
 
 
@@ -22,22 +32,79 @@ class ScenarioLoader:
         self.scenarios_dir = scenarios_dir or Path(__file__).parent.parent.parent / "scenarios"
 
     def list_scenarios(self) -> list[dict]:
-        """List available scenarios."""
+        """List available scenarios.
+
+        Summaries are cached on disk keyed by (mtime, size), so unchanged
+        scenario files are only stat'ed rather than re-parsed. The cache
+        lives in the user cache directory, one file per scenarios directory.
+        """
+        cache = self._read_scenario_cache()
+        fresh_cache = {}
         scenarios = []
         for path in self.scenarios_dir.glob("*.yaml"):
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
+                st = path.stat()
+                entry = cache.get(path.name)
+                if (
+                    entry is None
+                    or entry.get("mtime_ns") != st.st_mtime_ns
+                    or entry.get("size") != st.st_size
+                ):
+                    with open(path) as f:
+                        data = yaml.load(f, Loader=_YamlLoader)
+                    entry = {
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "id": data.get("id", path.stem),
+                        "name": data.get("name", path.stem),
+                        "description": data.get("description", ""),
+                    }
+                fresh_cache[path.name] = entry
                 scenarios.append({
-                    "id": data.get("id", path.stem),
-                    "name": data.get("name", path.stem),
-                    "description": data.get("description", ""),
+                    "id": entry["id"],
+                    "name": entry["name"],
+                    "description": entry["description"],
                     "path": str(path)
                 })
             except Exception as e:
                 print(f"Warning: Could not load {path}: {e}")
+
+        if fresh_cache != cache:
+            self._write_scenario_cache(fresh_cache)
         return scenarios
 
+    def _scenario_cache_path(self) -> Path:
+        """Summary cache file for this scenarios directory."""
+        key = hashlib.sha1(str(self.scenarios_dir.resolve()).encode()).hexdigest()[:16]
+        return get_cache_dir() / f"scenarios_{key}.json"
+
+    def _read_scenario_cache(self) -> dict:
+        """Read the scenario summary cache, or {} if missing/corrupt."""
+        try:
+            data = json.loads(self._scenario_cache_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_scenario_cache(self, cache: dict) -> None:
+        """Atomically write the scenario summary cache (best effort)."""
+        try:
+            cache_path = self._scenario_cache_path()
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Unwritable cache dir, or a summary YAML parsed into a non-JSON
+            # type (e.g. a date) — just skip caching
+            pass
+
     def load_scenario(
         self,
         scenario_id: str,
@@ -58,7 +125,7 @@ class ScenarioLoader:
         # Find and load scenario file
         scenario_path = self._find_scenario(scenario_id)
         with open(scenario_path) as f:
-            scenario = yaml.safe_load(f)
+            scenario = yaml.load(f, Loader=_YamlLoader)
 
         # Generate campaign ID if needed
         campaign_id = campaign_id or new_id()
@@ -90,8 +157,9 @@ class ScenarioLoader:
 
         # Load entities
         entity_ids = []
+        pc = None
         for entity_data in scenario.get("entities", []):
-            self.store.create_entity(
+            entity = self.store.create_entity(
                 entity_id=entity_data["id"],
                 entity_type=entity_data["type"],
                 name=entity_data["name"],
@@ -99,6 +167,8 @@ class ScenarioLoader:
                 tags=entity_data.get("tags", [])
             )
             entity_ids.append(entity_data["id"])
+            if pc is None and entity_data["type"] == "pc":
+                pc = entity
 
         # Load facts
         for fact_data in scenario.get("facts", []):
@@ -176,7 +246,8 @@ class ScenarioLoader:
             "facts_loaded": len(scenario.get("facts", [])),
             "clocks_loaded": len(scenario.get("clocks", [])),
             "pack_ids": pack_ids,
-            "manifest_entries": len(manifest)
+            "manifest_entries": len(manifest),
+            "pc": pc
         }
 
     def _build_lore_manifest(
@@ -170,6 +170,7 @@ class TestSceneTransitionLoreRetrieval:
 
         # Retriever should have been called for the new scene
         assert mock_retriever.retrieve_for_scene.called
+        assert result.scene_id == "alley"
 
 
 class TestNPCIntroductionLoreRetrieval:
@@ -229,3 +229,7 @@ class TestSplitByHeaders:
         sections = _split_by_headers("## Parent\n\nText.\n\n### Child\n\nMore.")
         assert len(sections) == 1
         assert "### Child" in sections[0]["content"]
+
+    @pytest.mark.parametrize("body", ["##  ", "#  ", "##  \n##  "])
+    def test_blank_title_headers_keep_whole_body(self, body):
+        assert _split_by_headers(body) == [{"title": "", "content": body, "level": 0}]
@@ -0,0 +1,24 @@
+"""Tests for the programmatic CLI entry points."""
+
+import pytest
+
+from src.cli.api import run_turn
+from src.llm.gateway import MockGateway
+from tests.fixtures.state import setup_minimal_game_state
+
+
+class TestRunTurn:
+    def test_missing_campaign_raises(self, db_path):
+        with pytest.raises(ValueError, match="not found"):
+            run_turn(db_path, "no_such_campaign", "look around", api_key="unused")
+
+    def test_turn_with_mock_gateway(self, state_store, db_path):
+        campaign_id = setup_minimal_game_state(state_store)
+
+        result = run_turn(
+            db_path, campaign_id, "I look around the room.",
+            api_key="unused", llm_gateway=MockGateway(),
+        )
+
+        assert result["turn_no"] == 1
+        assert result["final_text"]
@@ -0,0 +1,29 @@
+"""Tests for CLI REPL output formatting."""
+
+from src.cli.main import _format_turn_output
+from src.core.orchestrator import TurnResult
+
+
+def _result(final_text="Rain hammers the neon."):
+    return TurnResult(turn_no=1, event_id="e1", final_text=final_text)
+
+
+class TestFormatTurnOutput:
+    """Test what the REPL prints after a (possibly streamed) turn."""
+
+    def test_not_streamed_prints_final_text(self):
+        assert _format_turn_output(_result(), "", False) == "\nRain hammers the neon.\n\n"
+
+    def test_full_stream_not_printed_twice(self):
+        out = _format_turn_output(_result(), "Rain hammers the neon.", False)
+        assert "Rain hammers" not in out
+        assert out == "\n\n"
+
+    def test_partial_stream_prints_final_text_in_full(self):
+        out = _format_turn_output(_result(), "Rain ham", False)
+        assert out == "\n\nRain hammers the neon.\n\n"
+
+    def test_stream_replaced_by_fallback_prints_final_text(self):
+        result = _result("The scene continues.")
+        out = _format_turn_output(result, "Rain hammers the neon.", False)
+        assert "The scene continues." in out
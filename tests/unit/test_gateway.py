@@ -0,0 +1,124 @@
+"""Tests for LLM gateway helpers."""
+
+import json
+from types import SimpleNamespace
+
+from src.llm.gateway import ClaudeGateway, JsonFieldStream
+
+
+def _feed_in_pieces(stream: JsonFieldStream, text: str, size: int) -> str:
+    return "".join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+
+
+class TestJsonFieldStream:
+    """Test incremental extraction of a streamed JSON string field."""
+
+    def test_extracts_field_across_chunks(self):
+        doc = json.dumps({"final_text": "Rain hammers the neon.", "next_prompt": "?"})
+        for size in (1, 3, 7, len(doc)):
+            stream = JsonFieldStream("final_text")
+            assert _feed_in_pieces(stream, doc, size) == "Rain hammers the neon."
+
+    def test_decodes_escapes_split_across_chunks(self):
+        text = 'He says "run"\nthen\\waits ☃ \U0001F600'
+        doc = json.dumps({"final_text": text})  # ASCII-escaped, with surrogate pairs
+        for size in range(1, 8):
+            stream = JsonFieldStream("final_text")
+            assert _feed_in_pieces(stream, doc, size) == text
+
+    def test_ignores_text_after_field(self):
+        stream = JsonFieldStream("final_text")
+        assert stream.feed('{"final_text": "Done", ') == "Done"
+        assert stream.feed('"next_prompt": "More"}') == ""
+
+    def test_waits_for_field_key(self):
+        stream = JsonFieldStream("final_text")
+        assert stream.feed('{"next_prompt": "x", "final_') == ""
+        assert stream.feed('text": "Hi"}') == "Hi"
+
+
+def _message(text: str):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        model="fake",
+        usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+    )
+
+
+class _FakeStream:
+    def __init__(self, pieces):
+        self.text_stream = iter(pieces)
+        self._text = "".join(pieces)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_final_message(self):
+        return _message(self._text)
+
+
+class _FakeMessages:
+    """Stands in for client.messages: scripted stream and create responses."""
+
+    def __init__(self, stream_pieces, create_texts=()):
+        self.stream_pieces = stream_pieces
+        self.create_texts = list(create_texts)
+        self.stream_calls = 0
+        self.create_calls = 0
+
+    def stream(self, **request):
+        self.stream_calls += 1
+        return _FakeStream(self.stream_pieces)
+
+    def create(self, **request):
+        self.create_calls += 1
+        return _message(self.create_texts.pop(0))
+
+
+def _gateway(messages: _FakeMessages) -> ClaudeGateway:
+    return ClaudeGateway(
+        api_key="test", retry_delay=0, client=SimpleNamespace(messages=messages)
+    )
+
+
+class TestClaudeGatewayStreaming:
+    """Test run_structured's on_text streaming option."""
+
+    def test_streams_field_to_on_text(self):
+        doc = json.dumps({"final_text": "Rain hammers the neon.", "next_prompt": "?"})
+        messages = _FakeMessages([doc[i:i + 5] for i in range(0, len(doc), 5)])
+        received = []
+
+        response = _gateway(messages).run_structured(
+            "Narrate", {}, {}, options={"on_text": received.append}
+        )
+
+        assert "".join(received) == "Rain hammers the neon."
+        assert len(received) > 1
+        assert response.content["final_text"] == "Rain hammers the neon."
+        assert messages.create_calls == 0
+
+    def test_retry_does_not_stream_again(self):
+        messages = _FakeMessages(
+            ['{"final_text": "Half a sen', "tence and no closing"],
+            create_texts=[json.dumps({"final_text": "Retried text."})],
+        )
+        received = []
+
+        response = _gateway(messages).run_structured(
+            "Narrate", {}, {}, options={"on_text": received.append}
+        )
+
+        assert response.content["final_text"] == "Retried text."
+        assert messages.stream_calls == 1
+        assert messages.create_calls == 1
+        assert "Retried" not in "".join(received)
+
+    def test_no_on_text_uses_create(self):
+        messages = _FakeMessages([], create_texts=[json.dumps({"final_text": "Hi"})])
+        _gateway(messages).run_structured("Narrate", {}, {})
+        assert messages.stream_calls == 0
+        assert messages.create_calls == 1
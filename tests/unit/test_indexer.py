@@ -109,8 +109,10 @@ class TestReindexPack:
         assert result is not None
         assert result.chunks_indexed == 0
 
-        # Chunks should be gone
+        # Chunks and their FTS entries should be gone
         assert len(state_store.get_pack_chunks("test_pack")) == 0
+        with state_store.connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM pack_chunks_fts").fetchone()[0] == 0
 
     def test_reindex_not_found(self, indexer):
         result = indexer.reindex_pack("nonexistent")
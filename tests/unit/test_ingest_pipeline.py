@@ -5,7 +5,9 @@ import pytest
 from pathlib import Path
 
 from src.ingest.models import IngestConfig
-from src.ingest.pipeline import IngestPipeline, STAGE_ORDER, STAGE_DIRS
+from src.ingest.pipeline import (
+    IngestPipeline, STAGE_ORDER, STAGE_DIRS, load_completed_summary,
+)
 
 
 class TestIngestConfig:
@@ -200,3 +202,40 @@ class TestRunStageResume:
         )
 
         assert result == "ran"
+
+
+def _write_completed_stages(work_dir, stages):
+    for stage in stages:
+        stage_dir = work_dir / STAGE_DIRS[stage]
+        stage_dir.mkdir(parents=True)
+        (stage_dir / "stage_meta.json").write_text(
+            json.dumps({"status": "complete"})
+        )
+
+
+class TestLoadCompletedSummary:
+    def test_returns_summary_when_all_stages_complete(self, tmp_path):
+        _write_completed_stages(tmp_path, STAGE_ORDER)
+        (tmp_path / "pipeline_summary.json").write_text(
+            json.dumps({"pack_dir": "p", "pack_valid": True})
+        )
+
+        summary = load_completed_summary(tmp_path)
+
+        assert summary == {"pack_dir": "p", "pack_valid": True}
+
+    def test_none_without_summary_file(self, tmp_path):
+        _write_completed_stages(tmp_path, STAGE_ORDER)
+        assert load_completed_summary(tmp_path) is None
+
+    def test_none_when_stage_incomplete(self, tmp_path):
+        _write_completed_stages(tmp_path, STAGE_ORDER[:-2])
+        (tmp_path / "pipeline_summary.json").write_text("{}")
+        assert load_completed_summary(tmp_path) is None
+
+    def test_skip_systems_ignores_systems_stage(self, tmp_path):
+        _write_completed_stages(tmp_path, STAGE_ORDER[:-1])
+        (tmp_path / "pipeline_summary.json").write_text("{}")
+
+        assert load_completed_summary(tmp_path) is None
+        assert load_completed_summary(tmp_path, skip_systems=True) == {}
@@ -0,0 +1,23 @@
+"""Tests for sphere page-range detection."""
+
+from src.ingest.sphere_extract import find_sphere_page_ranges
+
+
+def _write_page(pages_dir, page_num, content):
+    (pages_dir / f"page_{page_num:04d}.md").write_text(content)
+
+
+class TestFindSpherePageRanges:
+    def test_specialties_header(self, tmp_path):
+        _write_page(tmp_path, 1, "Forces\n\nSpecialties: Fire, Electricity\n")
+        assert find_sphere_page_ranges(tmp_path) == {"Forces": (1, 11)}
+
+    def test_fallback_pass_finds_mentioned_sphere(self, tmp_path):
+        # No standalone header, so only the fallback pass can match
+        _write_page(tmp_path, 1, "Intro text with no spheres.\n")
+        _write_page(tmp_path, 2, "The Time sphere grants:\n• Time Sense\n")
+        assert find_sphere_page_ranges(tmp_path) == {"Time": (2, 12)}
+
+    def test_no_spheres(self, tmp_path):
+        _write_page(tmp_path, 1, "Nothing to see here.\n")
+        assert find_sphere_page_ranges(tmp_path) == {}
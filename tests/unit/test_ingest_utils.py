@@ -5,7 +5,8 @@ import pytest
 from pathlib import Path
 
 from src.ingest.utils import (
-    slugify, count_words, parse_page_range,
+    slugify, count_words, parse_page_range, list_page_files,
+    MarkdownFileIndex, segment_file_path, enum_or_none,
     write_stage_meta, read_stage_meta,
     write_manifest, read_manifest,
     write_markdown, read_markdown_with_frontmatter,
@@ -61,6 +62,68 @@ class TestParsePageRange:
         assert parse_page_range("1-3,2-4", 10) == [1, 2, 3, 4]
 
 
+class TestListPageFiles:
+    def test_numeric_order(self, tmp_path):
+        for n in (2, 10000, 1, 9999):
+            (tmp_path / f"page_{n:04d}.md").write_text(f"Page {n}")
+        (tmp_path / "page_map.json").write_text("{}")
+        (tmp_path / "notes.md").write_text("")
+
+        pages = list_page_files(tmp_path)
+
+        assert [n for n, _ in pages] == [1, 2, 9999, 10000]
+        assert pages[0][1] == tmp_path / "page_0001.md"
+
+    def test_empty_dir(self, tmp_path):
+        assert list_page_files(tmp_path) == []
+
+    def test_skips_non_numeric_page_names(self, tmp_path):
+        (tmp_path / "page_0003.md").write_text("Page 3")
+        (tmp_path / "page_0004_ocr.md").write_text("Page 4")
+        (tmp_path / "page_notes.md").write_text("Notes")
+        (tmp_path / "page_.md").write_text("")
+
+        pages = list_page_files(tmp_path)
+
+        assert [n for n, _ in pages] == [3, 4]
+
+
+class TestEnumOrNone:
+    def test_lookup(self):
+        from src.ingest.models import Route
+
+        assert enum_or_none(Route, Route.LORE.value) is Route.LORE
+        assert enum_or_none(Route, "no_such_route") is None
+        assert enum_or_none(Route, None) is None
+        assert enum_or_none(Route, "") is None
+
+
+class TestMarkdownFileIndex:
+    def test_exact_and_prefix_lookup(self, tmp_path):
+        for name in ("01_intro.md", "02_rules.md", "notes.txt"):
+            (tmp_path / name).write_text("x")
+        index = MarkdownFileIndex(tmp_path)
+
+        assert index.get("01_intro.md") == tmp_path / "01_intro.md"
+        assert index.get("notes.txt") is None
+        assert index.find_prefix("02_") == tmp_path / "02_rules.md"
+        assert index.find_prefix("03_") is None
+
+    def test_missing_dir(self, tmp_path):
+        index = MarkdownFileIndex(tmp_path / "absent")
+        assert index.find_prefix("01_") is None
+
+    def test_segment_file_prefers_exact_name(self, tmp_path):
+        # A split part of seg_0001 sorts before the segment's own file
+        for name in ("seg_0001_p2_the_bar.md", "seg_0001_the_bar.md"):
+            (tmp_path / name).write_text("x")
+        index = MarkdownFileIndex(tmp_path)
+
+        assert segment_file_path(index, "seg_0001", "The Bar") == tmp_path / "seg_0001_the_bar.md"
+        assert segment_file_path(index, "seg_0001", "Renamed") == tmp_path / "seg_0001_p2_the_bar.md"
+        assert segment_file_path(index, "seg_0002", "The Bar") is None
+
+
 class TestStageMetadata:
     def test_write_and_read(self, tmp_path):
         meta = {"stage": "extract", "status": "complete"}
@@ -80,6 +143,13 @@ class TestManifest:
         result = read_manifest(path)
         assert result == data
 
+    def test_read_non_finite_floats(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"score": float("nan"), "limit": float("inf")}))
+        result = read_manifest(path)
+        assert result["score"] != result["score"]
+        assert result["limit"] == float("inf")
+
 
 class TestMarkdown:
     def test_write_without_frontmatter(self, tmp_path):
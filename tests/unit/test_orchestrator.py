@@ -8,7 +8,7 @@ import pytest
 from pathlib import Path
 
 from src.core.orchestrator import Orchestrator, TurnResult, run_turn
-from src.llm.gateway import MockGateway
+from src.llm.gateway import MockGateway, load_schema
 from src.llm.prompt_registry import PromptRegistry
 from tests.fixtures.state import setup_minimal_game_state
 
@@ -71,6 +71,25 @@ class TestTurnExecution:
         assert result.event_id is not None
         assert len(result.final_text) > 0
 
+    def test_on_text_forwarded_to_narrator(self, populated_store, mock_gateway, prompt_registry):
+        """The on_text callback reaches the gateway only for the narrator call."""
+        def on_text(text):
+            pass
+
+        orchestrator = Orchestrator(
+            state_store=populated_store,
+            llm_gateway=mock_gateway,
+            prompt_registry=prompt_registry,
+            on_text=on_text
+        )
+
+        orchestrator.run_turn("test_campaign", "I look around the room")
+
+        streamed = [c for c in mock_gateway.call_log if c["options"]]
+        assert len(streamed) == 1
+        assert streamed[0]["options"] == {"stream_field": "final_text", "on_text": on_text}
+        assert streamed[0]["schema"] == load_schema("narrator_output")
+
     def test_turn_logged_to_events(self, populated_store, mock_gateway, prompt_registry):
         """Turn is recorded in the events table."""
         orchestrator = Orchestrator(
@@ -0,0 +1,57 @@
+"""
+Tests for PromptRegistry loading and preloading.
+"""
+
+import pytest
+from src.llm.prompt_registry import PromptRegistry
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "narrator_v0.txt").write_text("# schema: narrator_output\nOld narrator")
+    (tmp_path / "narrator_v1.txt").write_text("New narrator")
+    (tmp_path / "planner_v0.txt").write_text("Planner")
+    (tmp_path / "README.md").write_text("not a prompt")
+    return tmp_path
+
+
+class TestPreload:
+    """Tests for PromptRegistry.preload()."""
+
+    def test_loads_every_template(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        assert registry.preload() == 3
+
+    def test_latest_version_served_without_disk_access(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        registry.preload()
+        for path in prompts_dir.glob("*.txt"):
+            path.unlink()
+
+        prompt = registry.get_prompt("narrator")
+        assert prompt.version == "v1"
+        assert prompt.template == "New narrator"
+        assert registry.get_prompt("narrator", version="v0").schema_name == "narrator_output"
+
+    def test_matches_lazy_loading(self, prompts_dir):
+        lazy = PromptRegistry(prompts_dir)
+        preloaded = PromptRegistry(prompts_dir)
+        preloaded.preload()
+
+        for prompt_id in ("narrator", "planner"):
+            assert preloaded.get_prompt(prompt_id) == lazy.get_prompt(prompt_id)
+
+    def test_pinned_version_overrides_latest(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        registry.preload()
+        registry.pin_prompt_version("c1", "narrator", "v0")
+
+        assert registry.get_prompt("narrator", campaign_id="c1").version == "v0"
+
+    def test_clear_cache_drops_preloaded_state(self, prompts_dir):
+        registry = PromptRegistry(prompts_dir)
+        registry.preload()
+        registry.clear_cache()
+        (prompts_dir / "narrator_v1.txt").unlink()
+
+        assert registry.get_prompt("narrator").version == "v0"
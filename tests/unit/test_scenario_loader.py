@@ -0,0 +1,120 @@
+"""Tests for scenario loader listing and summary cache."""
+
+import json
+
+import pytest
+
+from src.setup.scenario_loader import ScenarioLoader
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path_factory, monkeypatch):
+    """Keep the summary cache out of the real user cache directory."""
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+    return path
+
+
+def _write_scenario(directory, stem, name, description=""):
+    path = directory / f"{stem}.yaml"
+    path.write_text(f"id: {stem}\nname: {name}\ndescription: {description}\n")
+    return path
+
+
+class TestListScenarios:
+    """Test scenario listing and the on-disk summary cache."""
+
+    def test_lists_scenarios(self, state_store, tmp_path):
+        _write_scenario(tmp_path, "heist", "The Heist", "Rob the vault")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        scenarios = loader.list_scenarios()
+        assert len(scenarios) == 1
+        assert scenarios[0]["id"] == "heist"
+        assert scenarios[0]["name"] == "The Heist"
+        assert scenarios[0]["description"] == "Rob the vault"
+
+    def test_writes_cache(self, state_store, tmp_path):
+        _write_scenario(tmp_path, "heist", "The Heist")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        loader.list_scenarios()
+        cache = json.loads(loader._scenario_cache_path().read_text())
+        assert cache["heist.yaml"]["name"] == "The Heist"
+
+    def test_cache_outside_scenarios_dir(self, state_store, tmp_path, cache_home):
+        scenarios_dir = tmp_path / "scenarios"
+        scenarios_dir.mkdir()
+        _write_scenario(scenarios_dir, "heist", "The Heist")
+        loader = ScenarioLoader(state_store, scenarios_dir=scenarios_dir)
+        loader.list_scenarios()
+        assert [p.name for p in scenarios_dir.iterdir()] == ["heist.yaml"]
+        assert loader._scenario_cache_path().is_relative_to(cache_home)
+
+    def test_unwritable_cache_dir_skips_caching(self, state_store, tmp_path, monkeypatch):
+        _write_scenario(tmp_path, "heist", "The Heist")
+
+        def fail_cache_dir():
+            raise PermissionError("read-only home")
+
+        monkeypatch.setattr("src.setup.scenario_loader.get_cache_dir", fail_cache_dir)
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        assert loader.list_scenarios()[0]["name"] == "The Heist"
+
+    def test_uses_cache_when_unchanged(self, state_store, tmp_path, monkeypatch):
+        _write_scenario(tmp_path, "heist", "The Heist")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        loader.list_scenarios()
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("scenario should not be re-parsed")
+
+        monkeypatch.setattr("src.setup.scenario_loader.yaml.load", fail_parse)
+        assert loader.list_scenarios()[0]["name"] == "The Heist"
+
+    def test_reparses_changed_file(self, state_store, tmp_path):
+        path = _write_scenario(tmp_path, "heist", "The Heist")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        loader.list_scenarios()
+        path.write_text("id: heist\nname: The Big Heist Remastered\n")
+        assert loader.list_scenarios()[0]["name"] == "The Big Heist Remastered"
+
+    def test_corrupt_cache_ignored(self, state_store, tmp_path):
+        _write_scenario(tmp_path, "heist", "The Heist")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        loader._scenario_cache_path().write_text("{not json")
+        assert loader.list_scenarios()[0]["name"] == "The Heist"
+
+    def test_date_valued_summary_still_listed(self, state_store, tmp_path):
+        _write_scenario(tmp_path, "heist", "The Heist", "2024-01-01")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        scenarios = loader.list_scenarios()
+        assert [s["id"] for s in scenarios] == ["heist"]
+        assert str(scenarios[0]["description"]) == "2024-01-01"
+
+
+class TestLoadScenario:
+    """Test scenario loading results."""
+
+    def test_returns_created_pc(self, state_store, tmp_path):
+        (tmp_path / "solo.yaml").write_text(
+            "id: solo\n"
+            "name: Solo\n"
+            "entities:\n"
+            "  - id: guard\n"
+            "    type: npc\n"
+            "    name: Guard\n"
+            "  - id: player\n"
+            "    type: pc\n"
+            "    name: Kira\n"
+            "    attrs:\n"
+            "      background: Courier\n"
+        )
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        result = loader.load_scenario("solo")
+        assert result["pc"]["id"] == "player"
+        assert result["pc"]["attrs"]["background"] == "Courier"
+        assert result["pc"] == state_store.get_entity("player")
+
+    def test_pc_none_without_player(self, state_store, tmp_path):
+        (tmp_path / "empty.yaml").write_text("id: empty\nname: Empty\n")
+        loader = ScenarioLoader(state_store, scenarios_dir=tmp_path)
+        assert loader.load_scenario("empty")["pc"] is None
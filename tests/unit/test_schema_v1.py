@@ -196,6 +196,31 @@ class TestPackChunkCRUD:
         assert chunks[0]["chunk_type"] == "location"
         assert "neon_dragon" in chunks[0]["entity_refs"]
 
+    def test_insert_chunks_batch(self, state_store):
+        state_store.create_content_pack("tp", "Test", "/path")
+        state_store.insert_pack_chunks([
+            {
+                "chunk_id": "tp:loc:bar",
+                "pack_id": "tp",
+                "file_path": "locations/bar.md",
+                "section_title": "The Bar",
+                "content": "A cyberpunk bar with neon lights.",
+                "chunk_type": "location",
+                "tags": ["location"],
+            },
+            {
+                "chunk_id": "tp:npc:viktor",
+                "pack_id": "tp",
+                "file_path": "npcs/viktor.md",
+                "section_title": "Viktor",
+                "content": "Viktor is a grizzled fixer.",
+            },
+        ])
+        chunks = state_store.get_pack_chunks("tp")
+        assert [c["id"] for c in chunks] == ["tp:loc:bar", "tp:npc:viktor"]
+        assert chunks[1]["chunk_type"] == "general"
+        assert any(c["id"] == "tp:npc:viktor" for c in state_store.search_chunks_fts("fixer"))
+
     def test_fts5_search(self, state_store):
         state_store.create_content_pack("tp", "Test", "/path")
         state_store.insert_pack_chunk(
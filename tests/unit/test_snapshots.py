@@ -332,3 +332,80 @@ class TestCompareOutputs:
         assert "variant_a" in result
         assert "variant_b" in result
         assert result["player_input"] == "I examine Viktor"
+
+
+class TestStreamTurns:
+    """Tests for incremental turn replay."""
+
+    def _append_turn(self, store, turn_no):
+        from src.db.state_store import new_event_id
+
+        store.append_event({
+            "id": new_event_id(),
+            "campaign_id": "test_campaign",
+            "turn_no": turn_no,
+            "player_input": f"Input {turn_no}",
+            "context_packet_json": "{}",
+            "pass_outputs_json": "{}",
+            "engine_events_json": "[]",
+            "state_diff_json": "{}",
+            "final_text": f"Output {turn_no}",
+            "prompt_versions_json": "{}",
+        })
+
+    def test_yields_only_requested_range(self, populated_store):
+        """stream_turns replays just the turns inside the window, in order."""
+        from src.eval.replay import stream_turns
+
+        for turn_no in range(1, 6):
+            self._append_turn(populated_store, turn_no)
+
+        results = list(stream_turns(populated_store, "test_campaign", 2, 4))
+
+        assert [r.turn_no for r in results] == [2, 3, 4]
+        assert results[0].original_input == "Input 2"
+
+    def test_rerun_turns_reports_streamed_results(self, populated_store):
+        """rerun_turns builds its report from the streamed results."""
+        from src.eval.replay import rerun_turns
+
+        self._append_turn(populated_store, 1)
+
+        report = rerun_turns(populated_store, "test_campaign", 1, 1)
+
+        assert report["status"] == "completed"
+        assert report["turns_replayed"] == 1
+        assert report["results"][0]["input"] == "Input 1"
+
+    def test_empty_range(self, populated_store):
+        """An empty window yields nothing and reports an error."""
+        from src.eval.replay import rerun_turns, stream_turns
+
+        assert list(stream_turns(populated_store, "test_campaign", 1, 3)) == []
+        assert rerun_turns(populated_store, "test_campaign", 1, 3)["status"] == "error"
+
+    def test_replays_through_read_only_store(self, populated_store):
+        """Replay works on a read-only store, before any snapshot table exists."""
+        from src.eval.replay import stream_turns
+        from src.eval.snapshots import SnapshotManager
+
+        for turn_no in range(1, 3):
+            self._append_turn(populated_store, turn_no)
+        readonly = StateStore(populated_store.db_path, readonly=True)
+
+        assert SnapshotManager(readonly).get_snapshot_for_turn("test_campaign", 1) is None
+        results = list(stream_turns(readonly, "test_campaign", 1, 2))
+        assert [r.turn_no for r in results] == [1, 2]
+
+
+class TestReadOnlyStore:
+    """Tests for StateStore(readonly=True)."""
+
+    def test_rejects_writes(self, populated_store):
+        import sqlite3
+
+        readonly = StateStore(populated_store.db_path, readonly=True)
+
+        assert readonly.get_campaign("test_campaign") is not None
+        with pytest.raises(sqlite3.OperationalError):
+            readonly.create_campaign("other", "Other")
@@ -8,6 +8,44 @@ import pytest
 from src.db.state_store import StateStore, new_id
 
 
+class TestConnection:
+    """Tests for connection and journal settings."""
+
+    def test_schema_enables_wal(self, state_store):
+        """ensure_schema switches the database file to WAL journaling."""
+        with state_store.connect() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+
+    def test_methods_reuse_thread_connection(self, state_store):
+        """Store methods share one connection per thread until close()."""
+        conn = state_store._connection()
+        assert state_store._connection() is conn
+
+        state_store.create_campaign("c1", "Test")
+        assert state_store._connection() is conn
+
+        state_store.close()
+        assert state_store._connection() is not conn
+        assert state_store.get_campaign("c1")["name"] == "Test"
+
+    def test_threads_get_separate_connections(self, state_store):
+        """Each thread opens its own connection."""
+        import threading
+
+        conns = []
+        thread = threading.Thread(target=lambda: conns.append(state_store._connection()))
+        thread.start()
+        thread.join()
+
+        assert conns[0] is not state_store._connection()
+
+
 class TestCampaignOperations:
     """Tests for campaign CRUD."""
 
@@ -561,3 +599,28 @@ class TestEventOperations:
         })
 
         assert state_store.get_next_turn_no("c1") == 2
+
+    def test_get_last_event_and_count(self, state_store):
+        """Last event and count come back without loading the range."""
+        assert state_store.get_last_event("c1") is None
+        assert state_store.count_events("c1") == 0
+
+        for i in range(1, 4):
+            state_store.append_event({
+                "id": new_id(),
+                "campaign_id": "c1",
+                "turn_no": i,
+                "player_input": f"turn {i}",
+                "context_packet_json": "{}",
+                "pass_outputs_json": "{}",
+                "engine_events_json": "[]",
+                "state_diff_json": "{}",
+                "final_text": f"Turn {i} result",
+                "prompt_versions_json": "{}"
+            })
+
+        last = state_store.get_last_event("c1")
+        assert last["turn_no"] == 3
+        assert last["final_text"] == "Turn 3 result"
+        assert state_store.count_events("c1") == 3
+        assert state_store.count_events("other") == 0
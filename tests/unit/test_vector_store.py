@@ -6,6 +6,7 @@ from src.content.vector_store import (
     NullVectorStore,
     VectorStore,
     create_vector_store,
+    vector_store_path,
 )
 from src.content.chunker import ContentChunk
 
@@ -83,6 +84,18 @@ class TestChromaVectorStore:
         assert len(results) >= 1
         assert results[0]["id"] == "c1"
 
+    def test_add_chunks_in_batches(self):
+        try:
+            from src.content.vector_store import ChromaVectorStore
+            store = ChromaVectorStore(batch_size=2)
+        except ImportError:
+            pytest.skip("chromadb not installed")
+
+        chunks = [_make_chunk(f"c{i}", f"Chunk number {i}") for i in range(5)]
+        assert store.add_chunks(chunks, "batched") == 5
+        results = store.query("Chunk number", "batched", n_results=10)
+        assert {r["id"] for r in results} == {c.id for c in chunks}
+
     def test_query_nonexistent_collection(self, chroma_store):
         results = chroma_store.query("test", "no_such_collection")
         assert results == []
@@ -93,3 +106,50 @@ class TestChromaVectorStore:
         chroma_store.delete_collection("to_delete")
         results = chroma_store.query("test", "to_delete")
         assert results == []
+
+
+class TestVectorStorePath:
+    """Test the per-database vector index location."""
+
+    def test_sits_next_to_database(self, tmp_path):
+        assert vector_store_path(tmp_path / "game.db") == str(tmp_path / "game.vectors")
+
+    def test_memory_database_has_no_path(self):
+        assert vector_store_path(":memory:") is None
+
+
+class TestChromaInitFailure:
+    """ChromaDB that is installed but fails to load degrades to no-op."""
+
+    @pytest.fixture
+    def broken_chromadb(self, monkeypatch):
+        import importlib.util
+        import sys
+
+        class _FailingFinder:
+            def find_spec(self, name, path=None, target=None):
+                if name == "chromadb":
+                    return importlib.util.spec_from_loader(name, _FailingLoader())
+                return None
+
+        class _FailingLoader:
+            def create_module(self, spec):
+                return None
+
+            def exec_module(self, module):
+                raise RuntimeError("unsupported version of sqlite3")
+
+        monkeypatch.delitem(sys.modules, "chromadb", raising=False)
+        monkeypatch.setattr(sys, "meta_path", [_FailingFinder(), *sys.meta_path])
+
+    def test_falls_back_to_null_behaviour(self, broken_chromadb, caplog):
+        store = create_vector_store()
+        chunks = [_make_chunk("c1", "Hello world")]
+
+        with caplog.at_level("WARNING", logger="src.content.vector_store"):
+            assert store.add_chunks(chunks, "test") == 0
+            assert store.query("hello", "test") == []
+            store.delete_collection("test")
+
+        warnings = [r for r in caplog.records if "ChromaDB init failed" in r.message]
+        assert len(warnings) == 1